@@ -0,0 +1,80 @@
+"""Benchmark `load_many` with the thread executor for different numbers of threads.
+
+On free-threaded Python builds (``python3.13t``), the threads validate chunks on
+multiple cores at the same time. With the GIL, the time stays about the same
+as processing serially, so it shows the overhead of splitting and merging chunks.
+
+Usage::
+
+    python benchmarks/thread_scaling.py --items 200000 --threads 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalyst import (  # noqa: E402
+    Catalyst, StringField, IntegerField, FloatField, ListField, NestedField,
+)
+from catalyst.parallel import shutdown_pools  # noqa: E402
+
+
+class ItemCatalyst(Catalyst):
+    name = StringField(min_length=1, max_length=16)
+    price = FloatField(minimum=0)
+    count = IntegerField(minimum=0)
+
+
+class OrderCatalyst(Catalyst):
+    number = IntegerField(minimum=0, load_required=True)
+    customer = StringField(max_length=32)
+    items = NestedField(ItemCatalyst(), many=True)
+    tags = ListField(StringField(max_length=8))
+
+
+def make_orders(n):
+    return [{
+        'number': str(i),
+        'customer': f'customer{i % 100}',
+        'items': [{'name': f'item{j}', 'price': '9.5', 'count': j} for j in range(3)],
+        'tags': ['a', 'b'],
+    } for i in range(n)]
+
+
+def measure(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--compiled', action='store_true')
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if is_gil_enabled else "disabled"}, '
+          f'{os.cpu_count()} CPUs, {args.items} items')
+
+    catalyst = OrderCatalyst(compiled=args.compiled)
+    data = make_orders(args.items)
+    serial = measure(lambda: catalyst.load_many(data), args.repeat)
+    print(f'{"serial":>10}: {serial:.3f}s')
+    for threads in args.threads:
+        seconds = measure(
+            lambda: catalyst.load_many(data, executor='thread', workers=threads), args.repeat)
+        print(f'{threads:>3} threads: {seconds:.3f}s, speedup {serial / seconds:.2f}x')
+    shutdown_pools()
+
+
+if __name__ == '__main__':
+    main()
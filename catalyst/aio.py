@@ -0,0 +1,303 @@
+"""Dump objects whose field values are awaitable, such as the results of async
+methods called by `CallableField`, by resolving the awaitables concurrently.
+"""
+
+import asyncio
+from functools import partial
+from inspect import isawaitable
+from itertools import islice
+from typing import Any, Iterable, Optional, Union
+
+from .base import CatalystABC
+from .compiler import distribute_field_error, distribute_group_error, is_default_nested_field
+from .exceptions import ValidationError
+from .utils import missing
+
+
+# the default number of awaitables awaited at the same time in each call
+CONCURRENCY = 64
+
+# the number of objects dumped concurrently by `dump_many` and nested fields
+CHUNK_SIZE = 64
+
+Concurrency = Union[int, asyncio.Semaphore, None]
+
+
+def make_semaphore(concurrency: Concurrency) -> asyncio.Semaphore:
+    """Create the semaphore limiting the awaitables awaited at the same time,
+    a semaphore is returned as it is, so that it can be shared by calls.
+    """
+    if concurrency is None:
+        concurrency = CONCURRENCY
+    if isinstance(concurrency, int):
+        if concurrency < 1:
+            raise ValueError('Argument "concurrency" must be a positive integer.')
+        return asyncio.Semaphore(concurrency)
+    return concurrency
+
+
+async def resolve(value, semaphore: asyncio.Semaphore):
+    """Await `value` within the semaphore until the result is not awaitable."""
+    while isawaitable(value):
+        async with semaphore:
+            value = await value
+    return value
+
+
+async def gather(awaitables: Iterable, return_exceptions: bool = False) -> list:
+    """Run the awaitables concurrently like `asyncio.gather`, but cancel the
+    others if one of them raises error and `return_exceptions` is False.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    if not tasks:
+        return []
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _is_async_nested_field(field) -> bool:
+    """Whether the catalyst of `NestedField` can be dumped by `AsyncDumper`."""
+    if not is_default_nested_field(field):
+        return False
+    catalyst = field.catalyst
+    return hasattr(catalyst, '_get_codec') \
+        and catalyst._is_default_method('dump_many' if field.many else 'dump')
+
+
+class AsyncDumper:
+    """Dump one or many objects like `Catalyst.dump`, but await the values got
+    from objects and the values returned by fields if they are awaitable.
+
+    The awaitables of all fields and objects are awaited concurrently, limited
+    by a semaphore, and the results are assembled in the order of fields. Many
+    objects are dumped in chunks of `CHUNK_SIZE`, so the tasks are bounded.
+    The catalysts of `NestedField` are dumped in the same way. Awaitables inside
+    other values, such as the items of `ListField`, are not resolved.
+    The pre and post processes are called as usual.
+    """
+
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+        self.get_values, self.partial_fields, self.partial_groups = \
+            catalyst._make_partials('dump')
+        # the nested catalysts which can be dumped asynchronously
+        self.nested = tuple(
+            field if _is_async_nested_field(field) else None
+            for field, *_ in self.partial_fields)
+        self.process_aliases = catalyst.process_aliases
+        self.except_exception = catalyst.except_exception
+        self.all_errors = catalyst.all_errors
+        self.result_class = catalyst.dump_result_class
+        self.hooks = {name: self._get_hooks(name) for name in ('dump', 'dump_many')}
+        self.dump_overridden = not catalyst._is_default_method('dump')
+
+    def _get_hooks(self, method_name: str) -> tuple:
+        """Get the pre and post processes which are overridden, or None."""
+        catalyst = self.catalyst
+        pre_process = post_process = None
+        if not catalyst._is_default_method(f'pre_{method_name}'):
+            pre_process = getattr(catalyst, f'pre_{method_name}')
+        if not catalyst._is_default_method(f'post_{method_name}'):
+            post_process = catalyst._modify_processer_parameters(
+                getattr(catalyst, f'post_{method_name}'))
+        return pre_process, post_process
+
+    async def dump(
+            self, data: Any, raise_error: Optional[bool] = None,
+            concurrency: Concurrency = None):
+        """Dump one object, the arguments are the same as `Catalyst.dump_async`."""
+        return await self._process(False, data, raise_error, make_semaphore(concurrency))
+
+    async def dump_many(
+            self, data: Iterable, raise_error: Optional[bool] = None,
+            concurrency: Concurrency = None):
+        """Dump multiple objects, which are processed concurrently."""
+        return await self._process(True, data, raise_error, make_semaphore(concurrency))
+
+    async def _process(
+            self, many: bool, data, raise_error: Optional[bool],
+            semaphore: asyncio.Semaphore):
+        """Do the pre, main and post processes, which is the same as
+        `Catalyst._make_processor` except that the main process is awaited.
+        """
+        if raise_error is None:
+            raise_error = self.catalyst.raise_error
+        method_name = 'dump_many' if many else 'dump'
+        pre_process, post_process = self.hooks[method_name]
+        process_name = f'pre_{method_name}'
+        try:
+            valid_data = data if pre_process is None else pre_process(data)
+
+            process_name = method_name
+            if many:
+                valid_data, errors, invalid_data = await self._process_many(
+                    valid_data, semaphore)
+            else:
+                valid_data, errors, invalid_data = await self._process_one(
+                    valid_data, semaphore)
+
+            if not errors and post_process is not None:
+                process_name = f'post_{method_name}'
+                valid_data = post_process(valid_data, original_data=data)
+        except self.except_exception as e:
+            key = self.process_aliases.get(process_name, process_name)
+            errors = {key: e}
+            invalid_data = data
+            valid_data = [] if many else {}
+
+        result = self.result_class(valid_data, errors, invalid_data)
+        if errors and raise_error:
+            raise ValidationError(msg=result.format_errors(), detail=result)
+        return result
+
+    async def _process_many(self, data: Iterable, semaphore: asyncio.Semaphore):
+        """Dump the objects of each chunk concurrently, the result is the same as
+        `Catalyst._process_many`, though the objects after the first invalid
+        one in the same chunk are also dumped if `all_errors` is False.
+        """
+        if self.dump_overridden:
+            process_one = self._dump_by_method
+        else:
+            process_one = partial(self._process, False)
+
+        valid_data, errors, invalid_data = [], {}, {}
+        items = iter(data)
+        i = 0
+        while True:
+            chunk = list(islice(items, CHUNK_SIZE))
+            if not chunk:
+                break
+            results = await gather(process_one(item, False, semaphore) for item in chunk)
+            for result in results:
+                valid_data.append(result.valid_data)
+                if not result.is_valid:
+                    errors[i] = result.errors
+                    invalid_data[i] = result.invalid_data
+                    if not self.all_errors:
+                        return valid_data, errors, invalid_data
+                i += 1
+        return valid_data, errors, invalid_data
+
+    async def _dump_by_method(self, data, raise_error: bool, semaphore: asyncio.Semaphore):
+        """Call `dump` overridden by the catalyst, and await the values in result."""
+        result = self.catalyst.dump(data, raise_error=raise_error)
+        valid_data = result.valid_data
+        if isinstance(valid_data, dict):
+            keys = [key for key, value in valid_data.items() if isawaitable(value)]
+            values = await gather(resolve(valid_data[key], semaphore) for key in keys)
+            valid_data.update(zip(keys, values))
+        return result
+
+    async def _dump_nested(self, field, value, semaphore: asyncio.Semaphore):
+        """Dump the value of `NestedField` by the dumper of its catalyst."""
+        dumper = field.catalyst._get_codec(AsyncDumper, None, None)
+        result = await dumper._process(field.many, value, True, semaphore)
+        return result.valid_data
+
+    async def _process_one(self, data, semaphore: asyncio.Semaphore):
+        """Dump one object like `Catalyst._process_one`. The awaitable values are
+        resolved before being passed to fields, and the awaitable results of fields
+        are resolved before field groups are processed.
+        """
+        values, get_errors = self.get_values(data)
+        all_errors, except_exception = self.all_errors, self.except_exception
+
+        # resolve the awaitable values got from the object
+        indexes = [i for i, value in enumerate(values) if isawaitable(value)]
+        if indexes:
+            values = list(values)
+            resolved = await gather(
+                (resolve(values[i], semaphore) for i in indexes), return_exceptions=True)
+            for i, value in zip(indexes, resolved):
+                if isinstance(value, BaseException):
+                    # raise the error when processing the field
+                    get_errors = {} if get_errors is None else get_errors
+                    get_errors[self.partial_fields[i].source] = value
+                    value = missing
+                values[i] = value
+
+        valid_data, errors, invalid_data = {}, {}, {}
+        # the fields whose results are awaitable, with the values passed to them
+        # and the awaitables which resolve the results
+        pending = []
+        for (field, source, target, required, default, field_method), nested, value in zip(
+                self.partial_fields, self.nested, values):
+            try:
+                if value is missing:
+                    if get_errors is not None and source in get_errors:
+                        raise get_errors[source]
+                    value = default() if callable(default) else default
+
+                if value is missing:
+                    result = missing
+                elif nested is not None:
+                    # the same as `NestedField.dump`, except that the nested dumping
+                    # doesn't hold the semaphore, which is acquired by the awaitables
+                    # of the nested objects
+                    nested.validate_dump(value)
+                    if nested.is_none(value):
+                        result = nested.dump_none
+                    else:
+                        result = self._dump_nested(nested, value, semaphore)
+                        pending.append((field, source, target, required, value, result))
+                else:
+                    result = field_method(value)
+                    if isawaitable(result):
+                        pending.append((
+                            field, source, target, required, value,
+                            resolve(result, semaphore)))
+
+                if result is missing:
+                    if required:
+                        raise field.error('required')
+                else:
+                    # keep the position of the field in result
+                    valid_data[target] = result
+            except except_exception as e:
+                distribute_field_error(
+                    e, source, target, value, valid_data, errors, invalid_data)
+                if not all_errors:
+                    break
+
+        if pending:
+            resolved = await gather(
+                (awaitable for *_, awaitable in pending), return_exceptions=True)
+            for (field, source, target, required, value, _), result in zip(
+                    pending, resolved):
+                if result is missing and required:
+                    result = field.error('required')
+                if not isinstance(result, BaseException):
+                    if result is missing:
+                        del valid_data[target]
+                    else:
+                        valid_data[target] = result
+                    continue
+                if not isinstance(result, except_exception):
+                    raise result
+                placeholder = valid_data[target]
+                # only the first error is collected if `all_errors` is False
+                if all_errors or not errors:
+                    # the valid data of nested objects replace the placeholder
+                    # in place, which keeps the order of fields
+                    distribute_field_error(
+                        result, source, target, value, valid_data, errors, invalid_data)
+                if valid_data[target] is placeholder:
+                    del valid_data[target]
+
+        # field groups depend on fields, if error occurs, do not continue
+        if errors:
+            return valid_data, errors, invalid_data
+
+        for group_method, error_key, source_target_pairs in self.partial_groups:
+            try:
+                valid_data = group_method(valid_data, original_data=data)
+            except except_exception as e:
+                distribute_group_error(
+                    e, error_key, source_target_pairs, valid_data, errors, invalid_data)
+                if not all_errors:
+                    break
+        return valid_data, errors, invalid_data
@@ -0,0 +1,77 @@
+"""Size-bounded cache for sharing the plans built by catalysts."""
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """Thread-safe mapping which discards the least recently used items
+    when the number of items exceeds `maxsize`, and counts hits, misses and
+    evictions for sizing the cache.
+
+    :param maxsize: The maximum number of items, `None` means unlimited.
+    """
+    def __init__(self, maxsize: int = 128):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('Argument "maxsize" must be a non-negative integer or None.')
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key: Hashable):
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the item and mark it as recently used, count hits and misses."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Set the item, and evict the least recently used items if it's full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get the item, or create it by `factory` and set it if it's missing.
+        The factory is called without holding the lock, since it may also use the cache.
+        """
+        value = self.get(key, _not_found)
+        if value is _not_found:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def clear(self):
+        """Remove all items and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_not_found = object()
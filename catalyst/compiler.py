@@ -0,0 +1,359 @@
+"""Compile processing plans of :class:`.Catalyst` into specialized Python functions.
+
+The interpreted process loops over a tuple of partial arguments for every object,
+the compiled process is generated once per catalyst, which unrolls the loop and
+bakes the partial arguments into the function as constants.
+"""
+
+import re
+import linecache
+from itertools import count
+from collections import namedtuple
+from typing import Any, Callable, List, Optional
+
+from .exceptions import ValidationError
+from .fields import Field, NestedField
+from .utils import missing, no_processing, BaseResult
+
+
+ProcessPlan = namedtuple('ProcessPlan', [
+    'get_values', 'partial_fields', 'partial_groups',
+    'all_errors', 'except_exception', 'process_aliases'])
+
+# Python limits the number of statically nested blocks,
+# each inlined catalyst takes up to five blocks.
+MAX_INLINE_DEPTH = 3
+
+_counter = count()
+
+
+def distribute_field_error(error, source, target, value, valid_data, errors, invalid_data):
+    """Collect error of a field, distribute nested data in `BaseResult`."""
+    if isinstance(error, ValidationError) and isinstance(error.detail, BaseResult):
+        detail: BaseResult = error.detail
+        valid_data[target] = detail.valid_data
+        errors[source] = detail.errors
+        invalid_data[source] = detail.invalid_data
+    else:
+        errors[source] = error
+        if value is not missing:
+            invalid_data[source] = value
+
+
+def distribute_group_error(
+        error, error_key, source_target_pairs, valid_data, errors, invalid_data):
+    """Collect error of a field group, distribute nested data in `BaseResult`."""
+    if isinstance(error, ValidationError) and isinstance(error.detail, BaseResult):
+        detail: BaseResult = error.detail
+        try:
+            valid_data.update(detail.valid_data)
+            errors.update(detail.errors)
+            invalid_data.update(detail.invalid_data)
+        except (ValueError, TypeError):
+            errors[error_key] = detail.format_errors()
+    else:
+        errors[error_key] = error
+        for source, target in source_target_pairs:
+            if target in valid_data:
+                invalid_data[source] = valid_data.pop(target)
+
+
+def is_default_nested_field(field) -> bool:
+    """Whether `field` is a `NestedField` whose methods are not customized,
+    except fused processors, so that the nested catalyst can be called directly.
+    """
+    if not isinstance(field, NestedField):
+        return False
+    fused_processors = field.__dict__.get('_fused_processors', ())
+    for attr in ('dump', 'load', 'format', 'parse'):
+        if getattr(type(field), attr) is not getattr(NestedField, attr):
+            return False
+        method = field.__dict__.get(attr)
+        if method is not None and not any(method is p for p in fused_processors):
+            return False
+    return True
+
+
+class CodeBuilder:
+    """Collect lines of source code and constants referenced by the code."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace = {}
+        self._names = {}
+        self._indent = 0
+
+    def line(self, code: str):
+        self.lines.append('    ' * self._indent + code)
+
+    def indent(self, delta: int = 1):
+        self._indent += delta
+
+    def dedent(self, delta: int = 1):
+        self._indent -= delta
+
+    def const(self, obj: Any, prefix: str = 'c') -> str:
+        """Return the name of a constant, strings and `None` are inlined as literals."""
+        if obj is None or type(obj) in (str, int, bool):
+            return repr(obj)
+        key = id(obj)
+        if key not in self._names:
+            name = f'{prefix}{len(self._names)}'
+            self._names[key] = name
+            self.namespace[name] = obj
+        return self._names[key]
+
+    def build(self, func_name: str, args: str, filename: str) -> Callable:
+        """Compile the collected lines into a function. Constants are bound as
+        default values of keyword-only arguments for faster access."""
+        consts = ', '.join(f'{name}={name}' for name in self.namespace)
+        signature = f'{args}, *, {consts}' if consts else args
+        source = '\n'.join([f'def {func_name}({signature}):'] + self.lines) + '\n'
+        code = compile(source, filename, 'exec')
+        namespace = dict(self.namespace)
+        exec(code, namespace)  # pylint: disable=exec-used
+        # make source code available in tracebacks
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        func = namespace[func_name]
+        func.__source__ = source
+        return func
+
+
+class ProcessEmitter:
+    """Emit code of processing one object according to `ProcessPlan`.
+
+    The code of fields must be placed in a loop, and `break` is used to stop processing
+    when `all_errors` is false. Variables of each object are suffixed by a scope number,
+    so that nested catalysts can be inlined into the code of the parent catalyst.
+
+    :param name: "dump" or "load".
+    :param builder: The builder to collect code.
+    """
+
+    def __init__(self, name: str, builder: CodeBuilder):
+        self.name = name
+        self.builder = builder
+        self._scopes = count(1)
+        self._inlined = []
+
+    @staticmethod
+    def results(scope) -> tuple:
+        return f'valid_data{scope}', f'errors{scope}', f'invalid_data{scope}'
+
+    def get_nested_plan(self, field) -> Optional[ProcessPlan]:
+        """Return plan of the nested catalyst if `field` can be inlined."""
+        if not is_default_nested_field(field) or len(self._inlined) >= MAX_INLINE_DEPTH:
+            return None
+        catalyst = field.catalyst
+        # avoid infinite recursion
+        if any(catalyst is c for c in self._inlined):
+            return None
+        get_plan = getattr(catalyst, '_get_inline_plan', None)
+        if get_plan is None:
+            return None
+        return get_plan(self.name, field.many)
+
+    def emit_fields(self, plan: ProcessPlan, scope=''):
+        line, const, builder = self.builder.line, self.builder.const, self.builder
+        values, get_errors, value = f'values{scope}', f'get_errors{scope}', f'value{scope}'
+        valid_data, errors, invalid_data = self.results(scope)
+        distribute = const(distribute_field_error, 'distribute_field_error')
+        exc = const(plan.except_exception, 'except_exception')
+
+        for index, partial_field in enumerate(plan.partial_fields):
+            field, source, target, required, default, field_method = partial_field
+            source_, target_ = const(source), const(target)
+            line(f'# field {source!r}')
+            line(f'{value} = {values}[{index}]')
+            line('try:')
+            builder.indent()
+            line(f'if {value} is missing:')
+            # raise the error occurred when getting value
+            line(f'    if {get_errors} is not None and {source_} in {get_errors}:')
+            line(f'        raise {get_errors}[{source_}]')
+            if default is not missing:
+                if callable(default):
+                    line(f'    {value} = {const(default, "default")}()')
+                else:
+                    line(f'    {value} = {const(default, "default")}')
+            if required:
+                line(f'if {value} is missing:')
+                line(f'    raise {const(field, "field")}.error("required")')
+                line('else:')
+            else:
+                line(f'if {value} is not missing:')
+            builder.indent()
+            nested_plan = self.get_nested_plan(field)
+            if nested_plan is None:
+                line(f'{value} = {const(field_method, "method")}({value})')
+                self.emit_assign(partial_field, scope)
+            else:
+                self.emit_nested_field(partial_field, nested_plan, plan.all_errors, scope)
+            builder.dedent(2)
+            line(f'except {exc} as e{scope}:')
+            line(f'    {distribute}(e{scope}, {source_}, {target_}, {value}, '
+                 f'{valid_data}, {errors}, {invalid_data})')
+            if not plan.all_errors:
+                line('    break')
+
+    def emit_assign(self, partial_field: tuple, scope):
+        """Emit code to set value to result, the value might be missing
+        after processed by field method."""
+        line, const = self.builder.line, self.builder.const
+        field, _, target, required = partial_field[:4]
+        value, valid_data = f'value{scope}', f'valid_data{scope}'
+        if required:
+            line(f'if {value} is missing:')
+            line(f'    raise {const(field, "field")}.error("required")')
+            line(f'{valid_data}[{const(target)}] = {value}')
+        else:
+            line(f'if {value} is not missing:')
+            line(f'    {valid_data}[{const(target)}] = {value}')
+
+    def emit_nested_field(
+            self, partial_field: tuple, nested_plan: ProcessPlan, all_errors: bool, scope):
+        """Emit code which works the same as `NestedField.dump` or `NestedField.load`,
+        but processes the nested data inline without creating result object,
+        and distributes nested errors without raising `ValidationError`."""
+        line, const, builder = self.builder.line, self.builder.const, self.builder
+        field: NestedField = partial_field.field
+        source_, target_ = const(partial_field.source), const(partial_field.target)
+        value = f'value{scope}'
+        valid_data, errors, invalid_data = self.results(scope)
+        field_ = const(field, 'field')
+
+        if self.name == 'dump' and field.validate_dump is not no_processing:
+            line(f'{field_}.validate_dump({value})')
+        line(f'if {field_}.is_none({value}):')
+        builder.indent()
+        line(f'{value} = {field_}.{self.name}_none')
+        if self.name == 'load':
+            line(f'if {value} is not missing:')
+            line(f'    {field_}.validate_load({value})')
+        self.emit_assign(partial_field, scope)
+        builder.dedent()
+        line('else:')
+        builder.indent()
+
+        inner = next(self._scopes)
+        self._inlined.append(field.catalyst)
+        if field.many:
+            self.emit_many(nested_plan, value, inner)
+        else:
+            self.emit_object(nested_plan, value, inner)
+        self._inlined.pop()
+
+        nested_valid_data, nested_errors, nested_invalid_data = self.results(inner)
+        line(f'if {nested_errors}:')
+        line(f'    {valid_data}[{target_}] = {nested_valid_data}')
+        line(f'    {errors}[{source_}] = {nested_errors}')
+        line(f'    {invalid_data}[{source_}] = {nested_invalid_data}')
+        if not all_errors:
+            line('    break')
+        line('else:')
+        if self.name == 'load':
+            # the nested data is not null, only validators need to be called
+            if getattr(field.validate_load, '__func__', None) is Field.validate:
+                line(f'    if {field_}.validators:')
+                line(f'        {field_}.validate_load({nested_valid_data})')
+            else:
+                line(f'    {field_}.validate_load({nested_valid_data})')
+        line(f'    {valid_data}[{target_}] = {nested_valid_data}')
+        builder.dedent()
+
+    def emit_groups(self, plan: ProcessPlan, scope=''):
+        line, const = self.builder.line, self.builder.const
+        data = f'data{scope}'
+        valid_data, errors, invalid_data = self.results(scope)
+        distribute = const(distribute_group_error, 'distribute_group_error')
+        exc = const(plan.except_exception, 'except_exception')
+
+        # field groups depend on fields, if error occurs, do not continue
+        line(f'if {errors}:')
+        line('    break')
+        for group_method, error_key, source_target_pairs in plan.partial_groups:
+            line('try:')
+            line(f'    {valid_data} = {const(group_method, "group")}('
+                 f'{valid_data}, original_data={data})')
+            line(f'except {exc} as e{scope}:')
+            line(f'    {distribute}(e{scope}, {const(error_key)}, '
+                 f'{const(tuple(source_target_pairs))}, {valid_data}, {errors}, {invalid_data})')
+            if not plan.all_errors:
+                line('    break')
+
+    def emit_body(self, plan: ProcessPlan, scope=''):
+        """Emit code which processes fields and field groups of `data{scope}`."""
+        line, builder = self.builder.line, self.builder
+        line(f'values{scope}, get_errors{scope} = '
+             f'{builder.const(plan.get_values, "get_values")}(data{scope})')
+        line('while True:')
+        builder.indent()
+        self.emit_fields(plan, scope)
+        if plan.partial_groups:
+            self.emit_groups(plan, scope)
+        line('break')
+        builder.dedent()
+
+    def emit_handler(self, plan: ProcessPlan, process_name: str, empty: str, scope):
+        """Emit the except clause which works the same as the error handling
+        of `integrated_process` in `Catalyst._make_processor`."""
+        line, const = self.builder.line, self.builder.const
+        aliases, name = const(plan.process_aliases, 'process_aliases'), const(process_name)
+        line(f'except {const(plan.except_exception, "except_exception")} as e{scope}:')
+        line(f'    {", ".join(self.results(scope))} = '
+             f'{empty}, {{{aliases}.get({name}, {name}): e{scope}}}, data{scope}')
+
+    def emit_object(self, plan: ProcessPlan, source: str, scope):
+        """Emit code which works the same as `Catalyst.dump` or `Catalyst.load`
+        without pre and post processes."""
+        line, builder = self.builder.line, self.builder
+        line(f'data{scope} = {source}')
+        line(f'{", ".join(self.results(scope))} = {{}}, {{}}, {{}}')
+        line('try:')
+        builder.indent()
+        self.emit_body(plan, scope)
+        builder.dedent()
+        self.emit_handler(plan, self.name, '{}', scope)
+
+    def emit_many(self, plan: ProcessPlan, source: str, scope):
+        """Emit code which works the same as `Catalyst.dump_many` or `Catalyst.load_many`
+        without pre and post processes."""
+        line, builder = self.builder.line, self.builder
+        valid_data, errors, invalid_data = self.results(scope)
+        index, item = f'index{scope}', f'item{scope}'
+        line(f'data{scope} = {source}')
+        line(f'{valid_data}, {errors}, {invalid_data} = [], {{}}, {{}}')
+        line('try:')
+        builder.indent()
+        line(f'for {index}, {item} in enumerate(data{scope}):')
+        builder.indent()
+        inner = next(self._scopes)
+        self.emit_object(plan, item, inner)
+        item_valid_data, item_errors, item_invalid_data = self.results(inner)
+        line(f'{valid_data}.append({item_valid_data})')
+        line(f'if {item_errors}:')
+        line(f'    {errors}[{index}] = {item_errors}')
+        line(f'    {invalid_data}[{index}] = {item_invalid_data}')
+        if not plan.all_errors:
+            line('    break')
+        builder.dedent(2)
+        self.emit_handler(plan, self.name + '_many', '[]', scope)
+
+
+def compile_process_one(name: str, plan: ProcessPlan, qualname: str = 'Catalyst') -> Callable:
+    """Generate a function which works the same as `Catalyst._process_one` with
+    partial arguments of `plan`, but takes only `data` as argument.
+    Nested catalysts are inlined if their processes are not customized.
+    """
+    builder = CodeBuilder()
+    builder.namespace['missing'] = missing
+    emitter = ProcessEmitter(name, builder)
+
+    builder.indent()
+    builder.line('valid_data, errors, invalid_data = {}, {}, {}')
+    emitter.emit_body(plan)
+    builder.line('return valid_data, errors, invalid_data')
+
+    func_name = re.sub(r'\W', '_', f'{name}_{qualname}')
+    filename = f'<catalyst-compiled {name} {qualname} #{next(_counter)}>'
+    return builder.build(func_name, 'data', filename)
@@ -1,26 +1,46 @@
 """Catalyst class and its metaclass."""
 
+import copy
 import inspect
 from collections import namedtuple
-from typing import Iterable, Callable, Any, Mapping
-from functools import wraps, partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Callable, Any, Mapping, Optional, Tuple
+from functools import wraps, partial, lru_cache
 
 from .base import CatalystABC
-from .fields import BaseField, FieldDict, Field
+from .cache import LRUCache
+from .fields import BaseField, FieldDict, Field, NestedField
 from .groups import FieldGroup
-from .exceptions import ValidationError, ExceptionType
+from .exceptions import ValidationError, ExceptionType, FrozenError
+from .formats import FormatMixin
+from .compiler import (
+    ProcessPlan, compile_process_one, distribute_field_error, distribute_group_error,
+)
 from .utils import (
-    missing, assign_attr_or_item_getter, assign_item_getter,
-    LoadResult, DumpResult, BaseResult, no_processing,
+    missing, assign_attr_or_item_getter, assign_item_getter, ValuesGetter, RowGetter,
+    column_names,
+    LoadResult, DumpResult, no_processing,
     bind_attrs, bind_not_ellipsis_attrs,
 )
 
+if TYPE_CHECKING:
+    # the modules of executors are imported when they are used
+    from .aio import Concurrency
+
 
 # type hints
 PartialFields = namedtuple('PartialFields', [
     'field', 'source', 'target', 'required', 'default', 'field_method'])
 PartialGroups = namedtuple('PartialGroups', [
     'group_method', 'error_key', 'source_target_pairs'])
+CatalystPlan = namedtuple('CatalystPlan', [
+    'dump_fields', 'load_fields', 'dump_process', 'load_process'])
+
+
+@lru_cache(maxsize=1024)
+def _accepts_original_data(func: Callable) -> bool:
+    """Whether `original_data` is one of the parameters of the processer function."""
+    return 'original_data' in inspect.signature(func).parameters
 
 
 def _override_fields(fields: FieldDict, attrs: dict):
@@ -77,6 +97,28 @@ def _set_fields(cls_or_obj, fields: FieldDict):
     cls_or_obj.fields = fields
 
 
+@lru_cache(maxsize=1024)
+def _default_methods(cls: type) -> frozenset:
+    """The names of methods of `Catalyst` which are not overridden by the class."""
+    return frozenset(
+        name for name, method in vars(Catalyst).items()
+        if callable(method) and getattr(cls, name, None) is method)
+
+
+def _parse_paths(paths: Iterable[str]) -> dict:
+    """Parse dotted paths to a dict, which key is the first name of the path,
+    and value is the set of rest paths, or `None` which means the whole field.
+    """
+    tree = {}
+    for path in paths:
+        name, _, rest = path.partition('.')
+        if not rest:
+            tree[name] = None
+        elif tree.get(name, ()) is not None:
+            tree.setdefault(name, set()).add(rest)
+    return tree
+
+
 class CatalystMeta(type):
     """Metaclass for `Catalyst` class. Binds fields to `fields` attribute."""
 
@@ -89,13 +131,13 @@ class CatalystMeta(type):
         return new_cls
 
 
-class Catalyst(CatalystABC, metaclass=CatalystMeta):
+class Catalyst(FormatMixin, CatalystABC, metaclass=CatalystMeta):
     """Base Catalyst class for converting complex datatypes to and from
     native Python datatypes.
 
     Some instantiation params can set default values by class variables.
     The available params are `schema`, `raise_error`, `all_errors`,
-    `except_exception`, `process_aliases`, `DumpResult` and `LoadResult`.
+    `except_exception`, `process_aliases`, `compiled`, `DumpResult` and `LoadResult`.
 
     :param schema: A dict or instance or class which contains fields. This
         is a convenient way to avoid name clashes when fields are Python
@@ -135,6 +177,9 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
 
             used_fields = original_fields & include - exclude
 
+    :param compiled: Whether to generate a specialized function for dumping and
+        loading one object, which unrolls fields and bakes field options into code.
+        The result is the same as that of interpreted process, but faster.
     :param dump_include: The fields to include in dump fields.
     :param dump_exclude: The fields to exclude from dump fields.
     :param load_include: The fields to include in load fields.
@@ -145,6 +190,13 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
     all_errors = True
     except_exception: ExceptionType = Exception
     process_aliases = {}
+    compiled = False
+    # whether the catalyst can be changed, see `_freeze`
+    _frozen = False
+    # the plans shared by instances with the same class and options, `None` to disable
+    plan_cache: Optional[LRUCache] = LRUCache(maxsize=256)
+    # the number of catalysts projected by `only` and `exclude` to keep for each instance
+    projection_cache_size = 128
 
     dump_required = True
     load_required = False
@@ -180,7 +232,8 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             dump_include: Iterable[str] = None,
             dump_exclude: Iterable[str] = None,
             load_include: Iterable[str] = None,
-            load_exclude: Iterable[str] = None):
+            load_exclude: Iterable[str] = None,
+            compiled: bool = None):
         bind_attrs(
             self,
             schema=schema,
@@ -188,6 +241,7 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             all_errors=all_errors,
             except_exception=except_exception,
             process_aliases=process_aliases,
+            compiled=compiled,
             dump_required=dump_required,
             load_required=load_required,
         )
@@ -212,38 +266,110 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
                 _get_fields_from_instance(fields, schema)
             _set_fields(self, fields)
 
-        # include fields
-        if include is None:
-            include = self.fields.keys()
-        if dump_include is None:
-            dump_include = include
-        if load_include is None:
-            load_include = include
+        # normalize the options of filtering fields, which are parts of the plan key
+        include = None if include is None else tuple(include)
+        dump_include = include if dump_include is None else tuple(dump_include)
+        load_include = include if load_include is None else tuple(load_include)
+        exclude = frozenset() if exclude is None else frozenset(exclude)
+        dump_exclude = exclude if dump_exclude is None else frozenset(dump_exclude)
+        load_exclude = exclude if load_exclude is None else frozenset(load_exclude)
 
-        # exclude fields
-        exclude = set() if exclude is None else set(exclude)
-        dump_exclude = exclude if dump_exclude is None else set(dump_exclude)
-        load_exclude = exclude if load_exclude is None else set(load_exclude)
-        if dump_exclude:
-            dump_include = (field for field in dump_include if field not in dump_exclude)
-        if load_exclude:
-            load_include = (field for field in load_include if field not in load_exclude)
+        # reuse fields and main processes built by the same class with the same options
+        plan = self._get_plan(dump_include, dump_exclude, load_include, load_exclude)
+        self._dump_fields = plan.dump_fields
+        self._load_fields = plan.load_fields
 
+        # make processors when initializing for shorter run time
+        self._make_processors(plan.dump_process, plan.load_process)
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise FrozenError(
+                f'Can not change "{name}" of {self}, which is frozen after being used.')
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # processors are closures which can't be pickled, remake them after unpickling
+        state = self.__dict__.copy()
+        for name in (
+                '_do_dump', '_do_load', '_do_dump_many', '_do_load_many',
+                '_projections', '_row_processors', '_codecs', '_frozen'):
+            state.pop(name, None)
+        if 'fields' in state:
+            state['fields'] = dict(state['fields'])
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._make_processors()
+
+    def _freeze(self):
+        """Forbid changing the catalyst and its fields after being used, so that
+        it can be shared by threads safely. Make a new catalyst for other options.
+        """
+        if self._frozen:
+            return
+        self.__dict__['_frozen'] = True
+        self.__dict__['fields'] = MappingProxyType(self.fields)
+        for field in (*self._dump_fields.values(), *self._load_fields.values()):
+            field._freeze()
+
+    def _get_plan(
+            self, dump_include: Optional[tuple], dump_exclude: frozenset,
+            load_include: Optional[tuple], load_exclude: frozenset) -> CatalystPlan:
+        """Get the plan from `plan_cache`, or build it if it's not cached.
+        The key consists of the class, fields and options which the plan depends on.
+        The versions of fields are used to expire the plans if fields are changed.
+        If any option is unhashable, the plan is built without caching.
+        """
+        build = partial(
+            self._build_plan, dump_include, dump_exclude, load_include, load_exclude)
+        cache = self.plan_cache
+        if cache is None:
+            return build()
+
+        key = (
+            type(self),
+            tuple((name, field, field._version) for name, field in self.fields.items()),
+            dump_include, dump_exclude, load_include, load_exclude,
+            self.dump_required, self.load_required, self.dump_default, self.load_default,
+            self.all_errors, self.except_exception, self.compiled,
+            self._assign_dump_getter, self._assign_load_getter,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return build()
+        return cache.get_or_create(key, build)
+
+    def _build_plan(
+            self, dump_include: Optional[tuple], dump_exclude: frozenset,
+            load_include: Optional[tuple], load_exclude: frozenset) -> CatalystPlan:
+        """Select fields and make main processes for processing one object."""
+        # the catalyst processes with its own copies of fields, which are frozen after
+        # being used, and changing the fields of class doesn't affect the catalyst
+        fields = {key: copy.copy(field) for key, field in self.fields.items()}
+        for field in fields.values():
+            if isinstance(field, FieldGroup):
+                field.set_fields(fields)
+
+        if dump_include is None:
+            dump_include = fields.keys()
+        if load_include is None:
+            load_include = fields.keys()
         try:
             self._dump_fields = self._copy_fields(
-                self.fields, dump_include,
-                lambda key: not self.fields[key].no_dump)
+                fields, dump_include,
+                lambda key: key not in dump_exclude and not fields[key].no_dump)
             self._load_fields = self._copy_fields(
-                self.fields, load_include,
-                lambda key: not self.fields[key].no_load)
+                fields, load_include,
+                lambda key: key not in load_exclude and not fields[key].no_load)
         except KeyError as error:
             raise ValueError(f'Field "{error.args[0]}" does not exist.') from error
 
-        # make processors when initializing for shorter run time
-        self._do_dump = self._make_processor('dump', False)
-        self._do_load = self._make_processor('load', False)
-        self._do_dump_many = self._make_processor('dump', True)
-        self._do_load_many = self._make_processor('load', True)
+        return CatalystPlan(
+            self._dump_fields, self._load_fields,
+            self._make_main_process('dump'), self._make_main_process('load'))
 
     @staticmethod
     def _copy_fields(
@@ -259,23 +385,24 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
     def _process_one(
             data: Any,
             all_errors: bool,
-            assign_getter: Callable,
+            get_values: ValuesGetter,
             partial_fields: Iterable[PartialFields],
             partial_groups: Iterable[PartialGroups],
             except_exception: ExceptionType):
         """Process one object using fields and catalyst options."""
-        # According to the type of `data`, assign a function to get field value from `data`
-        get_value = assign_getter(data)
+        # get values of all fields at once, the access strategy depends on type of `data`
+        values, get_errors = get_values(data)
 
         valid_data, errors, invalid_data = {}, {}, {}
 
         # process data for each fields
-        for field, source, target, required, default, field_method in partial_fields:
-            value = missing
+        for (field, source, target, required, default, field_method), value in zip(
+                partial_fields, values):
             try:
-                value = get_value(data, source, missing)
-
                 if value is missing:
+                    # raise the error occurred when getting value
+                    if get_errors is not None and source in get_errors:
+                        raise get_errors[source]
                     value = default() if callable(default) else default
 
                 if value is not missing:
@@ -287,17 +414,8 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
                 else:
                     valid_data[target] = value
             except except_exception as e:
-                if isinstance(e, ValidationError) and isinstance(e.detail, BaseResult):
-                    detail: BaseResult = e.detail
-                    # distribute nested data in BaseResult
-                    valid_data[target] = detail.valid_data
-                    errors[source] = detail.errors
-                    invalid_data[source] = detail.invalid_data
-                else:
-                    # collect errors and invalid data
-                    errors[source] = e
-                    if value is not missing:
-                        invalid_data[source] = value
+                distribute_field_error(
+                    e, source, target, value, valid_data, errors, invalid_data)
                 if not all_errors:
                     break
 
@@ -310,21 +428,8 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             try:
                 valid_data = group_method(valid_data, original_data=data)
             except except_exception as e:
-                if isinstance(e, ValidationError) and isinstance(e.detail, BaseResult):
-                    detail: BaseResult = e.detail
-                    # distribute nested data in BaseResult
-                    try:
-                        valid_data.update(detail.valid_data)
-                        errors.update(detail.errors)
-                        invalid_data.update(detail.invalid_data)
-                    except (ValueError, TypeError):
-                        errors[error_key] = detail.format_errors()
-                else:
-                    # collect errors and invalid data
-                    errors[error_key] = e
-                    for source, target in source_target_pairs:
-                        if target in valid_data:
-                            invalid_data[source] = valid_data.pop(target)
+                distribute_group_error(
+                    e, error_key, source_target_pairs, valid_data, errors, invalid_data)
                 if not all_errors:
                     break
         return valid_data, errors, invalid_data
@@ -343,7 +448,116 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
                     break
         return valid_data, errors, invalid_data
 
-    def _make_processor(self, name: str, many: bool) -> Callable:
+    def _make_partials(self, name: str):
+        """Collect values getter and partial arguments of fields and field groups
+        for processing one object.
+        """
+        if name == 'dump':
+            assign_getter = self._assign_dump_getter
+            field_dict = self._dump_fields
+            source_attr = 'name'
+            target_attr = 'key'
+            default_attr = 'dump_default'
+            required_attr = 'dump_required'
+        else:
+            assign_getter = self._assign_load_getter
+            field_dict = self._load_fields
+            source_attr = 'key'
+            target_attr = 'name'
+            default_attr = 'load_default'
+            required_attr = 'load_required'
+        # the required options for all fields
+        general_required = getattr(self, required_attr)
+        general_default = getattr(self, default_attr)
+
+        partial_fields, partial_groups = [], []
+        for field in field_dict.values():
+            if isinstance(field, FieldGroup):
+                # get partial arguments from FieldGroup
+                group: FieldGroup = field
+                group_method = getattr(group, name)
+                group_method = self._modify_processer_parameters(group_method)
+                error_key = getattr(group, source_attr)
+                source_target_pairs = []
+                for f in group.fields.values():
+                    source = getattr(f, source_attr)
+                    target = getattr(f, target_attr)
+                    source_target_pairs.append((source, target))
+                partial_groups.append(
+                    PartialGroups(group_method, error_key, source_target_pairs))
+            elif isinstance(field, Field):
+                # get partial arguments from Field
+                field_method = getattr(field, name)
+                source = getattr(field, source_attr)
+                target = getattr(field, target_attr)
+                required = getattr(field, required_attr)
+                if required is None:
+                    required = general_required
+                default = getattr(field, default_attr)
+                if default is ...:
+                    default = general_default
+                partial_fields.append(
+                    PartialFields(field, source, target, required, default, field_method))
+        get_values = ValuesGetter((f.source for f in partial_fields), assign_getter)
+        return get_values, partial_fields, partial_groups
+
+    def _is_default_method(self, name: str) -> bool:
+        """Whether the method is neither overridden by subclass nor by instance."""
+        return name not in self.__dict__ and name in _default_methods(type(self))
+
+    def _get_process_one(self, name: str) -> Callable:
+        """Get the processor of one object for processing many objects,
+        skip calling `Catalyst.dump` or `Catalyst.load` if it is not overridden.
+        """
+        if self._is_default_method(name):
+            return getattr(self, f'_do_{name}')
+        return getattr(self, name)
+
+    def _get_inline_plan(self, name: str, many: bool) -> Optional[ProcessPlan]:
+        """Return the plan for inlining this catalyst into the compiled process
+        of another catalyst, or `None` if the processes are customized.
+        """
+        method_names = [name, f'pre_{name}', f'post_{name}']
+        if many:
+            method_names += [f'{name}_many', f'pre_{name}_many', f'post_{name}_many']
+        if not all(self._is_default_method(method_name) for method_name in method_names):
+            return None
+        return ProcessPlan(
+            *self._make_partials(name),
+            self.all_errors, self.except_exception, self.process_aliases)
+
+    def _make_processors(self, dump_process: Callable = None, load_process: Callable = None):
+        """Make processors for dumping and loading one or many objects with
+        selected fields, the main processes of one object are made if not given.
+        """
+        self._do_dump = self._make_processor('dump', False, dump_process)
+        self._do_load = self._make_processor('load', False, load_process)
+        self._do_dump_many = self._make_processor('dump', True)
+        self._do_load_many = self._make_processor('load', True)
+
+    def _make_main_process(self, name: str, columns: Tuple = None) -> Callable:
+        """Create the main process of dumping or loading one object, which
+        depends on fields and options, but not on the catalyst instance.
+        If `columns` is given, the object is a row of values of the columns.
+        """
+        get_values, partial_fields, partial_groups = self._make_partials(name)
+        if columns is not None:
+            get_values = RowGetter(get_values.names, columns)
+        if self.compiled:
+            plan = ProcessPlan(
+                get_values, partial_fields, partial_groups,
+                self.all_errors, self.except_exception, self.process_aliases)
+            return compile_process_one(name, plan, self.__class__.__qualname__)
+        return partial(
+            self._process_one,
+            all_errors=self.all_errors,
+            get_values=get_values,
+            partial_fields=partial_fields,
+            partial_groups=partial_groups,
+            except_exception=self.except_exception)
+
+    def _make_processor(
+            self, name: str, many: bool, main_process: Callable = None) -> Callable:
         """Create processor for dumping and loading processes. And wrap basic
         main process with pre and post processes. Determine parameters for
         different processes in advance to reduce processing time.
@@ -355,76 +569,32 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
         else:
             raise ValueError('Argument "name" must be "dump" or "load".')
 
-        all_errors = self.all_errors
         except_exception = self.except_exception
         if many:
-            main_process = partial(
-                self._process_many,
-                all_errors=all_errors,
-                process_one=getattr(self, name))
+            if main_process is None:
+                main_process = partial(
+                    self._process_many,
+                    all_errors=self.all_errors,
+                    process_one=self._get_process_one(name))
             method_name = name + '_many'
         else:
             method_name = name
-            if name == 'dump':
-                assign_getter = self._assign_dump_getter
-                field_dict = self._dump_fields
-                source_attr = 'name'
-                target_attr = 'key'
-                default_attr = 'dump_default'
-                required_attr = 'dump_required'
-            else:
-                assign_getter = self._assign_load_getter
-                field_dict = self._load_fields
-                source_attr = 'key'
-                target_attr = 'name'
-                default_attr = 'load_default'
-                required_attr = 'load_required'
-            # the required options for all fields
-            general_required = getattr(self, required_attr)
-            general_default = getattr(self, default_attr)
-
-            partial_fields, partial_groups = [], []
-            for field in field_dict.values():
-                if isinstance(field, FieldGroup):
-                    # get partial arguments from FieldGroup
-                    group: FieldGroup = field
-                    group_method = getattr(group, method_name)
-                    group_method = self._modify_processer_parameters(group_method)
-                    error_key = getattr(group, source_attr)
-                    source_target_pairs = []
-                    for f in group.fields.values():
-                        source = getattr(f, source_attr)
-                        target = getattr(f, target_attr)
-                        source_target_pairs.append((source, target))
-                    partial_groups.append(
-                        PartialGroups(group_method, error_key, source_target_pairs))
-                elif isinstance(field, Field):
-                    # get partial arguments from Field
-                    field_method = getattr(field, method_name)
-                    source = getattr(field, source_attr)
-                    target = getattr(field, target_attr)
-                    required = getattr(field, required_attr)
-                    if required is None:
-                        required = general_required
-                    default = getattr(field, default_attr)
-                    if default is ...:
-                        default = general_default
-                    partial_fields.append(
-                        PartialFields(field, source, target, required, default, field_method))
-            main_process = partial(
-                self._process_one,
-                all_errors=all_errors,
-                assign_getter=assign_getter,
-                partial_fields=partial_fields,
-                partial_groups=partial_groups,
-                except_exception=except_exception)
+            if main_process is None:
+                main_process = self._make_main_process(name)
 
         # assign params as closure variables for processor
         pre_process_name = f'pre_{method_name}'
         post_process_name = f'post_{method_name}'
-        pre_process = getattr(self, pre_process_name)
-        post_process = getattr(self, post_process_name)
-        post_process = self._modify_processer_parameters(post_process)
+        # skip pre and post processes which are not overridden
+        pre_process = post_process = None
+        pass_original_data = False
+        if not self._is_default_method(pre_process_name):
+            pre_process = getattr(self, pre_process_name)
+        if not self._is_default_method(post_process_name):
+            post_process = getattr(self, post_process_name)
+            # pass `original_data` only if it's one of the parameters
+            pass_original_data = _accepts_original_data(
+                getattr(post_process, '__func__', post_process))
         process_aliases = self.process_aliases
         default_raise_error = self.raise_error
 
@@ -436,16 +606,19 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             try:
                 # pre process
                 process_name = pre_process_name
-                valid_data = pre_process(data)
+                valid_data = data if pre_process is None else pre_process(data)
 
                 # main process
                 process_name = method_name
                 valid_data, errors, invalid_data = main_process(valid_data)
 
                 # post process
-                if not errors:
+                if not errors and post_process is not None:
                     process_name = post_process_name
-                    valid_data = post_process(valid_data, original_data=data)
+                    if pass_original_data:
+                        valid_data = post_process(valid_data, original_data=data)
+                    else:
+                        valid_data = post_process(valid_data)
             except except_exception as e:
                 # handle error which raised during processing
                 key = process_aliases.get(process_name, process_name)
@@ -467,14 +640,89 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
         """Modify the parameters of the processer function.
         Ignore `original_data` if it's not one of the parameters.
         """
-        sig = inspect.signature(func)
-        if 'original_data' not in sig.parameters:
+        if not _accepts_original_data(getattr(func, '__func__', func)):
             @wraps(func)
             def wrapper(data, original_data=None):
                 return func(data)
             return wrapper
         return func
 
+    def _get_row_processors(self, columns: Iterable) -> Tuple[Callable, Callable]:
+        """Get the processors for loading one row and many rows with the columns,
+        which are memoized for each distinct columns.
+        """
+        columns = tuple(columns)
+        processors = self.__dict__.get('_row_processors')
+        if processors is None:
+            processors = self.__dict__.setdefault(
+                '_row_processors', LRUCache(self.projection_cache_size))
+        return processors.get_or_create(columns, partial(self._make_row_processors, columns))
+
+    def _make_row_processors(self, columns: Tuple) -> Tuple[Callable, Callable]:
+        process_one = self._make_processor(
+            'load', False, self._make_main_process('load', columns))
+        main_process = partial(
+            self._process_many, all_errors=self.all_errors, process_one=process_one)
+        return process_one, self._make_processor('load', True, main_process)
+
+    def _get_projection(
+            self, only: Optional[Iterable[str]], exclude: Optional[Iterable[str]]) -> 'Catalyst':
+        """Get the catalyst processing the fields selected by `only` and `exclude`,
+        which is memoized for each distinct selection. A string is one path.
+        """
+        if isinstance(only, str):
+            only = (only,)
+        if isinstance(exclude, str):
+            exclude = (exclude,)
+        key = (
+            None if only is None else frozenset(only),
+            frozenset() if exclude is None else frozenset(exclude))
+        projections = self.__dict__.get('_projections')
+        if projections is None:
+            projections = self.__dict__.setdefault(
+                '_projections', LRUCache(self.projection_cache_size))
+        return projections.get_or_create(key, partial(self._make_projection, *key))
+
+    def _make_projection(self, only: Optional[frozenset], exclude: frozenset) -> 'Catalyst':
+        """Copy the catalyst with the fields selected by dotted paths, such as
+        "author.name", the catalysts of nested fields are projected by the rest paths.
+        """
+        only_tree = None if only is None else _parse_paths(only)
+        exclude_tree = _parse_paths(exclude)
+        for name in (*(only_tree or ()), *exclude_tree):
+            if name not in self.fields:
+                raise ValueError(f'Field "{name}" does not exist.')
+
+        used_fields = {**self._dump_fields, **self._load_fields}
+        fields = {}
+        for name, field in used_fields.items():
+            if only_tree is not None and name not in only_tree:
+                continue
+            sub_exclude = exclude_tree.get(name, ())
+            if sub_exclude is None:
+                continue
+            sub_only = None if only_tree is None else only_tree[name]
+            if sub_only is not None or sub_exclude:
+                if not isinstance(field, NestedField):
+                    raise ValueError(f'Field "{name}" is not a NestedField.')
+                field = copy.copy(field)
+                field.set_catalyst(field.catalyst._get_projection(sub_only, sub_exclude))
+            fields[name] = field
+
+        # field groups can't work without any of their fields
+        unselected = used_fields.keys() - fields.keys()
+        for name, field in list(fields.items()):
+            if isinstance(field, FieldGroup) and not unselected.isdisjoint(field.fields):
+                del fields[name]
+
+        projection = self.__class__.__new__(self.__class__)
+        projection.__dict__.update(self.__getstate__())
+        projection._dump_fields = {k: fields[k] for k in self._dump_fields if k in fields}
+        projection._load_fields = {k: fields[k] for k in self._load_fields if k in fields}
+        projection._make_processors()
+        projection._freeze()
+        return projection
+
     def _process_args(self, func: Callable, processor: Callable) -> Callable:
         """Decorator for handling args by catalyst before function is called.
         The wrapper function takes args as same as args of the raw function.
@@ -490,21 +738,132 @@ class Catalyst(CatalystABC, metaclass=CatalystMeta):
             return func(*ba.args, **ba.kwargs)
         return wrapper
 
-    def dump(self, data: Any, raise_error: bool = None) -> DumpResult:
-        """Serialize `data` according to defined fields."""
-        return self._do_dump(data, raise_error)
-
-    def load(self, data: Any, raise_error: bool = None) -> LoadResult:
-        """Deserialize `data` according to defined fields."""
-        return self._do_load(data, raise_error)
-
-    def dump_many(self, data: Iterable, raise_error: bool = None) -> DumpResult:
-        """Serialize multiple objects."""
-        return self._do_dump_many(data, raise_error)
+    def dump(
+            self, data: Any, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> DumpResult:
+        """Serialize `data` according to defined fields.
 
-    def load_many(self, data: Iterable, raise_error: bool = None) -> LoadResult:
-        """Deserialize multiple objects."""
-        return self._do_load_many(data, raise_error)
+        :param only: The fields to process in this call, fields of nested
+            catalysts can be selected by dotted paths, such as "author.name".
+            A string selects one field. If None, all fields are used.
+        :param exclude: The fields to skip in this call, also supports dotted paths.
+            The unselected fields are not fetched from `data` at all.
+        """
+        if not self._frozen:
+            self._freeze()
+        if only is None and exclude is None:
+            return self._do_dump(data, raise_error)
+        return self._get_projection(only, exclude)._do_dump(data, raise_error)
+
+    def load(
+            self, data: Any, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            columns: Iterable = None) -> LoadResult:
+        """Deserialize `data` according to defined fields.
+        See `dump` for the usage of `only` and `exclude`.
+
+        :param columns: If given, `data` is a row such as a tuple from DB-API cursors,
+            and values of fields are got by positions of the columns whose names are
+            keys of fields. The names or `cursor.description` can be passed.
+            The positions are found once for each distinct columns.
+        """
+        if not self._frozen:
+            self._freeze()
+        catalyst = self
+        if only is not None or exclude is not None:
+            catalyst = self._get_projection(only, exclude)
+        if columns is None:
+            return catalyst._do_load(data, raise_error)
+        return catalyst._get_row_processors(column_names(columns))[0](data, raise_error)
+
+    def dump_many(
+            self, data: Iterable, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            executor: str = None, workers: int = None, chunksize: int = None,
+            shared_memory: bool = False) -> DumpResult:
+        """Serialize multiple objects.
+
+        :param executor: If "process" or "thread", split `data` into chunks and process
+            them on a persistent pool of worker processes or threads. The objects, results
+            and the catalyst are pickled for worker processes. The result is the same
+            as processing serially, and `pre_dump_many` and `post_dump_many` are called
+            in the current thread. Threads scale on free-threaded Python builds.
+        :param workers: The number of workers, default to the number of CPUs.
+        :param chunksize: The number of objects in each chunk. If not given, it's
+            tuned from the cost per object measured by processing the first objects.
+        :param shared_memory: Whether worker processes write the values of integer,
+            float, boolean, date and datetime fields to shared memory instead of
+            pickling them, see `catalyst.shared`. Threads ignore it.
+        """
+        return self._process_many_with('dump', data, raise_error, only, exclude,
+                                       executor, workers, chunksize,
+                                       shared_memory=shared_memory)
+
+    def load_many(
+            self, data: Iterable, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            executor: str = None, workers: int = None, chunksize: int = None,
+            columns: Iterable = None, shared_memory: bool = False) -> LoadResult:
+        """Deserialize multiple objects. See `dump_many` for the usage of arguments,
+        and `load` for loading rows with `columns`, such as::
+
+            cursor.execute('SELECT id, name FROM user')
+            result = catalyst.load_many(cursor, columns=cursor.description)
+        """
+        return self._process_many_with('load', data, raise_error, only, exclude,
+                                       executor, workers, chunksize, columns, shared_memory)
+
+    def _process_many_with(
+            self, name: str, data: Iterable, raise_error: Optional[bool],
+            only: Optional[Iterable[str]], exclude: Optional[Iterable[str]],
+            executor: Optional[str], workers: Optional[int], chunksize: Optional[int],
+            columns: Optional[Iterable] = None, shared_memory: bool = False):
+        """Process multiple objects with selected fields and executor."""
+        if not self._frozen:
+            self._freeze()
+        catalyst = self
+        if only is not None or exclude is not None:
+            catalyst = self._get_projection(only, exclude)
+        if columns is not None:
+            columns = column_names(columns)
+        if executor is None:
+            if columns is not None:
+                return catalyst._get_row_processors(columns)[1](data, raise_error)
+            return getattr(catalyst, f'_do_{name}_many')(data, raise_error)
+
+        from .parallel import ParallelProcess  # pylint: disable=import-outside-toplevel
+        main_process = ParallelProcess(
+            self, name, executor, only, exclude, workers, chunksize, columns, shared_memory)
+        return catalyst._make_processor(name, True, main_process)(data, raise_error)
+
+    async def dump_async(
+            self, data: Any, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            concurrency: 'Concurrency' = None) -> DumpResult:
+        """Serialize `data` like `dump`, but the values of fields can be awaitable,
+        such as the coroutines returned by async methods for `CallableField`.
+        The awaitables got from `data` are awaited before being passed to fields,
+        and the awaitables returned by fields are awaited after all fields are called.
+        They are awaited concurrently, and the result keeps the order of fields.
+
+        :param concurrency: The maximum number of awaitables awaited at the same time,
+            default to `catalyst.aio.CONCURRENCY`. An `asyncio.Semaphore` can be
+            passed to share the limit among calls.
+        """
+        from .aio import AsyncDumper  # pylint: disable=import-outside-toplevel
+        return await self._get_codec(AsyncDumper, only, exclude).dump(
+            data, raise_error, concurrency)
+
+    async def dump_many_async(
+            self, data: Iterable, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            concurrency: 'Concurrency' = None) -> DumpResult:
+        """Serialize multiple objects like `dump_async`, the objects are dumped
+        concurrently, and `concurrency` limits the awaitables of all objects.
+        """
+        from .aio import AsyncDumper  # pylint: disable=import-outside-toplevel
+        return await self._get_codec(AsyncDumper, only, exclude).dump_many(
+            data, raise_error, concurrency)
 
     def dump_args(self, func: Callable) -> Callable:
         """Decorator for serializing arguments of the function."""
@@ -18,8 +18,15 @@ class ValidationError(Exception):
         self.msg = msg
         self.detail = detail
 
+    def __reduce__(self):
+        return self.__class__, (self.msg, self.detail)
+
     def __repr__(self):
         return f'ValidationError({self.msg!r})'
 
     def __str__(self):
         return str(self.msg)
+
+
+class FrozenError(AttributeError):
+    """Raised when changing a catalyst or field which is frozen after being used."""
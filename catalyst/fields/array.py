@@ -0,0 +1,169 @@
+"""Field of NumPy arrays. NumPy is optional, so this module is not imported by
+`catalyst.fields`, import the field by ``from catalyst.fields.array import ArrayField``.
+"""
+
+from typing import Iterable, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from ..utils import BaseResult, bind_attrs
+from ..exceptions import ValidationError
+
+from .base import Field
+
+
+class ArrayField(Field):
+    """Field for converting lists or buffers to NumPy arrays in one conversion.
+    The items are checked in a vectorized way, and the errors are keyed by indexes
+    of invalid items, the same as `ListField`, such as ``{3: 'Value must >= 0.'}``,
+    or ``{0: {3: ...}}`` for 2-dimensional arrays.
+    In order to ensure proper data structure, `None` is not valid.
+
+    Example::
+
+        field = ArrayField('float32', shape=(None, 3), minimum=0, maximum=1)
+        field.load([[0, 0.5, 1]])
+        field.load(b'...')  # read-only array of the buffer without copying
+
+    :param dtype: The data type of items, such as "float64" or `numpy.int32`.
+    :param shape: The shape of arrays, `None` in the shape is any size.
+        Buffers are reshaped to it, which can contain at most one `None`.
+    :param minimum: Items must >= minimum, and `None` is equal to -∞.
+    :param maximum: Items must <= maximum, and `None` is equal to +∞.
+    :param allow_nan: Whether NaN items are valid.
+    :param dump_list: Whether to dump arrays to lists, or keep arrays.
+    :param all_errors: Whether to collect errors for every invalid items.
+    :param error_messages: Keys {'too_small', 'too_large', 'not_between', 'nan',
+        'shape', 'scalar', ...}.
+    """
+    dtype = 'float64'
+    shape: Tuple = None
+    allow_nan = False
+    dump_list = True
+    all_errors = True
+    allow_none = False
+    error_messages = {
+        'too_small': 'Value must >= {self.minimum}.',
+        'too_large': 'Value must <= {self.maximum}.',
+        'not_between': 'Value must be between {self.minimum} and {self.maximum}.',
+        'nan': 'Value must not be NaN.',
+        'shape': 'Shape must be {self.shape}, not {shape}.',
+        'scalar': 'Value must be a sequence or buffer, not a scalar.',
+    }
+
+    def __init__(
+            self,
+            dtype=None,
+            shape: Union[int, Iterable[int]] = None,
+            minimum=None,
+            maximum=None,
+            allow_nan: bool = None,
+            dump_list: bool = None,
+            all_errors: bool = None,
+            **kwargs):
+        if np is None:
+            raise ImportError('NumPy is required by ArrayField.')
+        super().__init__(**kwargs)
+        bind_attrs(
+            self,
+            dtype=dtype,
+            allow_nan=allow_nan,
+            dump_list=dump_list,
+            all_errors=all_errors,
+        )
+        if shape is not None:
+            self.shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        if minimum is not None and maximum is not None and minimum > maximum:
+            raise ValueError('"minimum" cannot be greater than "maximum".')
+        self.minimum = minimum
+        self.maximum = maximum
+        self.dtype = np.dtype(self.dtype)
+
+    def format(self, value):
+        array = np.asarray(value, dtype=self.dtype)
+        return array.tolist() if self.dump_list else array
+
+    def parse(self, value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            array = np.frombuffer(value, dtype=self.dtype)
+            if self.shape is not None:
+                array = array.reshape([-1 if size is None else size for size in self.shape])
+        else:
+            try:
+                array = np.asarray(value, dtype=self.dtype)
+            except (TypeError, ValueError):
+                self._raise_item_errors(value)
+                raise
+        if array.ndim == 0:
+            raise self.error('scalar')
+        self._check_shape(array)
+        self._check_items(array)
+        return array
+
+    def _check_shape(self, array):
+        shape = self.shape
+        if shape is None:
+            return
+        if array.ndim != len(shape) or any(
+                size is not None and size != actual for size, actual in zip(shape, array.shape)):
+            raise self.error('shape', shape=array.shape)
+
+    def _raise_item_errors(self, value):
+        """Find the items of the list which can't be converted to `dtype`."""
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            return
+        valid_data, errors, invalid_data = [], {}, {}
+        for i, item in enumerate(value):
+            try:
+                valid_data.append(np.asarray(item, dtype=self.dtype))
+            except (TypeError, ValueError) as e:
+                errors[i] = e
+                invalid_data[i] = item
+                if not self.all_errors:
+                    break
+        if errors:
+            result = BaseResult(valid_data, errors, invalid_data)
+            raise ValidationError(msg=result.format_errors(), detail=result)
+
+    def _check_items(self, array):
+        """Check range and NaN of all items at once, and raise the errors of items
+        which are invalid, like `ListField`.
+        """
+        minimum, maximum = self.minimum, self.maximum
+        checks = []
+        if minimum is not None or maximum is not None:
+            if maximum is None:
+                invalid, error_key = array < minimum, 'too_small'
+            elif minimum is None:
+                invalid, error_key = array > maximum, 'too_large'
+            else:
+                invalid, error_key = (array < minimum) | (array > maximum), 'not_between'
+            checks.append((invalid, error_key))
+        if not self.allow_nan and array.dtype.kind in 'fc':
+            checks.append((np.isnan(array), 'nan'))
+        if not any(invalid.any() for invalid, _ in checks):
+            return
+
+        invalid_items = np.logical_or.reduce([invalid for invalid, _ in checks])
+        indexes = np.argwhere(invalid_items).tolist()
+        if not self.all_errors:
+            indexes = indexes[:1]
+        errors, invalid_data = {}, {}
+        for index in indexes:
+            index_tuple = tuple(index)
+            error_key = next(key for invalid, key in checks if invalid[index_tuple])
+            # nest the errors of multidimensional arrays like nested `ListField`
+            errors_dict, invalid_dict = errors, invalid_data
+            for i in index[:-1]:
+                errors_dict = errors_dict.setdefault(i, {})
+                invalid_dict = invalid_dict.setdefault(i, {})
+            errors_dict[index[-1]] = self.error(error_key)
+            invalid_dict[index[-1]] = array[index_tuple].item()
+
+        # the valid data is the array without invalid items, or rows for multidimensional arrays
+        invalid_rows = invalid_items.reshape(len(array), -1).any(axis=1)
+        result = BaseResult(array[~invalid_rows], errors, invalid_data)
+        raise ValidationError(msg=result.format_errors(), detail=result)
@@ -8,6 +8,7 @@ from ..utils import (
     bind_attrs, bind_not_ellipsis_attrs,
 )
 from ..validators import MemberValidator, NonMemberValidator
+from ..exceptions import FrozenError
 
 
 ValidatorType = CallableType[[Any], None]
@@ -41,6 +42,11 @@ class BaseField(ErrorMessageMixin):
     load_source = property(lambda self: self.key)
     load_target = property(lambda self: self.name)
 
+    # increased when the field is changed, to expire the plans cached by catalysts
+    _version = 0
+    # whether the field can be changed, see `_freeze`
+    _frozen = False
+
     def __init__(
             self,
             name: str = None,
@@ -53,6 +59,37 @@ class BaseField(ErrorMessageMixin):
         self.collect_error_messages(error_messages)
         bind_attrs(self, no_dump=no_dump, no_load=no_load)
 
+    def __setattr__(self, name, value):
+        self._check_frozen(name)
+        super().__setattr__(name, value)
+        self._touch()
+
+    def __copy__(self):
+        # the copy is not frozen
+        field = self.__class__.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        field.__dict__.pop('_frozen', None)
+        return field
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_frozen', None)
+        return state
+
+    def _touch(self):
+        """Mark the field as changed."""
+        self.__dict__['_version'] = self._version + 1
+
+    def _check_frozen(self, name: str):
+        if self._frozen:
+            raise FrozenError(
+                f'Can not change "{name}" of {self}, '
+                'which is frozen after being used by a catalyst.')
+
+    def _freeze(self):
+        """Forbid changing the field, so that it can be shared by threads safely."""
+        self.__dict__['_frozen'] = True
+
     def override_method(
             self, func: CallableType = None, attr: str = None,
             obj_name='field', original_name='original_method'):
@@ -224,6 +261,118 @@ class Field(BaseField):
         if not_in:
             msg = self.error_messages.get('not_in')
             self.add_validator(NonMemberValidator(not_in, msg))
+        self._make_processors()
+
+    def __copy__(self):
+        field = super().__copy__()
+        # bind fused processors to the copy
+        if '_fused_processors' in field.__dict__:
+            field._make_processors()
+        return field
+
+    def __getstate__(self):
+        # fused processors are closures which can't be pickled, remake them after unpickling
+        state = super().__getstate__()
+        for name, fused in zip(('dump', 'load'), state.pop('_fused_processors', ())):
+            if fused is not None and state.get(name) is fused:
+                del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._make_processors()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # remake processors if the stages are changed, such as `set_format`
+        if name in self._processor_attrs and '_fused_processors' in self.__dict__:
+            self._make_processors()
+
+    def _freeze(self):
+        # validators can't be appended any more
+        if not isinstance(self.validators, tuple):
+            self.__dict__['validators'] = tuple(self.validators)
+            self._make_processors()
+        super()._freeze()
+
+    # the attributes which fused processors are made from
+    _processor_attrs = frozenset([
+        'format', 'parse', 'validate_dump', 'validate_load', 'validators',
+        'is_none', 'as_none', 'dump_none', 'load_none', 'allow_none',
+    ])
+
+    def _make_processors(self):
+        """Fuse the stages of `Field.dump` and `Field.load` into functions, which skip
+        the stages doing nothing, and set them as `self.dump` and `self.load`.
+        The methods overridden by subclass or `override_method` are kept.
+        """
+        fused_processors = self.__dict__.get('_fused_processors', (None, None))
+        new_processors = []
+        for name, fused, fuse in zip(
+                ('dump', 'load'), fused_processors, (self._fuse_dump, self._fuse_load)):
+            processor = None
+            if getattr(type(self), name) is getattr(Field, name) \
+                    and self.__dict__.get(name) is fused:
+                processor = fuse()
+                if processor is None:
+                    self.__dict__.pop(name, None)
+                else:
+                    self.__dict__[name] = processor
+            new_processors.append(processor)
+        self.__dict__['_fused_processors'] = tuple(new_processors)
+
+    def _is_default_none(self) -> bool:
+        """Whether null value is only `None`, and `is_none` is not overridden."""
+        as_none = tuple(self.as_none)
+        return getattr(self.is_none, '__func__', None) is Field.is_none \
+            and len(as_none) == 1 and as_none[0] is None
+
+    def _fuse_dump(self):
+        if not self._is_default_none() or self.validate_dump is not no_processing:
+            return None
+
+        format_, dump_none = self.format, self.dump_none
+        if getattr(format_, '__func__', None) is Field.format:
+            def dump(value):
+                return dump_none if value is None else value
+        else:
+            def dump(value):
+                return dump_none if value is None else format_(value)
+        return dump
+
+    def _fuse_load(self):
+        if not self._is_default_none() \
+                or getattr(self.validate_load, '__func__', None) is not Field.validate:
+            return None
+
+        parse, load_none, allow_none = self.parse, self.load_none, self.allow_none
+        # `add_validator` appends to the same list
+        validators, error = self.validators, self.error
+        if getattr(parse, '__func__', None) is Field.parse:
+            def load(value):
+                if value is None:
+                    value = load_none
+                if value is None:
+                    if not allow_none:
+                        raise error('none')
+                elif validators and value is not missing:
+                    for validator in validators:
+                        validator(value)
+                return value
+        else:
+            def load(value):
+                if value is None:
+                    value = load_none
+                else:
+                    value = parse(value)
+                if value is None:
+                    if not allow_none:
+                        raise error('none')
+                elif validators and value is not missing:
+                    for validator in validators:
+                        validator(value)
+                return value
+        return load
 
     def set_format(self, func: CallableType = None, **kwargs):
         """Override `Field.format` method which will be called during dumping.
@@ -259,7 +408,9 @@ class Field(BaseField):
         """Append a validator to list."""
         if not callable(validator):
             raise TypeError('Argument "validator" must be Callable.')
+        self._check_frozen('validators')
         self.validators.append(validator)
+        self._touch()
         return validator
 
     def validate(self, value):
@@ -47,8 +47,14 @@ class ListField(Field):
         item_field = self.item_field
         if not isinstance(item_field, Field):
             raise TypeError(f'Argument "item_field" must be a Field instance, not "{item_field}".')
-        self.format_item = getattr(item_field, 'dump')
-        self.parse_item = getattr(item_field, 'load')
+
+    # processors of item field might be remade, don't bind them to attributes
+    format_item = property(lambda self: self.item_field.dump)
+    parse_item = property(lambda self: self.item_field.load)
+
+    def _freeze(self):
+        super()._freeze()
+        self.item_field._freeze()
 
     def format(self, value):
         return self._process_many(
@@ -134,11 +140,14 @@ class NestedField(Field):
 
     def __init__(self, catalyst: CatalystABC = None, many: bool = None, **kwargs):
         super().__init__(**kwargs)
-        bind_attrs(self, catalyst=catalyst, many=many)
+        bind_attrs(self, many=many)
+        self.set_catalyst(self.catalyst if catalyst is None else catalyst)
 
-        catalyst = self.catalyst
+    def set_catalyst(self, catalyst: CatalystABC):
+        """Set the catalyst and bind its processes for dumping and loading."""
         if not isinstance(catalyst, CatalystABC):
             raise TypeError(f'Argument "catalyst" must be a Catalyst instance, not "{catalyst}".')
+        self.catalyst = catalyst
         if self.many:
             self._do_dump = catalyst.dump_many
             self._do_load = catalyst.load_many
@@ -146,6 +155,12 @@ class NestedField(Field):
             self._do_dump = catalyst.dump
             self._do_load = catalyst.load
 
+    def _freeze(self):
+        super()._freeze()
+        freeze = getattr(self.catalyst, '_freeze', None)
+        if freeze is not None:
+            freeze()
+
     def format(self, value):
         return self._do_dump(value, raise_error=True).valid_data
 
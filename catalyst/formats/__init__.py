@@ -0,0 +1,429 @@
+"""Read and write data formats directly from and to processes of catalysts.
+
+The methods of `Catalyst` for the formats are defined by the mixins here, and
+the modules of formats are imported by the methods on first use.
+"""
+
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple
+
+from ..exceptions import ValidationError
+from ..utils import DumpResult, LoadResult, column_names
+
+if TYPE_CHECKING:
+    from .jsonl import ValidationReport
+
+
+class JSONMixin:
+    """The methods of `Catalyst` to read and write JSON and JSON Lines."""
+
+    def dump_json(
+            self, data: Any, only: Iterable[str] = None, exclude: Iterable[str] = None) -> str:
+        """Serialize `data` to JSON string, which is the same as
+        ``json.dumps(self.dump(data).valid_data)``.
+        Raise `ValidationError` if `data` is invalid.
+        """
+        from .json import JSONWriter  # pylint: disable=import-outside-toplevel
+        return self._get_codec(JSONWriter, only, exclude).dumps(data)
+
+    def dump_many_json(
+            self, data: Iterable, fp=None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> Optional[str]:
+        """Serialize multiple objects to JSON array. If `fp` is given, write the objects
+        one by one to the text or binary file object, and return None.
+        Raise `ValidationError` if any object is invalid.
+        """
+        from .json import JSONWriter  # pylint: disable=import-outside-toplevel
+        writer = self._get_codec(JSONWriter, only, exclude)
+        if fp is None:
+            return writer.dumps_many(data)
+        writer.dump_many(data, fp)
+        return None
+
+    def iter_load_json_array(
+            self, fp, raise_error: bool = None, chunk_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            read_size: int = None) -> Iterator[Tuple[int, LoadResult]]:
+        """Deserialize the items of a large JSON array from a text or binary file
+        object lazily. The file is read in chunks, and each item is loaded as soon
+        as it's decoded, so memory usage is bounded by the largest item.
+        The results and errors are the same as `iter_load`, errors are keyed by
+        indexes of items. Raise `JSONDecodeError` if the JSON is malformed.
+
+        :param read_size: The number of characters or bytes to read at a time.
+        """
+        if read_size is not None and read_size < 1:
+            raise ValueError('Argument "read_size" must be a positive integer.')
+        from .json import iter_array_file  # pylint: disable=import-outside-toplevel
+        items = iter_array_file(fp, read_size)
+        return self._iter_process(
+            'load', items, raise_error, chunk_size, error_callback, only, exclude)
+
+    def load_jsonl(
+            self, file, raise_error: bool = None, batch_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+    ) -> Iterator[Tuple[int, LoadResult]]:
+        """Deserialize objects from JSON Lines lazily, like `iter_load`. Yield the line
+        number and result of each line, or the number of the first line and result
+        of each batch, if `batch_size` is given. Errors of batches are keyed by line
+        numbers, and the lines which are not valid JSON have errors of "load".
+
+        :param file: The path or the text or binary file object. Compressed files
+            of gzip, bz2 and xz are decompressed transparently.
+        :param batch_size: The number of lines to load at once by `load_many`.
+        :param error_callback: See `iter_load`.
+        """
+        from .jsonl import JSONLines  # pylint: disable=import-outside-toplevel
+        return self._get_codec(JSONLines, only, exclude).iter_load(
+            file, raise_error, batch_size, error_callback)
+
+    def dump_jsonl(
+            self, data: Iterable, file,
+            only: Iterable[str] = None, exclude: Iterable[str] = None):
+        """Serialize objects one by one and write them as JSON Lines to the path or
+        file object. The file is compressed if the path ends with ".gz", ".bz2",
+        ".xz" or ".lzma". Raise `ValidationError` keyed by index if any object is
+        invalid, the objects before it have been written.
+        """
+        from .jsonl import JSONLines  # pylint: disable=import-outside-toplevel
+        self._get_codec(JSONLines, only, exclude).dump(data, file)
+
+    def validate_jsonl(
+            self, path, workers: int = None, output_dir: str = None, range_size: int = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> 'ValidationReport':
+        """Load all lines of a large local JSON Lines file on worker processes, and
+        return the report with the formatted errors keyed by line numbers.
+
+        The file is mapped into memory and split at newlines into byte ranges, the
+        workers read and load the lines of their ranges, so the lines and results
+        are not pickled. The process pool is the same as `load_many`.
+        If `all_errors` is False, the lines after the first invalid one are skipped.
+
+        :param workers: The number of worker processes, default to the number of CPUs.
+        :param output_dir: If given, the valid lines are copied to the files
+            "part-00000.jsonl", "part-00001.jsonl", ... in the directory, one file
+            for each range, the files in order contain the valid lines in order.
+        :param range_size: The number of bytes of each range. If not given, each
+            worker gets several ranges, and each range has at least 1 MiB.
+        """
+        if not self._frozen:
+            self._freeze()
+        from .jsonl import validate_file  # pylint: disable=import-outside-toplevel
+        return validate_file(self, path, workers, output_dir, range_size, only, exclude)
+
+
+class TableMixin:
+    """The methods of `Catalyst` to read and write rows, columns and CSV."""
+
+    def load_columns(
+            self, data: Mapping[str, Iterable], raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            rows: bool = False) -> LoadResult:
+        """Deserialize column-oriented data, which maps keys of fields to sequences
+        of values, such as ``{"price": [...], "qty": [...]}``. Each field loads its
+        column in a loop, without transposing columns to dicts of rows. The result
+        is the same as `load_many` with the rows, and errors are keyed by indexes of
+        rows, but `valid_data` maps names of fields to lists of values, where invalid
+        and missing values are None, and columns without any value are omitted.
+        Catalysts with field groups or custom processes load the rows by `load_many`.
+
+        :param rows: Whether `valid_data` is a list of dicts like `load_many`.
+        """
+        from .columns import ColumnReader  # pylint: disable=import-outside-toplevel
+        return self._get_codec(ColumnReader, only, exclude).load(data, raise_error, rows)
+
+    def dump_rows(
+            self, data: Iterable, columns: Iterable[str] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> Iterator[tuple]:
+        """Serialize objects one by one lazily, and yield tuples of values in the order
+        of `columns`, which are the keys of fields, default to all the dump fields in
+        the order of declaration. The missing values are None. Raise `ValidationError`
+        keyed by index if any object is invalid. The rows can be inserted in batches::
+
+            from catalyst.formats.rows import executemany
+
+            rows = catalyst.dump_rows(users, columns=['id', 'name'])
+            executemany(cursor, 'INSERT INTO user (id, name) VALUES (?, ?)', rows)
+        """
+        from .rows import RowWriter  # pylint: disable=import-outside-toplevel
+        return self._get_codec(RowWriter, only, exclude).iter_rows(data, columns)
+
+    def dump_columns(
+            self, data: Iterable,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> dict:
+        """Serialize objects to columns of NumPy arrays, which is a dict of keys of
+        fields and `ArrayColumn(values, valid)`. The arrays of `IntegerField`,
+        `FloatField` and `BooleanField` have the dtypes of int64, float64 and bool,
+        the arrays of `DatetimeField` and `DateField` are datetime64 in UTC, and
+        the others are arrays of objects. `valid` is False for missing and None values.
+        Each field dumps its column without making dicts of objects, and catalysts
+        with field groups or custom processes dump the objects by `dump_many`.
+        Raise `ValidationError` keyed by index if any object is invalid.
+        """
+        # NumPy is imported on first use
+        from .arrays import ArrayWriter  # pylint: disable=import-outside-toplevel
+        return self._get_codec(ArrayWriter, only, exclude).dump(data)
+
+    def load_csv(
+            self, file, raise_error: bool = None, chunk_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            columns: Iterable[str] = None, encoding: str = 'utf-8', **fmtparams,
+    ) -> Iterator[Tuple[int, LoadResult]]:
+        """Deserialize rows of CSV lazily, like `iter_load`. The columns are mapped
+        to keys of fields once, and the rows are loaded by positions without
+        building dicts. Errors are keyed by indexes of rows, the header is not counted.
+        The empty cells of fields other than `StringField` are loaded as None, or
+        missing if the fields don't allow None, so the results of `dump_csv` load back.
+
+        :param file: The path or the text or binary file object, text files should be
+            opened with ``newline=''``. Compressed files are decompressed transparently.
+        :param columns: The names of columns, if not given, the first row is the header.
+        :param encoding: The encoding of binary files.
+        :param fmtparams: The format parameters of `csv.reader`, such as `delimiter`.
+        """
+        from .csv import CSVReader  # pylint: disable=import-outside-toplevel
+        return self._get_codec(CSVReader, only, exclude).iter_load(
+            file, raise_error, chunk_size, error_callback, columns, encoding, **fmtparams)
+
+    def dump_csv(
+            self, data: Iterable, file,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            columns: Iterable[str] = None, header: bool = True,
+            encoding: str = 'utf-8', **fmtparams):
+        """Serialize objects one by one and write them as rows of CSV to the path or
+        file object. The file is compressed according to the extension of path, see
+        `dump_jsonl`. Raise `ValidationError` keyed by index if any object is invalid.
+
+        :param columns: The keys of fields to write, default to all the dump fields
+            in the order of declaration. The missing values are written as "".
+        :param header: Whether to write the columns as the first row.
+        :param fmtparams: The format parameters of `csv.writer`.
+        """
+        from .csv import CSVWriter  # pylint: disable=import-outside-toplevel
+        self._get_codec(CSVWriter, only, exclude).dump(
+            data, file, columns, header, encoding, **fmtparams)
+
+
+class BinaryMixin:
+    """The methods of `Catalyst` to read and write the binary format and `struct` records."""
+
+    def dump_binary(
+            self, data: Any, only: Iterable[str] = None, exclude: Iterable[str] = None) -> bytes:
+        """Serialize `data` to the compact binary format, which encodes the values
+        by positions and types of fields without keys, see `catalyst.formats.binary`.
+        The bytes can be loaded by `load_binary` of the catalyst with the same fields.
+        Datetimes keep the microseconds and time zones which `fmt` of the fields drops.
+        Raise `ValidationError` if `data` is invalid.
+        """
+        # NumPy is imported on first use, which is used by `ArrayField`
+        from .binary import BinaryCodec  # pylint: disable=import-outside-toplevel
+        return self._get_codec(BinaryCodec, only, exclude).dumps(data)
+
+    def dump_many_binary(
+            self, data: Iterable, file=None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> Optional[bytes]:
+        """Serialize multiple objects to a binary stream. If `file` is given, write the
+        objects one by one to the path or binary file object, and return None. Paths
+        ending with ".gz", ".bz2" or ".xz" are compressed.
+        Raise `ValidationError` keyed by index if any object is invalid.
+        """
+        from .binary import BinaryCodec  # pylint: disable=import-outside-toplevel
+        codec = self._get_codec(BinaryCodec, only, exclude)
+        if file is None:
+            return codec.dumps_many(data)
+        codec.dump_many(data, file)
+        return None
+
+    def load_binary(
+            self, data, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> LoadResult:
+        """Decode bytes of `dump_binary` and deserialize the object. If the bytes are
+        malformed, the error is in the result like other errors of `load`.
+        """
+        from .binary import BinaryCodec  # pylint: disable=import-outside-toplevel
+        return self._get_codec(BinaryCodec, only, exclude).loads(data, raise_error)
+
+    def load_many_binary(
+            self, data, raise_error: bool = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> LoadResult:
+        """Decode the binary stream of `dump_many_binary` and deserialize the objects.
+        `data` is bytes, or the path or binary file object which is read one record
+        at a time. Decoding stops at the first invalid object if `all_errors` is False.
+        """
+        from .binary import BinaryCodec  # pylint: disable=import-outside-toplevel
+        return self._get_codec(BinaryCodec, only, exclude).loads_many(data, raise_error)
+
+    def load_struct(
+            self, file, fmt: str, raise_error: bool = None, chunk_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            columns: Iterable[str] = None) -> Iterator[Tuple[int, LoadResult]]:
+        """Deserialize fixed-width binary records lazily, like `iter_load`. The records
+        are packed by the `struct` format `fmt`, and the items are the values of
+        `columns`, which are the keys of fields, default to all the load fields in
+        the order of declaration. Errors are keyed by indexes of records. The raw values
+        of datetime and decimal fields are converted, see `catalyst.formats.structs`::
+
+            class TelemetryCatalyst(Catalyst):
+                time = DatetimeField()
+                value = DecimalField(places=2)
+
+            # int64 seconds and int32 hundredths
+            for i, result in catalyst.load_struct('telemetry.bin', '<qi', chunk_size=10000):
+                ...
+
+        :param file: The path or the binary file object, which is mapped into memory
+            and unpacked without copying, or bytes-like objects.
+        """
+        from .structs import StructCodec  # pylint: disable=import-outside-toplevel
+        return self._get_codec(StructCodec, only, exclude).iter_load(
+            file, fmt, raise_error, chunk_size, error_callback, columns)
+
+    def dump_struct(
+            self, data: Iterable, fmt: str, file=None, columns: Iterable[str] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None) -> Optional[bytearray]:
+        """Serialize objects to fixed-width binary records, which are packed by
+        `struct.pack_into` into a preallocated bytearray. See `load_struct` for `fmt`
+        and `columns`, the default columns are the dump fields. If `file` is given,
+        write the records to the path or binary file object in blocks, and return
+        None. Raise `ValidationError` keyed by index if any object is invalid or can't
+        be packed, such as the object with missing values.
+        """
+        from .structs import StructCodec  # pylint: disable=import-outside-toplevel
+        codec = self._get_codec(StructCodec, only, exclude)
+        if file is None:
+            return codec.dumps(data, fmt, columns)
+        codec.dump(data, file, fmt, columns)
+        return None
+
+
+class FormatMixin(JSONMixin, TableMixin, BinaryMixin):
+    """The methods of `Catalyst` to process objects lazily, and read and write data
+    formats. The readers and writers are got by `_get_codec`, and the modules of
+    formats are imported on first use, so importing `catalyst` doesn't import them.
+    """
+
+    def iter_dump(
+            self, data: Iterable, raise_error: bool = None, chunk_size: int = None,
+            error_callback: Callable[[int, DumpResult], Any] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+    ) -> Iterator[Tuple[int, DumpResult]]:
+        """Serialize objects from an iterable lazily, without keeping all results
+        in memory. Yield the index and result of each object, or the index of the
+        first object and result of each chunk, if `chunk_size` is given.
+
+        :param chunk_size: The number of objects to process at once, `pre_dump_many`
+            and `post_dump_many` are called for each chunk, and the indexes in
+            errors are indexes in `data`.
+        :param error_callback: If given, the invalid results are passed to it with
+            the index, instead of being yielded. The yielded chunks only contain
+            the valid objects.
+        """
+        return self._iter_process(
+            'dump', data, raise_error, chunk_size, error_callback, only, exclude)
+
+    def iter_load(
+            self, data: Iterable, raise_error: bool = None, chunk_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+            only: Iterable[str] = None, exclude: Iterable[str] = None,
+            columns: Iterable = None) -> Iterator[Tuple[int, LoadResult]]:
+        """Deserialize objects from an iterable lazily. See `iter_dump` for the
+        usage of arguments, and `load` for loading rows with `columns`.
+        """
+        return self._iter_process(
+            'load', data, raise_error, chunk_size, error_callback, only, exclude, columns)
+
+    def _iter_process(
+            self, name: str, data: Iterable, raise_error: Optional[bool],
+            chunk_size: Optional[int], error_callback: Optional[Callable],
+            only: Optional[Iterable[str]], exclude: Optional[Iterable[str]],
+            columns: Optional[Iterable] = None) -> Iterator:
+        """Check arguments and create the generator of results."""
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Argument "chunk_size" must be a positive integer.')
+        if not self._frozen:
+            self._freeze()
+        catalyst = self
+        if only is not None or exclude is not None:
+            catalyst = self._get_projection(only, exclude)
+        if raise_error is None:
+            raise_error = self.raise_error
+        process = None
+        if columns is not None:
+            processors = catalyst._get_row_processors(column_names(columns))
+            process = processors[0] if chunk_size is None else processors[1]
+        return catalyst._generate_results(
+            name, iter(data), raise_error, chunk_size, error_callback, process)
+
+    def _generate_results(
+            self, name: str, iterator: Iterator, raise_error: bool,
+            chunk_size: Optional[int], error_callback: Optional[Callable],
+            process: Callable = None) -> Iterator:
+        """Process the objects one by one or in chunks, `process` is the processor
+        of one object or many objects, default to `_do_<name>` or `_do_<name>_many`.
+        """
+        if process is None:
+            if chunk_size is None:
+                process = getattr(self, f'_do_{name}')
+            else:
+                process = getattr(self, f'_do_{name}_many')
+        result_class = getattr(self, f'{name}_result_class')
+
+        offset = 0
+        while True:
+            if chunk_size is None:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                result = process(item, raise_error=False)
+                size = 1
+            else:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    return
+                result = process(chunk, raise_error=False)
+                size = len(chunk)
+                if result.errors and offset:
+                    # shift indexes of the chunk to indexes of the whole data
+                    result.errors, result.invalid_data = (
+                        {k + offset if isinstance(k, int) else k: v for k, v in d.items()}
+                        for d in (result.errors, result.invalid_data))
+
+            if not result.errors:
+                yield offset, result
+            elif raise_error:
+                raise ValidationError(msg=result.format_errors(), detail=result)
+            elif error_callback is None:
+                yield offset, result
+            else:
+                error_callback(offset, result)
+                if chunk_size is not None:
+                    valid_data = [
+                        value for i, value in enumerate(result.valid_data, offset)
+                        if i not in result.errors]
+                    yield offset, result_class(valid_data, {}, {})
+
+            if result.errors and not self.all_errors:
+                return
+            offset += size
+
+    def _get_codec(
+            self, codec_class: type,
+            only: Optional[Iterable[str]], exclude: Optional[Iterable[str]]):
+        """Get the reader or writer of data format for the selected fields,
+        which is created on first use and kept by the catalyst.
+        """
+        if not self._frozen:
+            self._freeze()
+        catalyst = self
+        if only is not None or exclude is not None:
+            catalyst = self._get_projection(only, exclude)
+        codecs = catalyst.__dict__.setdefault('_codecs', {})
+        codec = codecs.get(codec_class)
+        if codec is None:
+            codec = codecs[codec_class] = codec_class(catalyst)
+        return codec
@@ -0,0 +1,222 @@
+"""Dump objects to columns of NumPy arrays, which are made from lists of values
+of each field, without making a dict for each object.
+
+NumPy is optional, it's imported when this module is imported, and the writer
+raises `ImportError` if it's not installed.
+"""
+
+import datetime
+from collections import namedtuple
+from functools import partial
+from typing import Callable, Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from ..base import CatalystABC
+from ..compiler import distribute_field_error
+from ..exceptions import ValidationError
+from ..fields import (
+    BooleanField, DateField, DatetimeField, DecimalField, Field, FloatField, IntegerField,
+    TimeField,
+)
+from ..fields.array import ArrayField
+from ..utils import missing
+
+ArrayColumn = namedtuple('ArrayColumn', ['values', 'valid'])
+ArrayColumn.__doc__ = """A column of dumped values.
+
+:param values: The array of values, the invalid items are 0, False, NaN or NaT,
+    or None for arrays of objects.
+:param valid: The boolean array, which is False if the value is missing or None.
+"""
+
+
+# the dtypes of the dumped values of fields, which are checked in order
+FIELD_DTYPES = (
+    (TimeField, None),
+    (DateField, 'datetime64[D]'),
+    (DatetimeField, 'datetime64[us]'),
+    (BooleanField, 'bool'),
+    (IntegerField, 'int64'),
+    (DecimalField, None),
+    (FloatField, 'float64'),
+)
+
+
+def column_dtype(field: Field):
+    """Return the NumPy dtype of the dumped values of the field, or None if the
+    values are Python objects. The arrays of `ArrayField` with fixed shape are
+    stacked to a multidimensional array.
+    """
+    if isinstance(field, ArrayField):
+        if field.shape is None or None in field.shape:
+            return None
+        return field.dtype
+    for field_class, dtype in FIELD_DTYPES:
+        if isinstance(field, field_class):
+            return dtype
+    return None
+
+
+# the values of invalid items of arrays
+FILL_VALUES = {'bool': False, 'int64': 0, 'float64': float('nan')}
+
+
+def _to_naive_utc(value):
+    # NumPy doesn't support aware datetime
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def dump_raw(field: Field, convert: Callable) -> Callable:
+    """Make the function like `field.dump`, which converts the value by `convert`
+    instead of formatting it, such as keeping the datetime objects.
+    """
+    validate, is_none, dump_none = field.validate_dump, field.is_none, field.dump_none
+
+    def dump(value):
+        validate(value)
+        if is_none(value):
+            return dump_none
+        return convert(value)
+    return dump
+
+
+def to_array(values: List, dtype) -> ArrayColumn:
+    """Make the column from the list of values, the values which are `missing`
+    or None are invalid. If the values can't be converted to `dtype`, such as
+    strings of formatted values, the array is made of objects.
+    """
+    size = len(values)
+    valid = np.fromiter(
+        (value is not missing and value is not None for value in values), bool, size)
+    if dtype is not None:
+        fill = FILL_VALUES.get(dtype)
+        items = values if valid.all() else [
+            value if is_valid else fill for value, is_valid in zip(values, valid.tolist())]
+        try:
+            return ArrayColumn(np.array(items, dtype=dtype), valid)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    array = np.empty(size, dtype=object)
+    # assign items one by one, so lists are not converted to dimensions of the array
+    for i, value in enumerate(values):
+        if value is not missing:
+            array[i] = value
+    return ArrayColumn(array, valid)
+
+
+class ArrayWriter:
+    """Dump objects by a catalyst to columns of NumPy arrays.
+
+    :param catalyst: The catalyst to dump objects.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        if np is None:
+            raise ImportError('NumPy is required to dump columns of arrays.')
+        self.catalyst = catalyst
+        # the fields can't process columns if there are field groups or custom processes
+        get_plan = getattr(catalyst, '_get_inline_plan', None)
+        self.plan = None if get_plan is None else get_plan('dump', True)
+        if self.plan is not None and self.plan.partial_groups:
+            self.plan = None
+        self.fields = {
+            field.key: field for field in catalyst._dump_fields.values()
+            if isinstance(field, Field)}
+
+    def dump(self, data: Iterable) -> Dict[str, ArrayColumn]:
+        """Dump the objects to columns, see `Catalyst.dump_columns`."""
+        if self.plan is None:
+            columns = self._dump_rows(data)
+        else:
+            columns = self._dump_columns(data)
+        fields = self.fields
+        return {
+            key: to_array(values, column_dtype(fields[key]))
+            for key, values in columns.items()}
+
+    def _raise(self, valid_data, errors: dict, invalid_data: dict):
+        result = self.catalyst.dump_result_class(valid_data, errors, invalid_data)
+        raise ValidationError(msg=result.format_errors(), detail=result)
+
+    def _dump_rows(self, data: Iterable) -> Dict[str, list]:
+        """Dump the objects by `dump_many` and collect the values of each key."""
+        result = self.catalyst._do_dump_many(data, raise_error=False)
+        if result.errors:
+            self._raise(result.valid_data, result.errors, result.invalid_data)
+        rows = result.valid_data
+        columns = {}
+        for key, field in self.fields.items():
+            values = [row.get(key, missing) for row in rows]
+            if isinstance(field, DatetimeField) and column_dtype(field) is not None:
+                # parse the formatted values back to datetime objects
+                try:
+                    values = [
+                        value if value is missing or value is None
+                        else _to_naive_utc(field.parse(value)) for value in values]
+                except (TypeError, ValueError):
+                    pass
+            if any(value is not missing for value in values):
+                columns[key] = values
+        return columns
+
+    def _dump_columns(self, data: Iterable) -> Dict[str, list]:
+        """Get the values of all objects, and dump the values of each field."""
+        plan = self.plan
+        all_errors, except_exception = plan.all_errors, plan.except_exception
+        get_values = plan.get_values
+        rows = [get_values(obj) for obj in data]
+        get_errors = [errors for _, errors in rows]
+
+        columns: Dict[str, list] = {}
+        errors: Dict[int, dict] = {}
+        invalid_data: Dict[int, dict] = {}
+        for j, (field, source, target, required, default, field_method) in enumerate(
+                plan.partial_fields):
+            if isinstance(field, ArrayField):
+                field_method = dump_raw(field, partial(np.asarray, dtype=field.dtype))
+            elif column_dtype(field) in ('datetime64[D]', 'datetime64[us]'):
+                field_method = dump_raw(field, _to_naive_utc)
+            column = [values[j] for values, _ in rows]
+            if not any(value is missing for value in column):
+                # process the whole column at once, unless any value is missing or invalid
+                try:
+                    result = [field_method(value) for value in column]
+                except except_exception:
+                    pass
+                else:
+                    if not any(value is missing for value in result):
+                        columns[target] = result
+                        continue
+
+            result = []
+            append = result.append
+            for i, value in enumerate(column):
+                try:
+                    if value is missing:
+                        # raise the error occurred when getting value
+                        if get_errors[i] is not None and source in get_errors[i]:
+                            raise get_errors[i][source]
+                        value = default() if callable(default) else default
+                    if value is not missing:
+                        value = field_method(value)
+                    if value is missing and required:
+                        raise field.error('required')
+                    append(value)
+                except except_exception as e:
+                    distribute_field_error(
+                        e, source, target, value, {},
+                        errors.setdefault(i, {}), invalid_data.setdefault(i, {}))
+                    if not all_errors:
+                        self._raise(columns, errors, invalid_data)
+                    append(missing)
+            if any(value is not missing for value in result):
+                columns[target] = result
+
+        if errors:
+            self._raise(columns, errors, invalid_data)
+        return columns
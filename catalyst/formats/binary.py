@@ -0,0 +1,905 @@
+"""Compact binary format of objects, which is encoded by the fields of catalysts.
+
+The fields of a catalyst are known, so the values are encoded by positions of
+fields without keys. A record consists of:
+
+- the bitmap of fields whose values exist, and the bitmap of values which are None,
+  each bitmap has one bit per field, in the order of fields
+- the values which exist and are not None, encoded by the types of fields:
+  integers are zigzag varints, floats are 8 bytes, strings and bytes are prefixed
+  with varint lengths, decimals are coefficients with signs and exponents,
+  datetimes are microseconds since the epoch, nested catalysts are records,
+  and lists are prefixed with their lengths and bitmaps of None items
+- the number of the other keys, such as the keys added by `post_dump`, and the
+  pairs of keys and values, which are encoded with tags of types
+
+The values of fields with customized `format` or `dump_none` are also encoded with
+tags of types. The values of datetime, date and time fields are encoded as objects
+instead of the strings formatted by `fmt`, so the microseconds and time zones which
+`fmt` drops are kept on purpose, and ``load_binary(dump_binary(obj))`` may differ
+from ``load(dump(obj))`` by them. The data starts with a header of the magic byte, the version and
+the checksum of the layout of fields, so it can't be decoded by other catalysts.
+A stream of records has one header, and each record is prefixed with its length.
+
+Decoding a record makes the dict of keys of fields, which is loaded by the catalyst.
+"""
+
+import datetime
+import decimal
+import struct
+import zlib
+from contextlib import closing
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..base import CatalystABC
+from ..compiler import is_default_nested_field
+from ..exceptions import ValidationError
+from ..fields import (
+    BooleanField, DateField, DatetimeField, DecimalField, Field, FloatField, IntegerField,
+    ListField, NestedField, StringField, TimeField,
+)
+from ..fields.array import ArrayField, np
+from ..utils import LoadResult, missing, no_processing
+from .files import PathOrFile, open_input, open_output
+
+
+MAGIC = b'\xcb'
+VERSION = 2
+HEADER_SIZE = 6
+
+# the number of bytes to collect before writing to file
+BUFFER_SIZE = 1 << 16
+
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+_double = struct.Struct('<d')
+
+Buffer = Union[bytes, bytearray, memoryview]
+Writer = Callable[[bytearray, Any], None]
+Reader = Callable[[bytes, int], Tuple[Any, int]]
+
+
+class BinaryDecodeError(ValueError):
+    """The data is malformed, or encoded by another catalyst."""
+
+
+def write_varint(out: bytearray, n: int):
+    if n < 0x80:
+        out.append(n)
+        return
+    while n > 0x7f:
+        out.append(n & 0x7f | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    byte = buf[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+    n, shift = byte & 0x7f, 7
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def write_int(out: bytearray, n: int):
+    if not isinstance(n, int):
+        raise TypeError(f'Integer is required, not {type(n).__name__}.')
+    if 0 <= n < 0x40:
+        out.append(n << 1)
+        return
+    # zigzag encoding, small negative integers are short
+    write_varint(out, n << 1 if n >= 0 else (-n << 1) - 1)
+
+
+def read_int(buf: bytes, pos: int) -> Tuple[int, int]:
+    n, pos = read_varint(buf, pos)
+    return (n >> 1) ^ -(n & 1), pos
+
+
+def write_float(out: bytearray, value: float):
+    out += _double.pack(value)
+
+
+def read_float(buf: bytes, pos: int) -> Tuple[float, int]:
+    return _double.unpack_from(buf, pos)[0], pos + 8
+
+
+def write_bool(out: bytearray, value: bool):
+    out.append(1 if value else 0)
+
+
+def read_bool(buf: bytes, pos: int) -> Tuple[bool, int]:
+    return buf[pos] != 0, pos + 1
+
+
+def write_bytes(out: bytearray, value: bytes):
+    write_varint(out, len(value))
+    out += value
+
+
+def read_bytes(buf: bytes, pos: int) -> Tuple[bytes, int]:
+    size, pos = read_varint(buf, pos)
+    end = pos + size
+    if end > len(buf):
+        raise IndexError('bytes out of range')
+    return buf[pos:end], end
+
+
+def write_str(out: bytearray, value: str):
+    if not isinstance(value, str):
+        raise TypeError(f'String is required, not {type(value).__name__}.')
+    write_bytes(out, value.encode('utf-8'))
+
+
+def read_str(buf: bytes, pos: int) -> Tuple[str, int]:
+    value, pos = read_bytes(buf, pos)
+    return value.decode('utf-8'), pos
+
+
+def write_decimal(out: bytearray, value: decimal.Decimal):
+    if not isinstance(value, decimal.Decimal):
+        # the float dumped by `dump_as`, or the string
+        value = decimal.Decimal(repr(value) if isinstance(value, float) else value)
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f'Decimal "{value}" is not finite.')
+    # the sign is the lowest bit, which keeps the sign of zero, such as "-0.00"
+    coefficient = int(''.join(map(str, digits)))
+    write_varint(out, coefficient << 1 | sign)
+    write_int(out, exponent)
+
+
+def read_decimal(buf: bytes, pos: int) -> Tuple[decimal.Decimal, int]:
+    n, pos = read_varint(buf, pos)
+    exponent, pos = read_int(buf, pos)
+    # the constructor of string is exact
+    return decimal.Decimal(f'{"-" if n & 1 else ""}{n >> 1}E{exponent}'), pos
+
+
+def _write_offset(out: bytearray, offset: Optional[datetime.timedelta]):
+    # 0 is naive, otherwise the zigzag seconds of UTC offset plus 1
+    if offset is None:
+        out.append(0)
+    else:
+        seconds = offset.days * 86400 + offset.seconds
+        write_varint(out, (seconds << 1 if seconds >= 0 else (-seconds << 1) - 1) + 1)
+
+
+def _read_offset(buf: bytes, pos: int) -> Tuple[Optional[datetime.timezone], int]:
+    n, pos = read_varint(buf, pos)
+    if n == 0:
+        return None, pos
+    n -= 1
+    return datetime.timezone(datetime.timedelta(seconds=(n >> 1) ^ -(n & 1))), pos
+
+
+def write_datetime(out: bytearray, value: datetime.datetime):
+    if not isinstance(value, datetime.datetime):
+        raise TypeError(f'Datetime is required, not {type(value).__name__}.')
+    _write_offset(out, value.utcoffset())
+    delta = value.replace(tzinfo=None) - EPOCH
+    write_int(out, (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+
+def read_datetime(buf: bytes, pos: int) -> Tuple[datetime.datetime, int]:
+    tz, pos = _read_offset(buf, pos)
+    microseconds, pos = read_int(buf, pos)
+    value = EPOCH + datetime.timedelta(microseconds=microseconds)
+    if tz is not None:
+        value = value.replace(tzinfo=tz)
+    return value, pos
+
+
+def write_date(out: bytearray, value: datetime.date):
+    if not isinstance(value, datetime.date):
+        raise TypeError(f'Date is required, not {type(value).__name__}.')
+    write_int(out, value.toordinal() - EPOCH_ORDINAL)
+
+
+def read_date(buf: bytes, pos: int) -> Tuple[datetime.date, int]:
+    days, pos = read_int(buf, pos)
+    return datetime.date.fromordinal(days + EPOCH_ORDINAL), pos
+
+
+def write_time(out: bytearray, value: datetime.time):
+    if not isinstance(value, datetime.time):
+        raise TypeError(f'Time is required, not {type(value).__name__}.')
+    _write_offset(out, value.utcoffset())
+    write_varint(out, (
+        (value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond)
+
+
+def read_time(buf: bytes, pos: int) -> Tuple[datetime.time, int]:
+    tz, pos = _read_offset(buf, pos)
+    microseconds, pos = read_varint(buf, pos)
+    seconds, microsecond = divmod(microseconds, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return datetime.time(hour, minute, second, microsecond, tz), pos
+
+
+# tags of types of values which are not encoded by fields
+TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_FLOAT, TAG_STR, TAG_BYTES, TAG_LIST, \
+    TAG_DICT, TAG_DECIMAL, TAG_DATETIME, TAG_DATE, TAG_TIME = range(13)
+
+
+def write_any(out: bytearray, value):
+    """Write the value with the tag of its type."""
+    if value is None:
+        out.append(TAG_NONE)
+    elif value is True or value is False:
+        out.append(TAG_TRUE if value else TAG_FALSE)
+    elif isinstance(value, int):
+        out.append(TAG_INT)
+        write_int(out, value)
+    elif isinstance(value, float):
+        out.append(TAG_FLOAT)
+        write_float(out, value)
+    elif isinstance(value, str):
+        out.append(TAG_STR)
+        write_str(out, value)
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(TAG_BYTES)
+        write_bytes(out, value)
+    elif isinstance(value, (list, tuple)):
+        out.append(TAG_LIST)
+        write_varint(out, len(value))
+        for item in value:
+            write_any(out, item)
+    elif isinstance(value, dict):
+        out.append(TAG_DICT)
+        write_varint(out, len(value))
+        for key, item in value.items():
+            write_any(out, key)
+            write_any(out, item)
+    elif isinstance(value, decimal.Decimal):
+        out.append(TAG_DECIMAL)
+        write_str(out, str(value))
+    elif isinstance(value, datetime.datetime):
+        out.append(TAG_DATETIME)
+        write_datetime(out, value)
+    elif isinstance(value, datetime.date):
+        out.append(TAG_DATE)
+        write_date(out, value)
+    elif isinstance(value, datetime.time):
+        out.append(TAG_TIME)
+        write_time(out, value)
+    else:
+        raise TypeError(f'Object of type {type(value).__name__} is not binary serializable.')
+
+
+def read_any(buf: bytes, pos: int) -> Tuple[Any, int]:
+    """Read the value written by `write_any`."""
+    tag = buf[pos]
+    pos += 1
+    if tag == TAG_NONE:
+        return None, pos
+    if tag in (TAG_FALSE, TAG_TRUE):
+        return tag == TAG_TRUE, pos
+    if tag == TAG_LIST:
+        size, pos = read_varint(buf, pos)
+        items = []
+        for _ in range(size):
+            item, pos = read_any(buf, pos)
+            items.append(item)
+        return items, pos
+    if tag == TAG_DICT:
+        size, pos = read_varint(buf, pos)
+        items = {}
+        for _ in range(size):
+            key, pos = read_any(buf, pos)
+            items[key], pos = read_any(buf, pos)
+        return items, pos
+    if tag == TAG_DECIMAL:
+        value, pos = read_str(buf, pos)
+        return decimal.Decimal(value), pos
+    try:
+        read = _TAG_READERS[tag]
+    except KeyError:
+        raise BinaryDecodeError(f'Unknown tag {tag} at position {pos - 1}.') from None
+    return read(buf, pos)
+
+
+_TAG_READERS: Dict[int, Reader] = {
+    TAG_INT: read_int,
+    TAG_FLOAT: read_float,
+    TAG_STR: read_str,
+    TAG_BYTES: read_bytes,
+    TAG_DATETIME: read_datetime,
+    TAG_DATE: read_date,
+    TAG_TIME: read_time,
+}
+
+
+def _bitmap(items: list) -> int:
+    bits = 0
+    for i, item in enumerate(items):
+        if item is None:
+            bits |= 1 << i
+    return bits
+
+
+def make_list_writer(write_item: Writer) -> Writer:
+    """Make the writer of lists, the length and the bitmap of None items are
+    written before the items which are not None.
+    """
+    def write_list(out: bytearray, value):
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f'List is required, not {type(value).__name__}.')
+        size = len(value)
+        write_varint(out, size)
+        bits = _bitmap(value) if any(item is None for item in value) else 0
+        out += bits.to_bytes((size + 7) // 8, 'little')
+        for item in value:
+            if item is not None:
+                write_item(out, item)
+    return write_list
+
+
+def make_list_reader(read_item: Reader) -> Reader:
+    def read_list(buf: bytes, pos: int) -> Tuple[list, int]:
+        size, pos = read_varint(buf, pos)
+        end = pos + (size + 7) // 8
+        bits = int.from_bytes(buf[pos:end], 'little')
+        pos = end
+        items = []
+        append = items.append
+        for i in range(size):
+            if bits >> i & 1:
+                append(None)
+            else:
+                item, pos = read_item(buf, pos)
+                append(item)
+        return items, pos
+    return read_list
+
+
+def make_array_codec(dtype) -> Tuple[Writer, Reader]:
+    """Make the writer and reader of NumPy arrays, the dimensions and the sizes of
+    dimensions are written before the bytes of items.
+    """
+    itemsize = dtype.itemsize
+
+    def write_array(out: bytearray, value):
+        array = np.asarray(value, dtype=dtype)
+        write_varint(out, array.ndim)
+        for size in array.shape:
+            write_varint(out, size)
+        out += array.tobytes()
+
+    def read_array(buf: bytes, pos: int):
+        ndim, pos = read_varint(buf, pos)
+        shape = []
+        count = 1
+        for _ in range(ndim):
+            size, pos = read_varint(buf, pos)
+            shape.append(size)
+            count *= size
+        end = pos + count * itemsize
+        if end > len(buf):
+            raise IndexError('array out of range')
+        return np.frombuffer(buf, dtype, count, pos).reshape(shape), end
+    return write_array, read_array
+
+
+def _with_parser(write: Writer, parse: Callable) -> Writer:
+    """Write the formatted value, such as the string of `DatetimeField`, after
+    parsing it by the field.
+    """
+    def write_value(out: bytearray, value):
+        if isinstance(value, str):
+            value = parse(value)
+        write(out, value)
+    return write_value
+
+
+def _raw_dump(field: Field, convert: Callable) -> Callable:
+    """Make the function like `field.dump`, which converts the value by `convert`
+    instead of formatting it, such as keeping the datetime objects.
+    """
+    validate, is_none, dump_none = field.validate_dump, field.is_none, field.dump_none
+
+    def dump(value):
+        validate(value)
+        if is_none(value):
+            return dump_none
+        return convert(value)
+    return dump
+
+
+def _is_default_format(field: Field, cls: type) -> bool:
+    """Whether the dumping of the field is the same as `cls`."""
+    fused_processors = field.__dict__.get('_fused_processors', ())
+    for attr in ('dump', 'format'):
+        if getattr(type(field), attr) is not getattr(cls, attr):
+            return False
+        method = field.__dict__.get(attr)
+        if method is not None and not any(method is p for p in fused_processors):
+            return False
+    return True
+
+
+# field classes whose dumped values are encoded by types, subclasses go first
+FIELD_CODES = (
+    (BooleanField, 'b'),
+    (IntegerField, 'i'),
+    (DecimalField, 'D'),
+    (FloatField, 'f'),
+    (StringField, 's'),
+    (TimeField, 'T'),
+    (DateField, 'd'),
+    (DatetimeField, 't'),
+    (NestedField, 'n'),
+    (ListField, 'l'),
+    (ArrayField, 'a'),
+)
+
+SIMPLE_CODECS: Dict[str, Tuple[Writer, Reader]] = {
+    'b': (write_bool, read_bool),
+    'i': (write_int, read_int),
+    'D': (write_decimal, read_decimal),
+    'f': (write_float, read_float),
+    's': (write_str, read_str),
+    'T': (write_time, read_time),
+    'd': (write_date, read_date),
+    't': (write_datetime, read_datetime),
+    'g': (write_any, read_any),
+}
+
+
+def _to_decimal(field: DecimalField):
+    def convert(value):
+        value = field.to_decimal(value)
+        if value.is_finite():
+            return field.quantize(value)
+        return field.dump_none
+    return convert
+
+
+def _check_type(obj_type: type):
+    def convert(value):
+        if not isinstance(value, obj_type):
+            raise TypeError(f'{obj_type.__name__} is required, not {type(value).__name__}.')
+        return value
+    return convert
+
+
+class _Layout:
+    """The fields of a catalyst in the order of encoding, and the functions to
+    write and read records.
+    """
+    def __init__(self):
+        self.keys: List[str] = []
+        self.fields: List[Field] = []
+        self.codes: List[str] = []
+        self.writers: List[Writer] = []
+        self.readers: List[Reader] = []
+        # the description of types of fields, for the checksum of layout
+        self.description = '@'
+        self.size = 0
+        self.all_present = 0
+        self.entries: List[Tuple[str, int, Reader]] = []
+        self.pairs: List[Tuple[str, Reader]] = []
+        # the writer from objects by fields, or None if the catalyst is customized
+        self.write_object: Optional[Writer] = None
+
+    def write_dict(self, out: bytearray, data: dict):
+        """Write the record of the dumped dict."""
+        present = nulls = count = 0
+        # the bitmaps are written after the values
+        size = (len(self.keys) + 7) // 8
+        mark = len(out)
+        out += bytes(size * 2)
+        for i, (key, write) in enumerate(zip(self.keys, self.writers)):
+            value = data.get(key, missing)
+            if value is missing:
+                continue
+            count += 1
+            present |= 1 << i
+            if value is None:
+                nulls |= 1 << i
+            else:
+                write(out, value)
+        out[mark:mark + size] = present.to_bytes(size, 'little')
+        out[mark + size:mark + size * 2] = nulls.to_bytes(size, 'little')
+        if count == len(data):
+            out.append(0)
+        else:
+            keys = set(self.keys)
+            extras = [(key, value) for key, value in data.items() if key not in keys]
+            write_varint(out, len(extras))
+            for key, value in extras:
+                write_any(out, key)
+                write_any(out, value)
+
+    def finish(self):
+        """Prepare for reading records after all fields are added."""
+        self.size = (len(self.keys) + 7) // 8
+        self.all_present = (1 << len(self.keys)) - 1
+        self.entries = [(key, 1 << i, read) for i, (key, read) in enumerate(
+            zip(self.keys, self.readers))]
+        self.pairs = list(zip(self.keys, self.readers))
+
+    def read_record(self, buf: bytes, pos: int) -> Tuple[dict, int]:
+        size = self.size
+        end = pos + size * 2
+        if end > len(buf):
+            raise IndexError('bitmap out of range')
+        present = int.from_bytes(buf[pos:pos + size], 'little')
+        nulls = int.from_bytes(buf[pos + size:end], 'little')
+        pos = end
+        data = {}
+        if present == self.all_present and not nulls:
+            for key, read in self.pairs:
+                data[key], pos = read(buf, pos)
+        elif present:
+            for key, bit, read in self.entries:
+                if present & bit:
+                    if nulls & bit:
+                        data[key] = None
+                    else:
+                        data[key], pos = read(buf, pos)
+        if buf[pos]:
+            count, pos = read_varint(buf, pos)
+            for _ in range(count):
+                key, pos = read_any(buf, pos)
+                data[key], pos = read_any(buf, pos)
+        else:
+            pos += 1
+        return data, pos
+
+
+class BinaryCodec:
+    """Encode and decode objects of a catalyst in the compact binary format.
+
+    :param catalyst: The catalyst to dump and load objects.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+        # layouts of catalysts being made, which are referred by recursive catalysts
+        self._layouts: Dict[int, _Layout] = {}
+        self.layout = self._get_layout(catalyst)
+        checksum = zlib.crc32(self.layout.description.encode())
+        self.header = MAGIC + bytes([VERSION]) + checksum.to_bytes(4, 'little')
+        is_default = getattr(catalyst, '_is_default_method', None)
+        # dump and load items one by one, unless all the items are needed by
+        # the pre and post processes of many objects
+        self.process_one = None
+        self.dump_one = None
+        if is_default is not None:
+            if all(is_default(name) for name in ('load_many', 'pre_load_many', 'post_load_many')):
+                self.process_one = catalyst._get_process_one('load')
+            if all(is_default(name) for name in ('dump_many', 'pre_dump_many', 'post_dump_many')):
+                self.dump_one = catalyst._get_process_one('dump')
+
+    def _get_layout(self, catalyst: CatalystABC) -> _Layout:
+        layout = self._layouts.get(id(catalyst))
+        if layout is not None:
+            return layout
+        layout = self._layouts[id(catalyst)] = _Layout()
+        # all fields, since the fields to dump and load might be different
+        fields = {}
+        for field in (*catalyst._dump_fields.values(), *catalyst._load_fields.values()):
+            if isinstance(field, Field):
+                fields.setdefault(field.key, field)
+        descriptions = []
+        for key, field in fields.items():
+            code, write, read, description = self._make_field_codec(field)
+            layout.keys.append(key)
+            layout.fields.append(field)
+            layout.codes.append(code)
+            layout.writers.append(write)
+            layout.readers.append(read)
+            descriptions.append(f'{key}:{description}')
+        layout.description = '{' + ','.join(descriptions) + '}'
+        layout.finish()
+        layout.write_object = self._make_object_writer(catalyst, layout)
+        return layout
+
+    def _make_field_codec(self, field: Field) -> Tuple[str, Writer, Reader, str]:
+        """Return the code of type, the writer and reader of values and the
+        description of the field.
+        """
+        code = 'g'
+        if field.dump_none is None:
+            for cls, cls_code in FIELD_CODES:
+                if isinstance(field, cls):
+                    if _is_default_format(field, cls):
+                        code = cls_code
+                    break
+        if code == 'f' and not field.nan_to_none:
+            # the special values are dumped to strings
+            code = 'g'
+        if code == 'D' and not field.nan_to_none:
+            code = 'g'
+        if code in ('n', 'l'):
+            return self._make_container_codec(field, code)
+        if code == 'a':
+            write, read = make_array_codec(field.dtype)
+            return code, write, read, f'a{field.dtype.str}'
+
+        write, read = SIMPLE_CODECS[code]
+        if code in ('t', 'd', 'T'):
+            write = _with_parser(write, field.parse)
+        return code, write, read, code
+
+    def _make_container_codec(self, field: Field, code: str) -> Tuple[str, Writer, Reader, str]:
+        if code == 'l':
+            _, write, read, description = self._make_field_codec(field.item_field)
+            return code, make_list_writer(write), make_list_reader(read), f'[{description}]'
+
+        catalyst = field.catalyst
+        if not hasattr(catalyst, '_dump_fields'):
+            write, read = SIMPLE_CODECS['g']
+            return 'g', write, read, 'g'
+        layout = self._get_layout(catalyst)
+        write, read = layout.write_dict, layout.read_record
+        description = layout.description
+        if field.many:
+            return 'N', make_list_writer(write), make_list_reader(read), f'[{description}]'
+        return code, write, read, description
+
+    def _make_object_writer(self, catalyst: CatalystABC, layout: _Layout) -> Optional[Writer]:
+        """Make the function to dump one object and write the record without making
+        the dict, return None if the processes of catalyst are customized, or
+        there are field groups. Errors are raised without details.
+        """
+        get_plan = getattr(catalyst, '_get_inline_plan', None)
+        plan = None if get_plan is None else get_plan('dump', False)
+        if plan is None or plan.partial_groups:
+            return None
+
+        indexes = {key: i for i, key in enumerate(layout.keys)}
+        fields = []
+        for partial_field in plan.partial_fields:
+            field = partial_field.field
+            i = indexes[partial_field.target]
+            dump, write = partial_field.field_method, layout.writers[i]
+            code = layout.codes[i]
+            if code in ('t', 'd', 'T'):
+                dump = _raw_dump(field, _check_type(field.obj_type))
+            elif code == 'D':
+                dump = _raw_dump(field, _to_decimal(field))
+            elif code == 'a':
+                dump = _raw_dump(field, partial(np.asarray, dtype=field.dtype))
+            elif code in ('n', 'N'):
+                nested = self._make_nested_writer(field)
+                if nested is not None:
+                    dump, write = None, nested
+            fields.append((
+                partial_field.source, partial_field.required, partial_field.default,
+                dump, 1 << i, write))
+        get_values = plan.get_values
+        size = (len(layout.keys) + 7) // 8
+        empty_bitmaps = bytes(size * 2)
+
+        def write_object(out: bytearray, data):
+            values, get_errors = get_values(data)
+            present = nulls = 0
+            # the bitmaps are written after the values
+            mark = len(out)
+            out += empty_bitmaps
+            for (source, required, default, dump, bit, write), value in zip(fields, values):
+                if value is missing:
+                    if get_errors is not None and source in get_errors:
+                        raise get_errors[source]
+                    value = default() if callable(default) else default
+
+                if value is not missing and dump is not None:
+                    value = dump(value)
+
+                if value is missing:
+                    if required:
+                        raise ValueError(f'"{source}" is required.')
+                    continue
+                present |= bit
+                if value is None:
+                    nulls |= bit
+                else:
+                    write(out, value)
+            out[mark:mark + size] = present.to_bytes(size, 'little')
+            out[mark + size:mark + size * 2] = nulls.to_bytes(size, 'little')
+            out.append(0)
+        return write_object
+
+    def _make_nested_writer(self, field: NestedField) -> Optional[Writer]:
+        """Make the function to write the value of `NestedField` by the object writer
+        of nested catalyst, instead of building the dict.
+        """
+        if not is_default_nested_field(field) or not field._is_default_none() \
+                or field.validate_dump is not no_processing:
+            return None
+        # the layout of the nested catalyst is made already
+        write_object = self._layouts[id(field.catalyst)].write_object
+        if write_object is None or not field.many:
+            return write_object
+
+        def write_items(out: bytearray, value):
+            items = list(value)
+            if any(item is None for item in items):
+                raise ValueError('The nested object can not be None.')
+            write_varint(out, len(items))
+            out += bytes((len(items) + 7) // 8)
+            for item in items:
+                write_object(out, item)
+        return write_items
+
+    def _write_record(self, out: bytearray, data, index: Optional[int]):
+        write_object = self.layout.write_object
+        if write_object is not None:
+            mark = len(out)
+            try:
+                write_object(out, data)
+                return
+            except Exception:  # pylint: disable=broad-except
+                del out[mark:]
+        # collect errors, or dump by the catalyst which can't be written directly
+        result = self.catalyst.dump(data)
+        if not result.is_valid:
+            if index is not None:
+                result = self.catalyst.dump_result_class(
+                    [result.valid_data], {index: result.errors}, {index: result.invalid_data})
+            raise ValidationError(msg=result.format_errors(), detail=result)
+        self.layout.write_dict(out, result.valid_data)
+
+    def dumps(self, data) -> bytes:
+        """Dump one object to bytes. Raise `ValidationError` if it's invalid."""
+        out = bytearray(self.header)
+        self._write_record(out, data, None)
+        return bytes(out)
+
+    def iter_records(self, data: Iterable) -> Iterator[bytearray]:
+        """Dump the objects and yield the record of each object. Raise
+        `ValidationError` keyed by index if an object is invalid.
+        """
+        if self.dump_one is None:
+            # pre and post processes need all the objects
+            result = self.catalyst.dump_many(data, raise_error=True)
+            for valid_data in result.valid_data:
+                out = bytearray()
+                self.layout.write_dict(out, valid_data)
+                yield out
+            return
+        for i, item in enumerate(data):
+            out = bytearray()
+            self._write_record(out, item, i)
+            yield out
+
+    def dumps_many(self, data: Iterable) -> bytes:
+        """Dump multiple objects to bytes of a stream."""
+        out = bytearray(self.header)
+        for record in self.iter_records(data):
+            write_varint(out, len(record))
+            out += record
+        return bytes(out)
+
+    def dump_many(self, data: Iterable, file: PathOrFile):
+        """Dump multiple objects one by one and write the stream to the file."""
+        with open_output(file) as fp:
+            out = bytearray(self.header)
+            for record in self.iter_records(data):
+                write_varint(out, len(record))
+                out += record
+                if len(out) >= BUFFER_SIZE:
+                    fp.write(out)
+                    out = bytearray()
+            if out:
+                fp.write(out)
+
+    def _check_header(self, header: bytes):
+        if header != self.header:
+            if header[:1] != MAGIC or len(header) < HEADER_SIZE:
+                raise BinaryDecodeError('The data is not encoded by catalysts.')
+            if header[1] != VERSION:
+                raise BinaryDecodeError(f'Version {header[1]} is not supported.')
+            raise BinaryDecodeError('The data is encoded by another layout of fields.')
+
+    def _read_record(self, buf: bytes, pos: int, end: int) -> dict:
+        """Read the record from `pos` to `end` of the buffer."""
+        try:
+            data, pos = self.layout.read_record(buf, pos)
+        except BinaryDecodeError:
+            raise
+        except (IndexError, ValueError, OverflowError, struct.error) as e:
+            raise BinaryDecodeError(f'Malformed record: {e}') from e
+        if pos != end:
+            raise BinaryDecodeError(f'Malformed record at position {pos}.')
+        return data
+
+    def decode(self, data: Buffer) -> dict:
+        """Decode bytes of one object to the dict of keys of fields."""
+        buf = bytes(data)
+        self._check_header(buf[:HEADER_SIZE])
+        return self._read_record(buf, HEADER_SIZE, len(buf))
+
+    def iter_decode(self, data: Union[Buffer, PathOrFile]) -> Iterator[dict]:
+        """Decode the stream of bytes, or read the stream from the path or binary
+        file object, and yield the dicts of records one by one.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            buf = bytes(data)
+            self._check_header(buf[:HEADER_SIZE])
+            pos, size = HEADER_SIZE, len(buf)
+            while pos < size:
+                try:
+                    length, pos = read_varint(buf, pos)
+                except IndexError:
+                    raise BinaryDecodeError('Truncated record.') from None
+                end = pos + length
+                if end > size:
+                    raise BinaryDecodeError('Truncated record.')
+                yield self._read_record(buf, pos, end)
+                pos = end
+            return
+
+        with open_input(data) as fp:
+            self._check_header(fp.read(HEADER_SIZE))
+            read = fp.read
+            while True:
+                byte = read(1)
+                if not byte:
+                    return
+                # the varint of length
+                length, shift = 0, 0
+                while byte and byte[0] & 0x80:
+                    length |= (byte[0] & 0x7f) << shift
+                    shift += 7
+                    byte = read(1)
+                if not byte:
+                    raise BinaryDecodeError('Truncated record.')
+                length |= byte[0] << shift
+                record = read(length)
+                if len(record) != length:
+                    raise BinaryDecodeError('Truncated record.')
+                yield self._read_record(record, 0, length)
+
+    def _error_result(self, name: str, data, error: BinaryDecodeError, raise_error: bool):
+        """Make the result of malformed data, like the errors of pre and post processes."""
+        catalyst = self.catalyst
+        key = catalyst.process_aliases.get(name, name)
+        valid_data = [] if name == 'load_many' else {}
+        result = catalyst.load_result_class(valid_data, {key: error}, data)
+        if raise_error:
+            raise ValidationError(msg=result.format_errors(), detail=result)
+        return result
+
+    def loads(self, data: Buffer, raise_error: bool = None) -> LoadResult:
+        """Decode bytes and load the object."""
+        if raise_error is None:
+            raise_error = self.catalyst.raise_error
+        try:
+            value = self.decode(data)
+        except BinaryDecodeError as e:
+            return self._error_result('load', data, e, raise_error)
+        return self.catalyst._do_load(value, raise_error)
+
+    def loads_many(
+            self, data: Union[Buffer, PathOrFile], raise_error: bool = None) -> LoadResult:
+        """Decode the stream and load the objects. If `all_errors` is False, the records
+        are decoded one by one, and the records after the first invalid one are skipped.
+        """
+        catalyst = self.catalyst
+        if raise_error is None:
+            raise_error = catalyst.raise_error
+        try:
+            with closing(self.iter_decode(data)) as records:
+                if self.process_one is None or catalyst.all_errors:
+                    return catalyst._do_load_many(list(records), raise_error)
+                valid_data, errors, invalid_data = catalyst._process_many(
+                    records, False, self.process_one)
+        except BinaryDecodeError as e:
+            return self._error_result('load_many', data, e, raise_error)
+
+        result = catalyst.load_result_class(valid_data, errors, invalid_data)
+        if errors and raise_error:
+            raise ValidationError(msg=result.format_errors(), detail=result)
+        return result
@@ -0,0 +1,160 @@
+"""Load column-oriented data, which is a mapping of field keys to sequences of
+values, such as ``{"price": [...], "qty": [...]}``.
+
+Each field processes its column in a loop, without transposing the columns to
+dicts of rows. The defaults, required fields and errors are the same as
+loading the rows by `Catalyst.load_many`.
+"""
+
+from itertools import repeat
+from operator import is_
+from typing import Any, Dict, List, Mapping, Optional
+
+from ..base import CatalystABC
+from ..compiler import distribute_field_error
+from ..exceptions import ValidationError
+from ..utils import LoadResult, missing
+
+
+def _has_missing(values) -> bool:
+    return any(map(is_, values, repeat(missing)))
+
+
+class ColumnReader:
+    """Load columns by a catalyst.
+
+    :param catalyst: The catalyst to load columns.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+        # the fields can't process columns if there are field groups or custom processes
+        get_plan = getattr(catalyst, '_get_inline_plan', None)
+        self.plan = None if get_plan is None else get_plan('load', True)
+        if self.plan is not None and self.plan.partial_groups:
+            self.plan = None
+
+    def load(self, data: Mapping, raise_error: bool = None, rows: bool = False) -> LoadResult:
+        """Load the columns, see `Catalyst.load_columns`."""
+        catalyst = self.catalyst
+        if raise_error is None:
+            raise_error = catalyst.raise_error
+        if self.plan is None:
+            result = self._load_rows(data)
+        else:
+            try:
+                result = self._load_columns(data, rows)
+            except self.plan.except_exception as e:
+                key = catalyst.process_aliases.get('load_many', 'load_many')
+                result = catalyst.load_result_class(
+                    [] if rows else {}, {key: e}, data)
+        if not rows and isinstance(result.valid_data, list):
+            result.valid_data = self._to_columns(result.valid_data)
+
+        if result.errors and raise_error:
+            raise ValidationError(msg=result.format_errors(), detail=result)
+        return result
+
+    @staticmethod
+    def _get_columns(data: Mapping) -> Dict[Any, list]:
+        if not isinstance(data, Mapping):
+            raise TypeError(f'"{data}" is not Mapping.')
+        return {
+            key: column if hasattr(column, '__len__') else list(column)
+            for key, column in data.items()}
+
+    def _load_rows(self, data: Mapping) -> LoadResult:
+        """Transpose the columns to rows and load them by `load_many`."""
+        catalyst = self.catalyst
+        try:
+            columns = self._get_columns(data)
+        except catalyst.except_exception as e:
+            key = catalyst.process_aliases.get('load_many', 'load_many')
+            return catalyst.load_result_class([], {key: e}, data)
+        size = max(map(len, columns.values()), default=0)
+        rows = [{} for _ in range(size)]
+        for key, column in columns.items():
+            for row, value in zip(rows, column):
+                row[key] = value
+        return catalyst._do_load_many(rows, raise_error=False)
+
+    def _to_columns(self, rows: List[dict]) -> Dict[str, list]:
+        """Convert results of rows to columns, the missing values are None."""
+        names = {}
+        for row in rows:
+            if isinstance(row, Mapping):
+                names.update(dict.fromkeys(row))
+        return {
+            name: [row.get(name) if isinstance(row, Mapping) else None for row in rows]
+            for name in names}
+
+    def _load_columns(self, data: Mapping, rows: bool) -> LoadResult:
+        plan = self.plan
+        columns = self._get_columns(data)
+        size = max(map(len, columns.values()), default=0)
+        all_errors, except_exception = plan.all_errors, plan.except_exception
+
+        results: Dict[str, list] = {}
+        errors: Dict[int, dict] = {}
+        invalid_data: Dict[int, dict] = {}
+        # the first invalid row, the rows after it are not processed if `all_errors` is False
+        stop: Optional[int] = None
+        for field, source, target, required, default, field_method in plan.partial_fields:
+            column = columns.get(source, ())
+            if len(column) < size:
+                column = list(column)
+                column.extend([missing] * (size - len(column)))
+            elif stop is None and not _has_missing(column):
+                # process the whole column at once, unless any value is missing or invalid
+                try:
+                    result = [field_method(value) for value in column]
+                except except_exception:
+                    pass
+                else:
+                    if not _has_missing(result):
+                        results[target] = result
+                        continue
+
+            result = []
+            append = result.append
+            for i, value in enumerate(column if stop is None else column[:stop]):
+                try:
+                    if value is missing:
+                        value = default() if callable(default) else default
+                    if value is not missing:
+                        value = field_method(value)
+                    if value is missing and required:
+                        raise field.error('required')
+                    append(value)
+                except except_exception as e:
+                    valid_data = {}
+                    distribute_field_error(
+                        e, source, target, value, valid_data,
+                        errors.setdefault(i, {}), invalid_data.setdefault(i, {}))
+                    append(valid_data.get(target, missing))
+                    if not all_errors:
+                        stop = i
+                        break
+            results[target] = result
+
+        if stop is not None:
+            # like `load_many`, stop at the first invalid row
+            size = stop + 1
+            errors = {i: e for i, e in errors.items() if i <= stop}
+            invalid_data = {i: d for i, d in invalid_data.items() if i <= stop}
+            for result in results.values():
+                del result[size:]
+                result.extend([missing] * (size - len(result)))
+
+        if rows:
+            valid_data = [{} for _ in range(size)]
+            for target, result in results.items():
+                for row, value in zip(valid_data, result):
+                    if value is not missing:
+                        row[target] = value
+        else:
+            valid_data = {}
+            for target, result in results.items():
+                if any(value is not missing for value in result):
+                    valid_data[target] = [
+                        None if value is missing else value for value in result]
+        return self.catalyst.load_result_class(valid_data, errors, invalid_data)
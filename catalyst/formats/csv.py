@@ -0,0 +1,100 @@
+"""Read and write CSV files by catalysts with the `csv` module.
+
+The header is mapped to keys of fields once, and rows are loaded by positions
+of columns without building dicts. When dumping, the rows are made by `RowWriter`.
+Since None and missing values are written as empty cells, the empty cells of
+fields other than `StringField` are loaded as None, or missing if the fields
+don't allow None.
+"""
+
+import csv
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple
+
+from ..base import CatalystABC
+from ..fields import Field, StringField
+from ..utils import LoadResult, missing
+from .files import PathOrFile, open_text_input, open_text_output
+from .rows import RowWriter
+
+
+class CSVReader:
+    """Load rows of CSV files by a catalyst.
+
+    :param catalyst: The catalyst to load rows.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+
+    def iter_load(
+            self, file: PathOrFile, raise_error: bool = None, chunk_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+            columns: Sequence[str] = None, encoding: str = 'utf-8', **fmtparams,
+    ) -> Iterator[Tuple[int, LoadResult]]:
+        """Load rows from the file lazily, see `Catalyst.load_csv`."""
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Argument "chunk_size" must be a positive integer.')
+        if raise_error is None:
+            raise_error = self.catalyst.raise_error
+        return self._generate_results(
+            file, raise_error, chunk_size, error_callback, columns, encoding, fmtparams)
+
+    def _generate_results(
+            self, file, raise_error, chunk_size, error_callback,
+            columns, encoding, fmtparams) -> Iterator:
+        catalyst = self.catalyst
+        with open_text_input(file, encoding) as fp:
+            reader = csv.reader(fp, **fmtparams)
+            if columns is None:
+                columns = next(reader, ())
+            process_one, process_many = catalyst._get_row_processors(columns)
+            empty_values = self._get_empty_values(columns)
+            if empty_values:
+                reader = _replace_empty(reader, empty_values)
+            yield from catalyst._generate_results(
+                'load', reader, raise_error, chunk_size, error_callback,
+                process_one if chunk_size is None else process_many)
+
+    def _get_empty_values(self, columns: Sequence[str]) -> Tuple[Tuple[int, Any], ...]:
+        """Get the positions of columns loaded by fields other than `StringField`,
+        with the values of their empty cells, which are None if the fields allow
+        None, otherwise `missing`.
+        """
+        values = {
+            field.key: None if field.allow_none else missing
+            for field in self.catalyst._load_fields.values()
+            if isinstance(field, Field) and not isinstance(field, StringField)}
+        return tuple(
+            (i, values[column]) for i, column in enumerate(columns) if column in values)
+
+
+def _replace_empty(
+        rows: Iterable[list], empty_values: Tuple[Tuple[int, Any], ...]) -> Iterator[list]:
+    """Replace the empty cells at the positions with the values in place."""
+    for row in rows:
+        for i, value in empty_values:
+            if i < len(row) and row[i] == '':
+                row[i] = value
+        yield row
+
+
+class CSVWriter:
+    """Dump objects by a catalyst and write them as rows of CSV files.
+
+    :param catalyst: The catalyst to dump objects.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+        self.rows = RowWriter(catalyst)
+
+    def dump(
+            self, data: Iterable, file: PathOrFile, columns: Sequence[str] = None,
+            header: bool = True, encoding: str = 'utf-8', **fmtparams):
+        """Dump the objects one by one and write them to the file, see
+        `Catalyst.dump_csv`.
+        """
+        columns = self.rows.columns if columns is None else tuple(columns)
+        with open_text_output(file, encoding) as fp:
+            writer = csv.writer(fp, **fmtparams)
+            if header:
+                writer.writerow(columns)
+            writer.writerows(self.rows.iter_rows(data, columns))
@@ -0,0 +1,118 @@
+"""Open files for reading and writing data formats, compressed files are
+decompressed transparently.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Optional, Union
+
+
+MAGIC_NUMBERS = (
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+)
+
+EXTENSIONS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open,
+}
+
+MAGIC_SIZE = max(len(magic) for magic, _ in MAGIC_NUMBERS)
+
+PathOrFile = Union[str, os.PathLike, io.IOBase]
+
+
+def is_path(file) -> bool:
+    return isinstance(file, (str, os.PathLike))
+
+
+def is_binary(fp) -> bool:
+    return isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+
+
+def detect_compression(fp) -> Optional[Callable]:
+    """Return the function to open the compressed binary file, by checking
+    the first bytes without consuming them. Return None if it's not compressed
+    or can't be checked.
+    """
+    if not is_binary(fp):
+        return None
+    if hasattr(fp, 'peek'):
+        head = fp.peek(MAGIC_SIZE)[:MAGIC_SIZE]
+    elif fp.seekable():
+        position = fp.tell()
+        head = fp.read(MAGIC_SIZE)
+        fp.seek(position)
+    else:
+        return None
+    for magic, opener in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return opener
+    return None
+
+
+@contextmanager
+def open_input(file: PathOrFile):
+    """Open the path or use the file object for reading, decompress the content
+    if it's gzip, bz2 or xz. The file opened by path is closed on exit, and the
+    given file object is left open.
+    """
+    with ExitStack() as stack:
+        fp = stack.enter_context(open(file, 'rb') if is_path(file) else _keep_open(file))
+        opener = detect_compression(fp)
+        if opener is not None:
+            fp = stack.enter_context(opener(fp, 'rb'))
+        yield fp
+
+
+@contextmanager
+def open_output(file: PathOrFile):
+    """Open the path or use the file object for writing, the content is compressed
+    if the path ends with ".gz", ".bz2", ".xz" or ".lzma".
+    """
+    if is_path(file):
+        opener = EXTENSIONS.get(os.path.splitext(os.fspath(file))[1].lower(), open)
+        context = opener(file, 'wb')
+    else:
+        context = _keep_open(file)
+    with context as fp:
+        yield fp
+
+
+@contextmanager
+def _keep_open(fp):
+    yield fp
+
+
+@contextmanager
+def open_text_input(file: PathOrFile, encoding: str = 'utf-8'):
+    """Like `open_input`, but binary content is decoded to text, and newlines
+    are not translated, as required by `csv`.
+    """
+    with ExitStack() as stack:
+        fp = stack.enter_context(open_input(file))
+        if is_binary(fp):
+            fp = io.TextIOWrapper(fp, encoding=encoding, newline='')
+            # keep the binary file open, which is closed by `open_input` if needed
+            stack.callback(fp.detach)
+        yield fp
+
+
+@contextmanager
+def open_text_output(file: PathOrFile, encoding: str = 'utf-8'):
+    """Like `open_output`, but text is encoded if the file is binary."""
+    with ExitStack() as stack:
+        fp = stack.enter_context(open_output(file))
+        if is_binary(fp):
+            fp = io.TextIOWrapper(fp, encoding=encoding, newline='')
+            # the callbacks are called in reverse order, flush before detaching
+            stack.callback(fp.detach)
+            stack.callback(fp.flush)
+        yield fp
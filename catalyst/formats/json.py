@@ -0,0 +1,232 @@
+"""Read and write JSON directly from and to the processes of catalysts.
+
+The writer encodes the results of `dump` by `json`, and writes many objects to
+files one by one. Writing JSON while dumping fields was tried, but it's slower than
+encoding the results of compiled processes by the C encoder, and it has to make the
+same errors as `dump`, so it was dropped.
+
+The items of large JSON arrays are decoded one by one from files with the scanner
+of `json`. There is no reader to decode and load documents at once, since the
+scanner builds the values of unknown keys anyway, and loading the decoded data
+is as fast.
+"""
+
+import codecs
+import json
+from json.decoder import JSONDecodeError, WHITESPACE
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+from ..base import CatalystABC
+from ..exceptions import ValidationError
+from .files import is_binary
+
+
+# the number of characters to collect before writing to file
+BUFFER_SIZE = 1 << 16
+
+
+# the characters which may continue a number in the next chunk
+NUMBER_CHARS = frozenset('0123456789+-.eE')
+
+# errors at the end of text may be caused by truncating, such as "tru" and "\\u00"
+MAX_TRUNCATED_SIZE = len('-Infinity')
+
+
+class _ChunkedText:
+    """The unconsumed text of a file, which is read in chunks on demand."""
+    def __init__(self, fp, read_size: int):
+        self.fp = fp
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')() if is_binary(fp) else None
+        self.text = ''
+        # the offset of the text in the document
+        self.offset = 0
+        self.eof = False
+
+    def fill(self, size: int = None) -> bool:
+        """Read at least `size` characters, return False at the end of file."""
+        size = max(size or 0, self.read_size)
+        while not self.eof:
+            chunk = self.fp.read(size)
+            self.eof = not chunk
+            if self.decoder is not None:
+                chunk = self.decoder.decode(chunk, final=self.eof)
+            if chunk:
+                self.text += chunk
+                return True
+        return False
+
+    def skip(self, pos: int) -> int:
+        """Skip whitespace, return the position of the next character or the end."""
+        while True:
+            pos = WHITESPACE.match(self.text, pos).end()
+            if pos < len(self.text) or not self.fill():
+                return pos
+
+    def consume(self, pos: int) -> int:
+        """Drop the consumed text if it's large, return the new position."""
+        if pos >= self.read_size:
+            self.text = self.text[pos:]
+            self.offset += pos
+            pos = 0
+        return pos
+
+    def scan(self, pos: int, scan_once: Callable) -> Tuple[Any, int]:
+        """Decode the value at the position, read more text if it's incomplete."""
+        while True:
+            text = self.text
+            try:
+                value, end = scan_once(text, pos)
+            except StopIteration as e:
+                msg, error_pos = 'Expecting value', e.value
+            except JSONDecodeError as e:
+                msg, error_pos = e.msg, e.pos
+            else:
+                # a number may be followed by its digits in the next chunk
+                if self.eof or not NUMBER_CHARS.issuperset(text[end:]):
+                    return value, end
+                msg, error_pos = None, end
+            if msg is not None and (
+                    self.eof or len(text) - error_pos > MAX_TRUNCATED_SIZE
+                    and not msg.startswith('Unterminated string')):
+                raise self.error(msg, error_pos)
+            if not self.fill(len(text) - pos):
+                if msg is None:
+                    return value, end
+                raise self.error(msg, error_pos)
+
+    def error(self, msg: str, pos: int) -> JSONDecodeError:
+        error = JSONDecodeError(msg, self.text, pos)
+        error.pos = self.offset + pos
+        return error
+
+
+def iter_array_file(fp, read_size: int = None, scan_once: Callable = None) -> Iterator:
+    """Decode the items of JSON array one by one from a text or binary file object,
+    which is read in chunks of `read_size` characters or bytes, default to
+    `BUFFER_SIZE`. The consumed text
+    is dropped, so memory usage is bounded by the largest item instead of the file.
+    Raise `JSONDecodeError` if the JSON is malformed, `pos` of the error is the
+    offset in the document, and `lineno` and `colno` are in the unconsumed text.
+    """
+    if read_size is None:
+        read_size = BUFFER_SIZE
+    if scan_once is None:
+        scan_once = json.JSONDecoder().scan_once
+    buffer = _ChunkedText(fp, read_size)
+    pos = buffer.skip(0)
+    if buffer.text[pos:pos + 1] != '[':
+        raise buffer.error('Expecting "["', pos)
+    pos = buffer.skip(pos + 1)
+    if buffer.text[pos:pos + 1] == ']':
+        pos += 1
+    else:
+        while True:
+            value, pos = buffer.scan(pos, scan_once)
+            yield value
+            pos = buffer.skip(pos)
+            char = buffer.text[pos:pos + 1]
+            pos += 1
+            if char == ']':
+                break
+            if char != ',':
+                raise buffer.error("Expecting ',' delimiter", pos - 1)
+            pos = buffer.consume(buffer.skip(pos))
+    pos = buffer.skip(pos)
+    if pos != len(buffer.text):
+        raise buffer.error('Extra data', pos)
+
+
+class JSONWriter:
+    """Dump objects by a catalyst and encode them as JSON.
+
+    :param catalyst: The catalyst to dump objects.
+    :param ensure_ascii: Same as `json.dumps`.
+    :param separators: Same as `json.dumps`, default to ``(', ', ': ')``.
+    """
+    def __init__(
+            self, catalyst: CatalystABC, ensure_ascii: bool = True,
+            separators: Tuple[str, str] = None):
+        self.catalyst = catalyst
+        self.ensure_ascii = ensure_ascii
+        self.item_separator = separators[0] if separators else ', '
+        self.encoder = json.JSONEncoder(ensure_ascii=ensure_ascii, separators=separators)
+        # dump and write items one by one, unless all the items are needed by
+        # `pre_dump_many` or `post_dump_many`
+        is_default = getattr(catalyst, '_is_default_method', None)
+        self.process_one = None
+        if is_default is not None and all(
+                is_default(name) for name in ('dump_many', 'pre_dump_many', 'post_dump_many')):
+            self.process_one = catalyst._get_process_one('dump')
+
+    def dumps(self, data) -> str:
+        """Dump one object to JSON string. Raise `ValidationError` if it's invalid."""
+        return self.encoder.encode(self.catalyst.dump(data, raise_error=True).valid_data)
+
+    def dumps_many(self, data: Iterable) -> str:
+        """Dump multiple objects to JSON string."""
+        return self.encoder.encode(self.catalyst.dump_many(data, raise_error=True).valid_data)
+
+    def dump_many(self, data: Iterable, fp):
+        """Dump multiple objects and write JSON array to a text or binary file object.
+        The objects are written one by one, so memory usage is bounded. If an object
+        is invalid, `ValidationError` is raised, and the written data is incomplete.
+        """
+        if self.process_one is None:
+            self._write_buffered([self.dumps_many(data)], fp)
+            return
+
+        def generate():
+            yield '['
+            separator = ''
+            for string in self._write_objects(data):
+                yield separator
+                yield string
+                separator = self.item_separator
+            yield ']'
+
+        self._write_buffered(generate(), fp)
+
+    def dump_lines(self, data: Iterable, fp):
+        """Dump multiple objects and write JSON Lines to a text or binary file object,
+        each object is dumped separately. See `dump_many` for errors.
+        """
+        def generate():
+            for string in self._write_objects(data):
+                yield string
+                yield '\n'
+
+        self._write_buffered(generate(), fp)
+
+    def _write_objects(self, data: Iterable) -> Iterator[str]:
+        """Dump the objects one by one and encode each object."""
+        process = self.process_one or self.catalyst.dump
+        encode = self.encoder.encode
+        for i, item in enumerate(data):
+            result = process(item, raise_error=False)
+            if not result.is_valid:
+                raise self._item_error(i, result)
+            yield encode(result.valid_data)
+
+    def _write_buffered(self, strings: Iterable[str], fp):
+        """Write the strings to the file in chunks of about `BUFFER_SIZE` characters."""
+        encoding = 'ascii' if self.ensure_ascii else 'utf-8'
+        binary = is_binary(fp)
+        buffer, size = [], 0
+        for string in strings:
+            buffer.append(string)
+            size += len(string)
+            if size >= BUFFER_SIZE:
+                string = ''.join(buffer)
+                fp.write(string.encode(encoding) if binary else string)
+                buffer.clear()
+                size = 0
+        if buffer:
+            string = ''.join(buffer)
+            fp.write(string.encode(encoding) if binary else string)
+
+    def _item_error(self, index: int, result) -> ValidationError:
+        """Make the error of the invalid item with index like `dump_many`."""
+        result = self.catalyst.dump_result_class(
+            [result.valid_data], {index: result.errors}, {index: result.invalid_data})
+        return ValidationError(msg=result.format_errors(), detail=result)
@@ -0,0 +1,289 @@
+"""Read and write JSON Lines files, which have one JSON object per line.
+
+The lines are loaded one by one or in batches, so memory usage is bounded by
+the batch size instead of the file size. Errors are keyed by line numbers.
+
+Large local files can be validated by worker processes, which map the file into
+memory and load the lines of their byte ranges, only the errors are sent back.
+"""
+
+import json
+import mmap
+import os
+from collections import namedtuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..base import CatalystABC
+from ..exceptions import ValidationError
+from ..parallel import CHUNKS_PER_WORKER, get_pool, get_worker_catalyst
+from ..utils import LoadResult
+from .files import PathOrFile, detect_compression, open_input, open_output
+from .json import JSONWriter
+
+
+# the minimal number of bytes of each range, if the size of ranges is not given
+MIN_RANGE_SIZE = 1 << 20
+
+ValidationReport = namedtuple('ValidationReport', ['lines', 'valid', 'errors', 'outputs'])
+ValidationReport.__doc__ = """The result of validating a JSON Lines file.
+
+:param lines: The number of lines which are read, including empty lines.
+:param valid: The number of valid lines.
+:param errors: The formatted errors of invalid lines, keyed by line numbers.
+:param outputs: The paths of output files which contain the valid lines, in order.
+"""
+
+
+class JSONLines:
+    """Load and dump JSON Lines files by a catalyst. Empty lines are skipped,
+    and line numbers start from 1.
+
+    :param catalyst: The catalyst to process objects.
+    :param decoder: The decoder of lines, default to `json.JSONDecoder()`.
+    """
+    def __init__(self, catalyst: CatalystABC, decoder: json.JSONDecoder = None):
+        self.catalyst = catalyst
+        self.decoder = decoder or json.JSONDecoder()
+        self.writer = JSONWriter(catalyst)
+
+    def iter_lines(self, fp: Iterable) -> Iterator[Tuple[int, Any, Optional[ValueError]]]:
+        """Decode the text or binary lines, yield the line number, the decoded value
+        and None, or the line number, the raw line and the error of decoding.
+        """
+        decode = self.decoder.decode
+        for number, line in enumerate(fp, 1):
+            try:
+                if isinstance(line, bytes):
+                    line = line.decode('utf-8')
+                if line.isspace() or not line:
+                    continue
+                yield number, decode(line), None
+            except ValueError as e:
+                yield number, line, e
+
+    def iter_load(
+            self, file: PathOrFile, raise_error: bool = None, batch_size: int = None,
+            error_callback: Callable[[int, LoadResult], Any] = None,
+    ) -> Iterator[Tuple[int, LoadResult]]:
+        """Load objects from the file lazily, see `Catalyst.load_jsonl`."""
+        if batch_size is not None and batch_size < 1:
+            raise ValueError('Argument "batch_size" must be a positive integer.')
+        if raise_error is None:
+            raise_error = self.catalyst.raise_error
+        return self._generate_results(file, raise_error, batch_size, error_callback)
+
+    def _generate_results(
+            self, file: PathOrFile, raise_error: bool, batch_size: Optional[int],
+            error_callback: Optional[Callable]) -> Iterator:
+        catalyst = self.catalyst
+        with open_input(file) as fp:
+            lines = self.iter_lines(fp)
+            if batch_size is None:
+                results = self._load_lines(lines)
+            else:
+                results = self._load_batches(lines, batch_size)
+
+            for number, result, numbers in results:
+                if not result.errors:
+                    yield number, result
+                elif raise_error:
+                    raise ValidationError(msg=result.format_errors(), detail=result)
+                elif error_callback is None:
+                    yield number, result
+                else:
+                    error_callback(number, result)
+                    if numbers is not None:
+                        valid_data = [
+                            value for n, value in zip(numbers, result.valid_data)
+                            if n not in result.errors]
+                        yield number, catalyst.load_result_class(valid_data, {}, {})
+
+                if result.errors and not catalyst.all_errors:
+                    return
+
+    def _decoding_error_key(self) -> str:
+        return self.catalyst.process_aliases.get('load', 'load')
+
+    def _load_lines(self, lines: Iterator) -> Iterator:
+        """Load each line, yield the line number, the result and None."""
+        catalyst = self.catalyst
+        process = catalyst._do_load
+        key = self._decoding_error_key()
+        for number, value, error in lines:
+            if error is None:
+                result = process(value, raise_error=False)
+            else:
+                result = catalyst.load_result_class({}, {key: error}, value)
+            yield number, result, None
+
+    def _load_batches(self, lines: Iterator, batch_size: int) -> Iterator:
+        """Load the lines in batches by `load_many`, yield the number of the first
+        line, the result and the line numbers of valid data of each batch.
+        """
+        catalyst = self.catalyst
+        process = catalyst._do_load_many
+        all_errors = catalyst.all_errors
+        key = self._decoding_error_key()
+        while True:
+            batch = list(islice(lines, batch_size))
+            if not batch:
+                return
+            if not all_errors:
+                # the lines after the first error are useless
+                for i, (_, _, error) in enumerate(batch):
+                    if error is not None:
+                        del batch[i + 1:]
+                        break
+
+            numbers: List[int] = []
+            values = []
+            for number, value, error in batch:
+                if error is None:
+                    numbers.append(number)
+                    values.append(value)
+            result = process(values, raise_error=False)
+
+            # key errors by line numbers instead of indexes in the batch
+            errors = {
+                numbers[k] if isinstance(k, int) else k: v for k, v in result.errors.items()}
+            invalid_data = result.invalid_data
+            if isinstance(invalid_data, dict):
+                invalid_data = {
+                    numbers[k] if isinstance(k, int) else k: v for k, v in invalid_data.items()}
+                if all_errors or not errors:
+                    for number, value, error in batch:
+                        if error is not None:
+                            errors[number] = {key: error}
+                            invalid_data[number] = value
+            yield batch[0][0], catalyst.load_result_class(
+                result.valid_data, errors, invalid_data), numbers
+
+    def dump(self, data: Iterable, file: PathOrFile):
+        """Dump the objects one by one and write them to the file, see
+        `Catalyst.dump_jsonl`.
+        """
+        with open_output(file) as fp:
+            self.writer.dump_lines(data, fp)
+
+
+def split_ranges(mm: mmap.mmap, range_size: int) -> List[Tuple[int, int]]:
+    """Split the mapped file into byte ranges of about `range_size` bytes. Each range
+    ends after a newline or at the end of file, so lines are not broken.
+    """
+    size = len(mm)
+    ranges = []
+    start = 0
+    while start < size:
+        end = mm.find(b'\n', min(start + range_size, size) - 1)
+        end = size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+class _NullFile:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def write(self, data):
+        pass
+
+
+def _validate_range(
+        path: str, start: int, end: int, only, exclude,
+        output: Optional[str]) -> Tuple[int, int, Dict[int, Any]]:
+    """Load the lines in the byte range by the catalyst held by the worker process.
+    Return the number of lines, the number of valid lines, and the formatted errors
+    keyed by line numbers in the range. The valid lines are copied to `output`.
+    """
+    catalyst = get_worker_catalyst(only, exclude)
+    process = catalyst._do_load
+    all_errors = catalyst.all_errors
+    decode = catalyst._get_codec(JSONLines, None, None).decoder.decode
+    key = catalyst.process_aliases.get('load', 'load')
+
+    number = valid = 0
+    errors = {}
+    with open(path, 'rb') as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            (open(output, 'wb') if output else _NullFile()) as out:
+        mm.seek(start)
+        readline = mm.readline
+        while mm.tell() < end:
+            line = readline()
+            number += 1
+            if line.isspace():
+                continue
+            try:
+                result = process(decode(line.decode('utf-8')), raise_error=False)
+            except ValueError as e:
+                errors[number] = {key: str(e)}
+            else:
+                if result.errors:
+                    errors[number] = result.format_errors()
+                else:
+                    valid += 1
+                    out.write(line if line.endswith(b'\n') else line + b'\n')
+                    continue
+            if not all_errors:
+                break
+    return number, valid, errors
+
+
+def validate_file(
+        catalyst: CatalystABC, path: str, workers: int = None, output_dir: str = None,
+        range_size: int = None, only=None, exclude=None) -> ValidationReport:
+    """Validate the JSON Lines file on the process pool of the catalyst, see
+    `Catalyst.validate_jsonl`.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError('Argument "workers" must be a positive integer.')
+    if range_size is not None and range_size < 1:
+        raise ValueError('Argument "range_size" must be a positive integer.')
+    workers = workers or os.cpu_count() or 1
+    path = os.fspath(path)
+    with open(path, 'rb') as fp:
+        if detect_compression(fp) is not None:
+            raise ValueError(
+                f'Compressed file "{path}" can not be mapped into memory, '
+                f'use `load_jsonl` instead.')
+        size = os.fstat(fp.fileno()).st_size
+        if size == 0:
+            return ValidationReport(0, 0, {}, [])
+        if range_size is None:
+            range_size = max(MIN_RANGE_SIZE, -(-size // (workers * CHUNKS_PER_WORKER)))
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = split_ranges(mm, range_size)
+
+    outputs = []
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        outputs = [os.path.join(output_dir, f'part-{i:05d}.jsonl') for i in range(len(ranges))]
+
+    pool = get_pool(catalyst, workers, 'process')
+    futures = [
+        pool.submit(_validate_range, path, start, end, only, exclude,
+                    outputs[i] if outputs else None)
+        for i, (start, end) in enumerate(ranges)]
+
+    lines = valid = 0
+    errors = {}
+    done = 0
+    try:
+        for future in futures:
+            count, range_valid, range_errors = future.result()
+            for number, error in range_errors.items():
+                errors[lines + number] = error
+            lines += count
+            valid += range_valid
+            done += 1
+            if errors and not catalyst.all_errors:
+                break
+    finally:
+        for future in futures[done:]:
+            future.cancel()
+    return ValidationReport(lines, valid, errors, outputs[:done])
@@ -0,0 +1,152 @@
+"""Dump objects to rows, which are tuples of values in the order of columns,
+for `csv.writer` and `executemany` of DB-API cursors.
+
+The values of fields are dumped to a list by the dump plan of the catalyst, and
+the rows are taken from the list, without making a dict for each object.
+"""
+
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Sequence, Tuple
+
+from ..base import CatalystABC
+from ..compiler import distribute_field_error
+from ..exceptions import ValidationError
+from ..fields import Field
+from ..utils import missing
+
+
+# the number of rows passed to `executemany` at a time
+BATCH_SIZE = 1000
+
+
+class RowWriter:
+    """Dump objects by a catalyst and make rows of values of the columns.
+
+    :param catalyst: The catalyst to dump objects.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+        # the keys of fields in the order of declaration
+        self.columns = tuple(
+            field.key for field in catalyst._dump_fields.values() if isinstance(field, Field))
+        # the plan can't be used if there are field groups or custom processes
+        get_plan = getattr(catalyst, '_get_inline_plan', None)
+        self.plan = None if get_plan is None else get_plan('dump', False)
+        if self.plan is not None and self.plan.partial_groups:
+            self.plan = None
+
+    def iter_rows(self, data: Iterable, columns: Sequence[str] = None) -> Iterator[tuple]:
+        """Dump the objects one by one, and yield the values of the columns of each
+        result. The missing values are None. Raise `ValidationError` keyed by
+        index if an object is invalid, see `Catalyst.dump_rows`.
+        """
+        columns = self.columns if columns is None else tuple(columns)
+        return self._generate_rows(data, columns)
+
+    def _raise(self, index: int, valid_data: dict, errors: dict, invalid_data: dict):
+        result = self.catalyst.dump_result_class(
+            [valid_data], {index: errors}, {index: invalid_data})
+        raise ValidationError(msg=result.format_errors(), detail=result)
+
+    def _generate_rows(self, data: Iterable, columns: Tuple[str, ...]) -> Iterator[tuple]:
+        if self.plan is None:
+            return self._generate_dict_rows(data, columns)
+        return self._generate_plan_rows(data, columns)
+
+    def _generate_dict_rows(
+            self, data: Iterable, columns: Tuple[str, ...]) -> Iterator[tuple]:
+        """Dump the objects by the catalyst, and take the values from the dicts."""
+        process = self.catalyst._get_process_one('dump')
+        get_row = _make_getter(columns)
+        for i, item in enumerate(data):
+            result = process(item, raise_error=False)
+            if not result.is_valid:
+                self._raise(i, result.valid_data, result.errors, result.invalid_data)
+            valid_data = result.valid_data
+            try:
+                yield get_row(valid_data)
+            except KeyError:
+                # the fields which are not required or removed by post process
+                yield tuple(valid_data.get(column) for column in columns)
+
+    def _generate_plan_rows(
+            self, data: Iterable, columns: Tuple[str, ...]) -> Iterator[tuple]:
+        """Dump the values of fields to a list like `Catalyst.dump`, and take the
+        values of columns from the list.
+        """
+        plan = self.plan
+        fields = plan.partial_fields
+        get_values = plan.get_values
+        all_errors, except_exception = plan.all_errors, plan.except_exception
+        targets = {partial_field.target: j for j, partial_field in enumerate(fields)}
+        # the columns which are not fields refer to None at the end of the list
+        get_row = _make_getter([targets.get(column, len(fields)) for column in columns])
+
+        for i, item in enumerate(data):
+            values, get_errors = get_values(item)
+            dumped = []
+            append = dumped.append
+            complete = True
+            errors = invalid_data = None
+            for (field, source, target, required, default, dump), value in zip(fields, values):
+                try:
+                    if value is missing:
+                        if get_errors is not None and source in get_errors:
+                            raise get_errors[source]
+                        value = default() if callable(default) else default
+                    if value is not missing:
+                        value = dump(value)
+                    if value is missing:
+                        if required:
+                            raise field.error('required')
+                        complete = False
+                except except_exception as e:
+                    if errors is None:
+                        errors, invalid_data = {}, {}
+                    partial = {}
+                    distribute_field_error(
+                        e, source, target, value, partial, errors, invalid_data)
+                    value = partial.get(target, missing)
+                    if not all_errors:
+                        append(value)
+                        break
+                append(value)
+
+            if errors is not None:
+                valid_data = {
+                    partial_field.target: value for partial_field, value in zip(fields, dumped)
+                    if value is not missing}
+                self._raise(i, valid_data, errors, invalid_data)
+            append(None)
+            row = get_row(dumped)
+            if not complete:
+                row = tuple(None if value is missing else value for value in row)
+            yield row
+
+
+def _make_getter(keys: Sequence) -> Callable[[Sequence], tuple]:
+    """Make the function to get the tuple of items, like `itemgetter` of many keys."""
+    if len(keys) > 1:
+        return itemgetter(*keys)
+    getters = [itemgetter(key) for key in keys]
+
+    def get_row(values):
+        return tuple(get(values) for get in getters)
+    return get_row
+
+
+def executemany(cursor, sql: str, rows: Iterable[Sequence], batch_size: int = BATCH_SIZE) -> int:
+    """Execute the statement with rows in batches by `cursor.executemany`,
+    so rows are not all kept in memory. Return the number of rows.
+    """
+    if batch_size < 1:
+        raise ValueError('Argument "batch_size" must be a positive integer.')
+    rows = iter(rows)
+    count = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return count
+        cursor.executemany(sql, batch)
+        count += len(batch)
@@ -0,0 +1,376 @@
+"""Read and write fixed-width binary records with the `struct` module.
+
+Each record is packed by a `struct` format string, whose items are the values of
+columns, which are keys of fields. Files are mapped into memory, and the records
+are unpacked by `struct.iter_unpack` from the memory without copying the file, then
+loaded by positions of columns like rows of DB-API cursors.
+
+The raw values are converted for the fields on top of `struct`:
+
+- `DatetimeField`: seconds since the epoch in UTC, to naive datetimes
+- `DateField`: days since the epoch
+- `TimeField`: seconds since midnight
+- `DecimalField` with `places`: integers scaled by ``10 ** places``, such as cents
+- `StringField`: bytes of "s" items in UTF-8, trailing NUL bytes are removed
+"""
+
+import datetime
+import decimal
+import mmap
+import struct
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from ..base import CatalystABC
+from ..cache import LRUCache
+from ..exceptions import ValidationError
+from ..fields import (
+    DateField, DatetimeField, DecimalField, Field, StringField, TimeField,
+)
+from ..utils import LoadResult
+from .files import PathOrFile, is_path, open_output
+from .rows import RowWriter
+
+
+# the number of records to pack before writing to file
+BLOCK_SIZE = 4096
+
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+INTEGER_CODES = frozenset('bBhHiIlLqQnNP')
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _item_codes(st: struct.Struct) -> Tuple[str, ...]:
+    """Get the codes of items of the format, such as ``('q', 'd', 's')`` for "<qd8s",
+    padding bytes are not items.
+    """
+    codes = []
+    count = ''
+    for char in st.format.lstrip('@=<>!'):
+        if char.isdigit():
+            count += char
+        elif not char.isspace():
+            if char in 'sp':
+                codes.append(char)
+            elif char != 'x':
+                codes.extend(char * int(count or 1))
+            count = ''
+    return tuple(codes)
+
+
+def _to_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _time_converters(field: TimeField, is_integer: bool) -> Tuple[Converter, Converter]:
+    to_number = int if is_integer else float
+
+    def load_time(value):
+        seconds, microseconds = divmod(round(value * 1000000), 1000000)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        return datetime.time(hour, minute, second, microseconds)
+
+    def dump_time(value):
+        if isinstance(value, str):
+            value = field.parse(value)
+        seconds = (value.hour * 60 + value.minute) * 60 + value.second
+        return to_number(seconds + value.microsecond / 1000000)
+    return load_time, dump_time
+
+
+def _date_converters(field: DateField, is_integer: bool) -> Tuple[Converter, Converter]:
+    to_number = int if is_integer else float
+
+    def load_date(value):
+        return datetime.date.fromordinal(int(value) + EPOCH_ORDINAL)
+
+    def dump_date(value):
+        if isinstance(value, str):
+            value = field.parse(value)
+        return to_number(value.toordinal() - EPOCH_ORDINAL)
+    return load_date, dump_date
+
+
+def _datetime_converters(
+        field: DatetimeField, is_integer: bool) -> Tuple[Converter, Converter]:
+    def load_datetime(value):
+        return EPOCH + datetime.timedelta(seconds=value)
+
+    def dump_datetime(value):
+        if isinstance(value, str):
+            value = field.parse(value)
+        delta = _to_utc(value) - EPOCH
+        if is_integer:
+            return delta // datetime.timedelta(seconds=1)
+        return delta.total_seconds()
+    return load_datetime, dump_datetime
+
+
+def _decimal_converters(field: DecimalField, is_integer: bool) -> Tuple[Converter, Converter]:
+    places = int(field.places) if is_integer and field.places is not None else 0
+
+    def dump_decimal(value):
+        value = field.to_decimal(value).scaleb(places)
+        if is_integer:
+            return int(value.to_integral_value(rounding=field.rounding))
+        return float(value)
+
+    if not places:
+        return None, dump_decimal
+
+    def load_decimal(value):
+        return decimal.Decimal(value).scaleb(-places)
+    return load_decimal, dump_decimal
+
+
+def _string_converters(field: StringField, is_integer: bool) -> Tuple[Converter, Converter]:
+    def load_string(value: bytes):
+        return value.rstrip(b'\x00').decode('utf-8')
+
+    def dump_string(value):
+        return value.encode('utf-8') if isinstance(value, str) else value
+    return load_string, dump_string
+
+
+# the functions making converters of fields, subclasses are before their bases
+_CONVERTER_MAKERS = (
+    (TimeField, _time_converters),
+    (DateField, _date_converters),
+    (DatetimeField, _datetime_converters),
+    (DecimalField, _decimal_converters),
+)
+
+
+def _make_converters(field: Field, code: str) -> Tuple[Converter, Converter]:
+    """Make the functions to convert the raw value of struct to the value loaded by
+    the field, and the value dumped by the field to the raw value, None means
+    the value is not converted.
+    """
+    is_integer = code in INTEGER_CODES
+    for field_class, make_converters in _CONVERTER_MAKERS:
+        if isinstance(field, field_class):
+            return make_converters(field, is_integer)
+    # the bytes of "s" and "p" items are strings
+    if isinstance(field, StringField) and code in 'sp':
+        return _string_converters(field, is_integer)
+    return None, None
+
+
+def _make_row_converter(converters: Sequence[Converter]) -> Optional[Callable[[tuple], tuple]]:
+    """Make the function to convert all the values of a record, or return None
+    if no value needs to be converted.
+    """
+    pairs = [(i, convert) for i, convert in enumerate(converters) if convert is not None]
+    if not pairs:
+        return None
+
+    def convert_row(row: tuple) -> tuple:
+        row = list(row)
+        for i, convert in pairs:
+            value = row[i]
+            if value is not None:
+                row[i] = convert(value)
+        return tuple(row)
+    return convert_row
+
+
+class StructLayout:
+    """The struct of records and the converters of values of columns.
+
+    :param st: The struct of records.
+    :param columns: The keys of fields of items of the struct in order.
+    :param fields: The fields of columns, or None for columns without fields.
+    """
+    def __init__(self, st: struct.Struct, columns: Tuple[str, ...], fields: Sequence):
+        codes = _item_codes(st)
+        if len(codes) != len(columns):
+            raise ValueError(
+                f'The format "{st.format}" has {len(codes)} items, '
+                f'but there are {len(columns)} columns.')
+        self.struct = st
+        self.columns = columns
+        loaders, dumpers = [], []
+        for field, code in zip(fields, codes):
+            load, dump = (None, None) if field is None else _make_converters(field, code)
+            loaders.append(load)
+            dumpers.append(dump)
+        self.convert_loaded = _make_row_converter(loaders)
+        self.convert_dumped = _make_row_converter(dumpers)
+
+
+@contextmanager
+def open_buffer(data: Union[Buffer, PathOrFile]):
+    """Map the path or the file object into memory, or use the bytes-like object,
+    and yield the memoryview of it. The file object is read if it has no file
+    descriptor, such as `io.BytesIO`.
+    """
+    with ExitStack() as stack:
+        if isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            view = memoryview(data)
+        elif is_path(data):
+            view = stack.enter_context(_map_file(stack.enter_context(open(data, 'rb'))))
+        else:
+            try:
+                data.fileno()
+            except (AttributeError, OSError):
+                view = memoryview(data.read())
+            else:
+                view = stack.enter_context(_map_file(data))
+        yield view
+
+
+@contextmanager
+def _map_file(fp):
+    # the empty file can't be mapped
+    if fp.seek(0, 2) == 0:
+        yield memoryview(b'')
+        return
+    mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        try:
+            view.release()
+            mapped.close()
+        except BufferError:
+            # the records are still referenced, such as by the traceback of an error,
+            # the memory is unmapped when they are collected
+            pass
+
+
+class StructCodec:
+    """Load and dump fixed-width binary records by a catalyst.
+
+    :param catalyst: The catalyst to load and dump records.
+    """
+    def __init__(self, catalyst: CatalystABC):
+        self.catalyst = catalyst
+        self.rows = RowWriter(catalyst)
+        self._layouts = LRUCache(catalyst.projection_cache_size)
+
+    def get_layout(self, name: str, fmt: str, columns: Optional[Sequence[str]]) -> StructLayout:
+        """Get the layout of records for loading or dumping, which is memoized
+        for each distinct format and columns.
+        """
+        columns = None if columns is None else tuple(columns)
+        key = (name, fmt, columns)
+        return self._layouts.get_or_create(key, lambda: self._make_layout(name, fmt, columns))
+
+    def _make_layout(
+            self, name: str, fmt: str, columns: Optional[Tuple[str, ...]]) -> StructLayout:
+        field_dict = getattr(self.catalyst, f'_{name}_fields')
+        fields: Dict[str, Field] = {}
+        for field in field_dict.values():
+            if isinstance(field, Field):
+                fields.setdefault(field.key, field)
+        if columns is None:
+            columns = tuple(fields)
+        return StructLayout(struct.Struct(fmt), columns, [fields.get(c) for c in columns])
+
+    def iter_records(self, view: memoryview, layout: StructLayout) -> Iterator[tuple]:
+        """Unpack the records from the memory, and convert the raw values."""
+        size = layout.struct.size
+        if len(view) % size:
+            raise ValueError(
+                f'The size of data {len(view)} is not a multiple of '
+                f'the size of records {size}.')
+        records = layout.struct.iter_unpack(view)
+        convert = layout.convert_loaded
+        if convert is None:
+            return records
+        return map(convert, records)
+
+    def iter_load(
+            self, file: Union[Buffer, PathOrFile], fmt: str, raise_error: bool = None,
+            chunk_size: int = None, error_callback: Callable[[int, LoadResult], Any] = None,
+            columns: Sequence[str] = None) -> Iterator[Tuple[int, LoadResult]]:
+        """Load records from the file lazily, see `Catalyst.load_struct`."""
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Argument "chunk_size" must be a positive integer.')
+        if raise_error is None:
+            raise_error = self.catalyst.raise_error
+        layout = self.get_layout('load', fmt, columns)
+        return self._generate_results(file, layout, raise_error, chunk_size, error_callback)
+
+    def _generate_results(self, file, layout, raise_error, chunk_size, error_callback):
+        catalyst = self.catalyst
+        process_one, process_many = catalyst._get_row_processors(layout.columns)
+        with open_buffer(file) as view:
+            records = self.iter_records(view, layout)
+            try:
+                yield from catalyst._generate_results(
+                    'load', records, raise_error, chunk_size, error_callback,
+                    process_one if chunk_size is None else process_many)
+            finally:
+                # release the memory before closing the mapped file
+                del records
+
+    def pack_rows(
+            self, rows: Iterable[tuple], layout: StructLayout, buffer: bytearray,
+            flush: Callable[[memoryview], Any] = None) -> int:
+        """Pack rows into the preallocated buffer one by one, and return the end of
+        the records. If `flush` is given, it's called with the full buffer, which is
+        reused for the next records. Raise `ValidationError` keyed by index if a row
+        can't be packed, such as the row with missing values.
+        """
+        pack_into = layout.struct.pack_into
+        size = layout.struct.size
+        convert = layout.convert_dumped
+        full = len(buffer)
+        offset = 0
+        with memoryview(buffer) as view:
+            for i, row in enumerate(rows):
+                if offset == full and flush is not None:
+                    flush(view)
+                    offset = 0
+                try:
+                    pack_into(buffer, offset, *(row if convert is None else convert(row)))
+                except (struct.error, TypeError, ValueError, OverflowError,
+                        decimal.InvalidOperation) as e:
+                    result = self.catalyst.dump_result_class([row], {i: e}, {i: row})
+                    raise ValidationError(msg=result.format_errors(), detail=result) from e
+                offset += size
+        return offset
+
+    def dumps(self, data: Iterable, fmt: str, columns: Sequence[str] = None) -> bytearray:
+        """Dump the objects to records, which are packed into the bytearray
+        allocated for all the objects if the number of them is known.
+        """
+        layout = self.get_layout('dump', fmt, columns)
+        rows = self.rows.iter_rows(data, layout.columns)
+        try:
+            count = len(data)
+        except TypeError:
+            count = None
+        if count is not None:
+            buffer = bytearray(layout.struct.size * count)
+            end = self.pack_rows(rows, layout, buffer)
+            # the objects are fewer than the length, such as removed by `pre_dump_many`
+            del buffer[end:]
+            return buffer
+
+        out = bytearray()
+        buffer = bytearray(layout.struct.size * BLOCK_SIZE)
+        end = self.pack_rows(rows, layout, buffer, out.extend)
+        out += memoryview(buffer)[:end]
+        return out
+
+    def dump(self, data: Iterable, file: PathOrFile, fmt: str, columns: Sequence[str] = None):
+        """Dump the objects and write the records to the file, the records are packed
+        into a preallocated block of `BLOCK_SIZE` records, which is written when full.
+        """
+        layout = self.get_layout('dump', fmt, columns)
+        rows = self.rows.iter_rows(data, layout.columns)
+        buffer = bytearray(layout.struct.size * BLOCK_SIZE)
+        with open_output(file) as fp:
+            end = self.pack_rows(rows, layout, buffer, fp.write)
+            with memoryview(buffer) as view:
+                fp.write(view[:end])
@@ -1,5 +1,6 @@
 """FieldGroup classes for processing multiple fields."""
 
+import operator
 from typing import Callable, Iterable
 from functools import partial
 
@@ -82,12 +83,12 @@ class CompareFields(FieldGroup):
         '!=': '"{a}" must not be equal to "{b}".',
     }
     comparison_dict = {
-        '>': lambda a, b: a > b,
-        '<': lambda a, b: a < b,
-        '>=': lambda a, b: a >= b,
-        '<=': lambda a, b: a <= b,
-        '==': lambda a, b: a == b,
-        '!=': lambda a, b: a != b,
+        '>': operator.gt,
+        '<': operator.lt,
+        '>=': operator.ge,
+        '<=': operator.le,
+        '==': operator.eq,
+        '!=': operator.ne,
     }
     field_a: Field
     field_b: Field
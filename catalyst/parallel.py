@@ -0,0 +1,270 @@
+"""Process multiple objects in chunks with a pool of worker processes or threads."""
+
+import os
+import pickle
+import time
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait,
+)
+from itertools import islice
+from threading import Lock
+from typing import Iterable, Optional, Sequence
+from weakref import WeakKeyDictionary, finalize
+
+from .base import CatalystABC
+from .shared import receive_result, share_result
+
+
+# the number of items processed in the current process to measure the cost per item
+SAMPLE_SIZE = 32
+# the expected duration of processing a chunk, in seconds
+CHUNK_DURATION = 0.05
+# the minimal number of chunks for each worker to balance the load
+CHUNKS_PER_WORKER = 4
+
+EXECUTORS = ('process', 'thread')
+
+# process pools of each catalyst, and thread pools shared by catalysts
+_pools = WeakKeyDictionary()
+_thread_pools = {}
+_pools_lock = Lock()
+
+# the catalyst held by the worker process
+_worker_catalyst: CatalystABC = None
+
+
+def _initialize_worker(pickled_catalyst: bytes):
+    global _worker_catalyst  # pylint: disable=global-statement
+    _worker_catalyst = pickle.loads(pickled_catalyst)
+
+
+def get_worker_catalyst(only=None, exclude=None) -> CatalystABC:
+    """Return the catalyst held by the worker process, with the selected fields."""
+    catalyst = _worker_catalyst
+    if only is not None or exclude is not None:
+        catalyst = catalyst._get_projection(only, exclude)
+    return catalyst
+
+
+def _get_process_one(catalyst: CatalystABC, name: str, columns: Optional[tuple]):
+    if columns is not None:
+        return catalyst._get_row_processors(columns)[0]
+    return catalyst._get_process_one(name)
+
+
+def _process_chunk(
+        name: str, only, exclude, chunk: list, columns: tuple = None,
+        shared_memory: bool = False):
+    """Process a chunk of objects by the catalyst held by the worker process.
+    If `shared_memory` is True, the result is written to shared memory, and the
+    handle is returned, see `catalyst.shared`.
+    """
+    catalyst = get_worker_catalyst(only, exclude)
+    result = catalyst._process_many(
+        chunk, catalyst.all_errors, _get_process_one(catalyst, name, columns))
+    if shared_memory:
+        return share_result(catalyst, name, result)
+    return result
+
+
+def get_pool(
+        catalyst: CatalystABC, workers: int = None, executor: str = 'process') -> Executor:
+    """Get the persistent pool to process objects for the catalyst. The pool is
+    created on first use. Worker processes hold a copy of the catalyst, the pool
+    doesn't refer to the catalyst itself, and it's shut down when the catalyst is
+    deleted. Thread pools are shared by catalysts.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with _pools_lock:
+        if executor == 'thread':
+            pools = _thread_pools
+        else:
+            pools = _pools.setdefault(catalyst, {})
+        pool = pools.get(workers)
+        if pool is None:
+            if executor == 'thread':
+                pool = ThreadPoolExecutor(max_workers=workers)
+            else:
+                # pass the pickled catalyst, so that the pool doesn't keep it alive
+                pool = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_initialize_worker,
+                    initargs=(pickle.dumps(catalyst),))
+                finalize(catalyst, pool.shutdown, wait=False)
+            pools[workers] = pool
+        return pool
+
+
+def shutdown_pools(catalyst: CatalystABC = None, block: bool = True):
+    """Shut down the process pools of the catalyst, or all pools if `catalyst` is None.
+    If `block` is True, wait for the running chunks to finish.
+    """
+    with _pools_lock:
+        if catalyst is None:
+            pools = [pool for pools in _pools.values() for pool in pools.values()]
+            pools.extend(_thread_pools.values())
+            _pools.clear()
+            _thread_pools.clear()
+        else:
+            pools = list(_pools.pop(catalyst, {}).values())
+    for pool in pools:
+        pool.shutdown(wait=block)
+
+
+def tune_chunksize(item_seconds: float, items: int, workers: int) -> int:
+    """Choose the number of items for each chunk from the measured cost per item,
+    so that chunks last about `CHUNK_DURATION`, and every worker gets several chunks.
+    """
+    chunksize = int(CHUNK_DURATION / item_seconds) if item_seconds > 0 else items
+    balanced = -(-items // (workers * CHUNKS_PER_WORKER))
+    return max(1, min(chunksize, balanced))
+
+
+def _has_errors(result) -> bool:
+    if isinstance(result, tuple):
+        return bool(result[1])
+    return bool(result.errors)
+
+
+def _discard_result(future: Future):
+    """Remove the block of shared memory of the result if it's not received,
+    which is called when the future is done.
+    """
+    if not future.cancelled() and future.exception() is None:
+        result = future.result()
+        if not isinstance(result, tuple) and result.name is not None:
+            result.unlink()
+
+
+def _merge_result(
+        valid_data: list, errors: dict, invalid_data: dict, result: tuple, offset: int):
+    """Merge the result of a chunk, shift indexes by the offset of the chunk."""
+    chunk_valid_data, chunk_errors, chunk_invalid_data = result
+    valid_data.extend(chunk_valid_data)
+    for i, error in chunk_errors.items():
+        errors[i + offset] = error
+    for i, value in chunk_invalid_data.items():
+        invalid_data[i + offset] = value
+
+
+class ParallelProcess:
+    """Main process for dumping or loading many objects in chunks on the worker
+    processes or threads. The result is the same as `Catalyst._process_many`.
+
+    :param catalyst: The catalyst to process objects.
+    :param name: "dump" or "load".
+    :param executor: "process" or "thread". The objects, results and the catalyst
+        are pickled for worker processes, but not for threads.
+    :param only: The fields selected for this call, see `Catalyst.dump`.
+    :param exclude: The fields skipped for this call.
+    :param workers: The number of workers, default to the number of CPUs.
+    :param chunksize: The number of objects in each chunk, auto-tuned if not given.
+    :param columns: The names of columns if objects are rows, see `Catalyst.load`.
+    :param shared_memory: Whether worker processes send the values of numeric,
+        boolean and datetime fields by shared memory, instead of pickling them.
+    """
+    def __init__(
+            self, catalyst: CatalystABC, name: str, executor: str,
+            only=None, exclude=None, workers: int = None, chunksize: int = None,
+            columns: tuple = None, shared_memory: bool = False):
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f'Argument "executor" must be one of {EXECUTORS}, not "{executor}".')
+        if workers is not None and workers < 1:
+            raise ValueError('Argument "workers" must be a positive integer.')
+        if chunksize is not None and chunksize < 1:
+            raise ValueError('Argument "chunksize" must be a positive integer.')
+        self.catalyst = catalyst
+        self.name = name
+        self.executor = executor
+        self.only = only
+        self.exclude = exclude
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.columns = columns
+        self.shared_memory = shared_memory
+
+        # the catalyst to process objects in the current process and threads
+        projection = catalyst
+        if only is not None or exclude is not None:
+            projection = catalyst._get_projection(only, exclude)
+        self.all_errors = projection.all_errors
+        self.process_one = _get_process_one(projection, name, columns)
+
+    def __call__(self, data: Iterable):
+        if not isinstance(data, Sequence):
+            data = list(data)
+        valid_data, errors, invalid_data = [], {}, {}
+
+        start = 0
+        chunksize = self.chunksize
+        if chunksize is None:
+            # process the first items in the current process to measure the cost
+            start = min(SAMPLE_SIZE, len(data))
+            begin = time.perf_counter()
+            result = self.catalyst._process_many(
+                islice(data, start), self.all_errors, self.process_one)
+            item_seconds = (time.perf_counter() - begin) / (start or 1)
+            _merge_result(valid_data, errors, invalid_data, result, 0)
+            if errors and not self.all_errors:
+                return valid_data, errors, invalid_data
+            chunksize = tune_chunksize(item_seconds, len(data) - start, self.workers)
+
+        if start < len(data):
+            results = self._process_chunks(data, start, chunksize)
+            for offset, result in results:
+                _merge_result(valid_data, errors, invalid_data, result, offset)
+        return valid_data, errors, invalid_data
+
+    def _process_chunks(self, data: Sequence, start: int, chunksize: int):
+        """Submit chunks to the pool, and return results of chunks in order.
+        If `all_errors` is False, cancel the chunks after the first chunk with errors.
+        """
+        pool = get_pool(self.catalyst, self.workers, self.executor)
+        futures = {}
+        for offset in range(start, len(data), chunksize):
+            chunk = data[offset:offset + chunksize]
+            if self.executor == 'thread':
+                future = pool.submit(
+                    self.catalyst._process_many, chunk, self.all_errors, self.process_one)
+            else:
+                future = pool.submit(
+                    _process_chunk, self.name, self.only, self.exclude, list(chunk),
+                    self.columns, self.shared_memory)
+            futures[future] = offset
+
+        # the offset of the first chunk which has errors
+        stop: Optional[int] = None
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if self.all_errors:
+                    continue
+                for future in done:
+                    offset = futures[future]
+                    if (stop is None or offset < stop) and not future.cancelled() \
+                            and future.exception() is None and _has_errors(future.result()):
+                        stop = offset
+                if stop is not None:
+                    # the chunks after the first error are useless
+                    for future in pending:
+                        if futures[future] > stop:
+                            future.cancel()
+                    pending = {future for future in pending if futures[future] < stop}
+        finally:
+            for future in pending:
+                future.cancel()
+
+        results = []
+        try:
+            for future, offset in futures.items():
+                if stop is not None and offset > stop:
+                    break
+                results.append((offset, receive_result(future.result())))
+        finally:
+            if self.shared_memory:
+                # including the chunks which are still running
+                for future in futures:
+                    future.add_done_callback(_discard_result)
+        return results
@@ -0,0 +1,499 @@
+"""Local service for loading and dumping objects by warm catalysts.
+
+The server hosts catalysts by import paths behind a Unix domain socket, so the
+processes, such as forked web workers, don't need to import and build large
+catalysts. The concurrent requests to the same catalyst are collected within
+a short window, and processed by one call of processing many objects. Each
+request gets its own result, which is the same as calling the catalyst directly.
+
+Start the server::
+
+    python -m catalyst.serve /tmp/catalyst.sock myapp.catalysts:UserCatalyst
+
+And process objects in other processes::
+
+    client = ValidationClient('/tmp/catalyst.sock')
+    result = client.load('myapp.catalysts:UserCatalyst', data)
+
+Requests and results are pickled through `multiprocessing.connection`. The socket
+is only accessible to the owner, and `authkey` can be given to authenticate clients.
+"""
+
+import argparse
+import importlib
+import os
+import socket
+import threading
+import time
+from collections import deque
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import CatalystABC
+from .exceptions import ValidationError
+from .utils import BaseResult
+
+
+# the seconds to wait for more requests after the first request of a batch
+BATCH_WINDOW = 0.001
+# the maximal number of objects processed in a batch
+MAX_BATCH_SIZE = 1024
+
+METHODS = ('dump', 'load', 'dump_many', 'load_many')
+
+
+def import_catalyst(path: str) -> CatalystABC:
+    """Import the catalyst by the path like "package.module:name" or "package.module.name",
+    the catalyst class is instantiated without arguments, other classes are refused.
+    """
+    if ':' in path:
+        module_name, _, attrs = path.partition(':')
+    else:
+        module_name, _, attrs = path.rpartition('.')
+    if not module_name or not attrs:
+        raise ValueError(f'Invalid import path of catalyst "{path}".')
+    obj = importlib.import_module(module_name)
+    for attr in attrs.split('.'):
+        obj = getattr(obj, attr)
+    if isinstance(obj, type):
+        # check before calling anything given by the path
+        if not issubclass(obj, CatalystABC):
+            raise TypeError(f'"{path}" is not a catalyst.')
+        obj = obj()
+    if not isinstance(obj, CatalystABC):
+        raise TypeError(f'"{path}" is not a catalyst.')
+    return obj
+
+
+class _Channel:
+    """The connection of a client, which sends results from threads of batchers."""
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, request_id: int, response):
+        """Send the response of the request, or the error if it can't be pickled,
+        such as the result containing locks, the errors are not raised.
+        """
+        try:
+            message = ForkingPickler.dumps((request_id, response))
+        except Exception as e:  # pylint: disable=broad-except
+            message = ForkingPickler.dumps((request_id, TypeError(
+                f'The response can\'t be pickled: {e!r}')))
+        try:
+            with self._lock:
+                self.conn.send_bytes(message)
+        except (OSError, ValueError):
+            # the client is gone
+            pass
+
+
+class _Request:
+    """A request waiting for being processed in a batch."""
+    __slots__ = ('channel', 'request_id', 'name', 'data', 'many')
+
+    def __init__(self, channel: _Channel, request_id: int, name: str, data: Any, many: bool):
+        self.channel = channel
+        self.request_id = request_id
+        self.name = name
+        self.data = data
+        self.many = many
+
+
+def split_result(
+        result: Tuple[list, dict, dict], offset: int, size: int, many: bool,
+        all_errors: bool) -> Tuple[Any, dict, dict]:
+    """Get the result of a request from the result of the batch, the indexes of
+    the request start at `offset`. If `all_errors` is False, the objects after the
+    first invalid object of the request are dropped, like `Catalyst.load_many`.
+    """
+    valid_data, errors, invalid_data = result
+    if not many:
+        return valid_data[offset], errors.get(offset, {}), invalid_data.get(offset, {})
+    request_errors, request_invalid_data = {}, {}
+    end = offset + size
+    for i in range(offset, end):
+        if i in errors:
+            request_errors[i - offset] = errors[i]
+            request_invalid_data[i - offset] = invalid_data[i]
+            if not all_errors:
+                end = i + 1
+                break
+    return valid_data[offset:end], request_errors, request_invalid_data
+
+
+class _Batcher:
+    """Collect the requests to a catalyst, and process them in batches on a thread."""
+    def __init__(self, catalyst: CatalystABC, window: float, max_size: int):
+        if hasattr(catalyst, '_freeze'):
+            # the catalyst is shared by threads
+            catalyst._freeze()
+        self.catalyst = catalyst
+        self.window = window
+        self.max_size = max_size
+        # the number of processed batches
+        self.batches = 0
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, request: _Request):
+        with self._condition:
+            self._queue.append(request)
+            self._condition.notify()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _collect(self) -> List[_Request]:
+        """Wait for the first request, then collect requests until the window
+        ends or the batch is full.
+        """
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                return []
+            deadline = time.monotonic() + self.window
+            batch, size = [], 0
+            while size < self.max_size:
+                if self._queue:
+                    request = self._queue.popleft()
+                    batch.append(request)
+                    size += len(request.data) if request.many else 1
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    break
+                self._condition.wait(remaining)
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if not batch:
+                return
+            for name in ('dump', 'load'):
+                requests = [request for request in batch if request.name == name]
+                if requests:
+                    self._process(name, requests)
+
+    def _process(self, name: str, requests: List[_Request]):
+        """Process the requests, and send the results to clients."""
+        catalyst = self.catalyst
+        responses = None
+        if all(catalyst._is_default_method(method) for method in (
+                f'{name}_many', f'pre_{name}_many', f'post_{name}_many')):
+            try:
+                responses = self._process_batch(name, requests)
+            except Exception:  # pylint: disable=broad-except
+                # an object raised error which is not collected, process the
+                # requests separately, so that only its request gets the error
+                responses = None
+        if responses is None:
+            # the pre and post processes need the objects of each request
+            responses = [self._process_request(name, request) for request in requests]
+
+        self.batches += 1
+        for request, response in zip(requests, responses):
+            request.channel.send(request.request_id, response)
+
+    def _process_batch(self, name: str, requests: List[_Request]) -> list:
+        """Process the objects of all requests at once, the objects of different
+        requests are independent, so all errors are collected.
+        """
+        catalyst = self.catalyst
+        items, sizes = [], []
+        for request in requests:
+            if request.many:
+                data = list(request.data)
+                items.extend(data)
+                sizes.append(len(data))
+            else:
+                items.append(request.data)
+                sizes.append(1)
+        result = catalyst._process_many(items, True, catalyst._get_process_one(name))
+
+        responses = []
+        offset = 0
+        result_class = getattr(catalyst, f'{name}_result_class')
+        for request, size in zip(requests, sizes):
+            responses.append(result_class(*split_result(
+                result, offset, size, request.many, catalyst.all_errors)))
+            offset += size
+        return responses
+
+    def _process_request(self, name: str, request: _Request):
+        """Process a request by the catalyst, return the result or the error."""
+        method = f'{name}_many' if request.many else name
+        try:
+            return getattr(self.catalyst, method)(request.data, raise_error=False)
+        except Exception as e:  # pylint: disable=broad-except
+            return e
+
+
+class ValidationServer:
+    """Serve requests of loading and dumping objects from local processes.
+
+    :param address: The path of the Unix domain socket.
+    :param catalysts: The import paths of catalysts to import on start, the other
+        catalysts are imported on their first requests.
+    :param batch_window: The seconds to wait for more requests to the same catalyst
+        after the first request, which is the extra latency of a request.
+    :param max_batch_size: The maximal number of objects in a batch.
+    :param authkey: The secret key to authenticate clients.
+    :param allowed: If given, only these import paths can be requested.
+    """
+    def __init__(
+            self, address: str, catalysts: Iterable[str] = (),
+            batch_window: float = BATCH_WINDOW, max_batch_size: int = MAX_BATCH_SIZE,
+            authkey: bytes = None, allowed: Iterable[str] = None):
+        if batch_window < 0:
+            raise ValueError('Argument "batch_window" must be a non-negative number.')
+        if max_batch_size < 1:
+            raise ValueError('Argument "max_batch_size" must be a positive integer.')
+        self.address = address
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.authkey = authkey
+        self.allowed = None if allowed is None else frozenset(allowed)
+        self.requests = 0
+        self._batchers: Dict[str, _Batcher] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[Listener] = None
+        self._connections = set()
+        self._thread: Optional[threading.Thread] = None
+        for path in catalysts:
+            self._get_batcher(path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_batcher(self, path: str) -> _Batcher:
+        batcher = self._batchers.get(path)
+        if batcher is None:
+            if self.allowed is not None and path not in self.allowed:
+                raise ValueError(f'Catalyst "{path}" is not allowed.')
+            with self._lock:
+                batcher = self._batchers.get(path)
+                if batcher is None:
+                    batcher = self._batchers[path] = _Batcher(
+                        import_catalyst(path), self.batch_window, self.max_batch_size)
+        return batcher
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The numbers of received requests and processed batches."""
+        return {
+            'requests': self.requests,
+            'batches': sum(batcher.batches for batcher in list(self._batchers.values())),
+        }
+
+    def _listen(self):
+        if os.path.exists(self.address):
+            # the socket left by the server which is not closed
+            os.unlink(self.address)
+        self._listener = Listener(self.address, 'AF_UNIX', authkey=self.authkey)
+        # the umask is not changed, which is shared by other threads
+        os.chmod(self.address, 0o600)
+
+    def start(self) -> 'ValidationServer':
+        """Start serving on a thread."""
+        self._listen()
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve on the current thread until the server is closed."""
+        self._listen()
+        self._accept()
+
+    def _accept(self):
+        listener = self._listener
+        while True:
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self._listener is None:
+                    return
+                # the client failed to authenticate
+                continue
+            if self._listener is None:
+                # the connection made by `close`
+                conn.close()
+                return
+            with self._lock:
+                self._connections.add(conn)
+            threading.Thread(target=self._receive, args=(conn,), daemon=True).start()
+
+    def _receive(self, conn: Connection):
+        """Receive requests from the client, and submit them to the batchers."""
+        channel = _Channel(conn)
+        try:
+            while True:
+                try:
+                    request_id, path, method, data = conn.recv()
+                except (EOFError, OSError):
+                    return
+                with self._lock:
+                    self.requests += 1
+                try:
+                    if method not in METHODS:
+                        raise ValueError(f'Method must be one of {METHODS}, not "{method}".')
+                    batcher = self._get_batcher(path)
+                except Exception as e:  # pylint: disable=broad-except
+                    channel.send(request_id, e)
+                    continue
+                name, _, many = method.partition('_')
+                batcher.submit(_Request(channel, request_id, name, data, bool(many)))
+        finally:
+            with self._lock:
+                self._connections.discard(conn)
+            conn.close()
+
+    def close(self):
+        """Stop accepting clients, close connections and the batchers."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            if self._thread is not None:
+                # closing the socket doesn't interrupt `accept` on other threads
+                with socket.socket(socket.AF_UNIX) as sock:
+                    try:
+                        sock.connect(self.address)
+                    except OSError:
+                        pass
+                self._thread.join()
+                self._thread = None
+            listener.close()
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            conn.close()
+        for batcher in self._batchers.values():
+            batcher.close()
+        self._batchers.clear()
+
+
+class ValidationClient:
+    """Client of `ValidationServer`, which can be shared by threads.
+
+    :param address: The path of the Unix domain socket.
+    :param authkey: The secret key of the server.
+    :param raise_error: Whether to raise error if the result is invalid, which can
+        be overridden by the argument of each request.
+    """
+    def __init__(self, address: str, authkey: bytes = None, raise_error: bool = False):
+        self.address = address
+        self.authkey = authkey
+        self.raise_error = raise_error
+        self._conn: Optional[Connection] = None
+        # the process which made the connection
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._request_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __getstate__(self):
+        # the connection is not shared by processes, such as forked workers
+        state = self.__dict__.copy()
+        state['_conn'] = state['_pid'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def request(self, path: str, method: str, data: Any, raise_error: bool = None) -> BaseResult:
+        """Send the request and wait for the result."""
+        with self._lock:
+            if self._conn is not None and self._pid != os.getpid():
+                # the socket inherited by a forked process is shared with the
+                # parent, and responses would be mixed up, connect again
+                self._conn = None
+            if self._conn is None:
+                self._conn = Client(self.address, 'AF_UNIX', authkey=self.authkey)
+                self._pid = os.getpid()
+            self._request_id += 1
+            request_id = self._request_id
+            try:
+                self._conn.send((request_id, path, method, data))
+                _, result = self._conn.recv()
+            except BaseException:
+                # the response might be received by the next request
+                self._conn.close()
+                self._conn = None
+                raise
+        if isinstance(result, Exception):
+            raise result
+        if raise_error is None:
+            raise_error = self.raise_error
+        if raise_error and not result.is_valid:
+            raise ValidationError(msg=result.format_errors(), detail=result)
+        return result
+
+    def dump(self, path: str, data: Any, raise_error: bool = None) -> BaseResult:
+        return self.request(path, 'dump', data, raise_error)
+
+    def load(self, path: str, data: Any, raise_error: bool = None) -> BaseResult:
+        return self.request(path, 'load', data, raise_error)
+
+    def dump_many(self, path: str, data: Iterable, raise_error: bool = None) -> BaseResult:
+        return self.request(path, 'dump_many', list(data), raise_error)
+
+    def load_many(self, path: str, data: Iterable, raise_error: bool = None) -> BaseResult:
+        return self.request(path, 'load_many', list(data), raise_error)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m catalyst.serve', description=__doc__.partition('\n')[0])
+    parser.add_argument('address', help='the path of the Unix domain socket')
+    parser.add_argument('catalysts', nargs='*', help='the import paths of catalysts to serve')
+    parser.add_argument(
+        '--batch-window', type=float, default=BATCH_WINDOW,
+        help='the seconds to wait for more requests of a batch')
+    parser.add_argument(
+        '--max-batch-size', type=int, default=MAX_BATCH_SIZE,
+        help='the maximal number of objects in a batch')
+    parser.add_argument(
+        '--only', action='store_true', help='only serve the given catalysts')
+    options = parser.parse_args(args)
+    # the key is not passed by arguments, which are visible to other users
+    authkey = os.environ.get('CATALYST_SERVE_AUTHKEY')
+    server = ValidationServer(
+        options.address, options.catalysts, options.batch_window, options.max_batch_size,
+        authkey=None if authkey is None else authkey.encode(),
+        allowed=options.catalysts if options.only else None)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
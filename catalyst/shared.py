@@ -0,0 +1,385 @@
+"""Transport the results of many objects from worker processes by shared memory.
+
+Pickling the dicts of results back to the parent process is slow. Instead, the worker
+writes the values of integer, float, boolean, date and datetime fields to columns
+in a block of shared memory, and returns a small handle, which contains the name
+of the block and the other values, such as strings, `None` and errors.
+The parent maps the block and reads the columns without copying, or rebuilds the
+result. For example::
+
+    # in worker processes
+    def load_chunk(chunk):
+        return share_result(catalyst, 'load', catalyst.load_many(chunk))
+
+    # in the parent process, the block is removed on exit
+    with pool.submit(load_chunk, chunk).result() as shared:
+        # memoryviews of the shared memory, which are released before closing
+        with shared.columns()['price'].values as prices:
+            total = sum(prices)
+        # or rebuild the result, which is the same as `load_many`
+        result = shared.to_result()
+
+The block is owned by the process which opens the handle, and it's removed by
+`unlink` or on exiting the context. The datetime values are kept in shared memory
+if they are naive, or if their `tzinfo` is the same `datetime.timezone`, otherwise
+they are pickled, such as values with `zoneinfo.ZoneInfo`. Shared memory requires
+Python 3.8, which is imported on first use.
+"""
+
+import datetime
+from array import array
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import CatalystABC
+from .fields import (
+    BooleanField, DateField, DatetimeField, DecimalField, Field, FloatField, IntegerField,
+    TimeField,
+)
+from .utils import BaseResult
+
+
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+_MICROSECOND = datetime.timedelta(microseconds=1)
+# the alignment of columns in the block
+ALIGNMENT = 8
+# the value is not in the dict of valid data
+_absent = object()
+
+SharedColumn = namedtuple('SharedColumn', ['values', 'valid'])
+SharedColumn.__doc__ = """A column of values of a field.
+
+:param values: The memoryview of values in the shared memory, the items are int64
+    for integers, float64 for floats, bool for booleans, int64 days since the
+    epoch for dates, and int64 microseconds since the epoch in UTC for datetimes,
+    and the invalid items are 0. For the other fields, it's the list of values.
+:param valid: The memoryview or list of booleans, which is False if the value is
+    missing or None.
+"""
+
+# the type of column, the typecode of `array`, the format of memoryview and the
+# exact type of values
+ColumnType = namedtuple('ColumnType', ['kind', 'typecode', 'format', 'type'])
+
+COLUMN_TYPES = {
+    'int': ColumnType('int', 'q', 'q', int),
+    'float': ColumnType('float', 'd', 'd', float),
+    'bool': ColumnType('bool', 'B', '?', bool),
+    'date': ColumnType('date', 'q', 'q', datetime.date),
+    'datetime': ColumnType('datetime', 'q', 'q', datetime.datetime),
+}
+
+# the kinds of columns of fields, which are checked in order
+FIELD_KINDS = (
+    (TimeField, None),
+    (DateField, 'date'),
+    (DatetimeField, 'datetime'),
+    (BooleanField, 'bool'),
+    (IntegerField, 'int'),
+    (DecimalField, None),
+    (FloatField, 'float'),
+)
+
+
+def column_kind(field: Field) -> Optional[str]:
+    """Return the kind of column of the values of the field, or None if the values
+    are pickled.
+    """
+    for field_class, kind in FIELD_KINDS:
+        if isinstance(field, field_class):
+            return kind
+    return None
+
+
+def _encode_datetimes(
+        values: list, items: list) -> Optional[Tuple[list, Optional[datetime.timezone]]]:
+    """Convert the datetimes to microseconds since the epoch in their time zone.
+    Return None if the time zones are different or not `datetime.timezone`.
+    """
+    # time zones are equal if offsets are equal, compare names too
+    zones = {(value.tzinfo, None if value.tzinfo is None else value.tzname())
+             for value in items}
+    if len(zones) > 1:
+        return None
+    tz = zones.pop()[0] if zones else None
+    if tz is not None and not isinstance(tz, datetime.timezone):
+        # the other time zones may have different offsets, such as `ZoneInfo`
+        return None
+    epoch = EPOCH if tz is None else EPOCH + tz.utcoffset(None)
+    return [0 if value is None else (value.replace(tzinfo=None) - epoch) // _MICROSECOND
+            for value in values], tz
+
+
+def _encode_column(
+        kind: str, values: list,
+        present: List[int]) -> Optional[Tuple[array, Optional[datetime.timezone]]]:
+    """Make the array of the values, and the time zone of datetimes.
+    Return None if the values don't fit the column, such as the formatted values.
+    """
+    items = [values[i] for i in present]
+    value_type = COLUMN_TYPES[kind].type
+    # the values of subclasses would be decoded as the base type, such as `IntEnum`,
+    # booleans of integer columns and datetimes of date columns
+    # pylint: disable=unidiomatic-typecheck
+    if not all(type(value) is value_type for value in items):
+        return None
+    tz = None
+    if kind == 'date':
+        values = [0 if value is None else value.toordinal() - EPOCH_ORDINAL
+                  for value in values]
+    elif kind == 'datetime':
+        encoded = _encode_datetimes(values, items)
+        if encoded is None:
+            return None
+        values, tz = encoded
+    try:
+        return array(COLUMN_TYPES[kind].typecode, [0 if value is None else value
+                                                   for value in values]), tz
+    except OverflowError:
+        return None
+
+
+def _decode_values(kind: str, values: list, tz: Optional[datetime.timezone]) -> list:
+    """Convert the values of column to the values of fields."""
+    if kind == 'date':
+        return [datetime.date.fromordinal(value + EPOCH_ORDINAL) for value in values]
+    if kind == 'datetime':
+        if tz is None:
+            return [EPOCH + value * _MICROSECOND for value in values]
+        epoch = EPOCH + tz.utcoffset(None)
+        return [(epoch + value * _MICROSECOND).replace(tzinfo=tz) for value in values]
+    return values
+
+
+def _shared_memory(name: str = None, create: bool = False, size: int = 0):
+    """Create or attach a block of shared memory, the module is imported here
+    since it requires Python 3.8.
+    """
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+    return shared_memory.SharedMemory(name, create, size)
+
+
+def _untrack(shm):
+    """Stop tracking the block by the resource tracker of the current process,
+    so it's not removed when the worker exits, and is owned by the parent.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel, protected-access
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    except (ImportError, AttributeError):  # pragma: no cover
+        pass
+
+
+class SharedResult:
+    """The handle of the result in shared memory, which is small to pickle.
+    Made by `share_result`.
+
+    :param name: The name of the block of shared memory, or None if there are
+        no columns in shared memory.
+    :param size: The number of objects.
+    :param layout: The keys of targets of fields in order, the kinds of columns,
+        the offsets of values and flags in the block, and the time zones of
+        datetimes, the kind is None if the values are pickled.
+    :param objects: The values which are pickled, keyed by keys and indexes.
+    :param nulls: The indexes of None values of columns in shared memory.
+    :param other_rows: The valid data which are not dicts of fields, keyed by indexes.
+    :param errors: The errors of the result.
+    :param invalid_data: The invalid data of the result.
+    :param result_class: The class of result to rebuild.
+    """
+    def __init__(
+            self, name: Optional[str], size: int, layout: list, objects: Dict[str, dict],
+            nulls: Dict[str, list], other_rows: dict, errors: dict, invalid_data: dict,
+            result_class: type):
+        self.name = name
+        self.size = size
+        self.layout = layout
+        self.objects = objects
+        self.nulls = nulls
+        self.other_rows = other_rows
+        self.errors = errors
+        self.invalid_data = invalid_data
+        self.result_class = result_class
+        self._shm: Any = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shm'] = None
+        return state
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        self.unlink()
+
+    def open(self) -> 'SharedResult':
+        """Map the block of shared memory into the current process."""
+        if self._shm is None and self.name is not None:
+            self._shm = _shared_memory(self.name)
+        return self
+
+    def close(self):
+        """Unmap the block, the memoryviews of columns must be released before."""
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self):
+        """Remove the block of shared memory, which can't be opened any more."""
+        if self.name is None:
+            return
+        if self._shm is None:
+            self._shm = _shared_memory(self.name)
+            self._shm.close()
+        self._shm.unlink()
+        self.name = None
+
+    def _column(self, kind: str, offset: int, flags_offset: int) -> SharedColumn:
+        column_type = COLUMN_TYPES[kind]
+        if self.name is None:
+            # there are no objects
+            return SharedColumn(
+                memoryview(b'').cast(column_type.format), memoryview(b'').cast('?'))
+        buf = self.open()._shm.buf
+        end = offset + self.size * array(column_type.typecode).itemsize
+        values = buf[offset:end].cast(column_type.format)
+        valid = buf[flags_offset:flags_offset + self.size].cast('?')
+        return SharedColumn(values, valid)
+
+    def columns(self) -> Dict[str, SharedColumn]:
+        """Return the columns of values of the fields, which are keyed by the keys
+        of targets of fields. The columns in shared memory are memoryviews without
+        copying, which must be released before closing the handle.
+        """
+        columns = {}
+        for key, kind, offset, flags_offset, _ in self.layout:
+            if kind is None:
+                values = self.objects[key]
+                columns[key] = SharedColumn(
+                    [values.get(i) for i in range(self.size)],
+                    [values.get(i) is not None for i in range(self.size)])
+            else:
+                columns[key] = self._column(kind, offset, flags_offset)
+        return columns
+
+    def to_tuple(self) -> Tuple[list, dict, dict]:
+        """Rebuild the valid data, errors and invalid data of the result."""
+        size = self.size
+        rows = [{} for _ in range(size)]
+        for key, kind, offset, flags_offset, tz in self.layout:
+            if kind is None:
+                for i, value in self.objects[key].items():
+                    rows[i][key] = value
+                continue
+            values, valid = self._column(kind, offset, flags_offset)
+            with values, valid:
+                present = [i for i, is_valid in enumerate(valid.tolist()) if is_valid]
+                items = values.tolist()
+            items = _decode_values(kind, [items[i] for i in present], tz)
+            for i, value in zip(present, items):
+                rows[i][key] = value
+            for i in self.nulls.get(key, ()):
+                rows[i][key] = None
+        for i, row in self.other_rows.items():
+            rows[i] = row
+        return rows, self.errors, self.invalid_data
+
+    def to_result(self) -> BaseResult:
+        """Rebuild the result, which is the same as the shared result."""
+        return self.result_class(*self.to_tuple())
+
+
+def share_result(
+        catalyst: CatalystABC, name: str, result, result_class: type = None) -> SharedResult:
+    """Write the result of `dump_many` or `load_many` to a block of shared memory,
+    and return the handle to pickle and send to the parent process.
+    The columns are decided by the types of fields of the catalyst.
+
+    :param catalyst: The catalyst which made the result.
+    :param name: "dump" or "load".
+    :param result: The result, or the tuple of valid data, errors and invalid data.
+    :param result_class: The class of result to rebuild, default to the result class
+        of the catalyst.
+    """
+    if isinstance(result, BaseResult):
+        result = (result.valid_data, result.errors, result.invalid_data)
+    if result_class is None:
+        result_class = getattr(catalyst, f'{name}_result_class')
+    valid_data, errors, invalid_data = result
+    target_attr = 'key' if name == 'dump' else 'name'
+    field_dict = getattr(catalyst, f'_{name}_fields')
+    fields: Dict[str, Field] = {}
+    for field in field_dict.values():
+        if isinstance(field, Field):
+            fields.setdefault(getattr(field, target_attr), field)
+
+    # the rows which are not dicts of fields are pickled
+    other_rows = {}
+    for i, row in enumerate(valid_data):
+        # the subclasses of dict are pickled to keep their types, such as `OrderedDict`
+        if type(row) is not dict or not all(  # pylint: disable=unidiomatic-typecheck
+                key in fields for key in row):
+            other_rows[i] = row
+    size = len(valid_data)
+
+    layout, objects, nulls, arrays = [], {}, {}, []
+    block_size = 0
+    for key, field in fields.items():
+        values = [
+            None if i in other_rows else valid_data[i].get(key, _absent)
+            for i in range(size)]
+        flags = [value is not _absent and value is not None for value in values]
+        values = [None if value is _absent else value for value in values]
+        kind = column_kind(field)
+        encoded = None
+        if kind is not None:
+            encoded = _encode_column(kind, values, [i for i, flag in enumerate(flags) if flag])
+        if encoded is None:
+            objects[key] = {
+                i: valid_data[i][key] for i in range(size)
+                if i not in other_rows and key in valid_data[i]}
+            layout.append((key, None, 0, 0, None))
+            continue
+        column, tz = encoded
+        nulls[key] = [
+            i for i, value in enumerate(values)
+            if value is None and i not in other_rows and key in valid_data[i]]
+        offset = block_size
+        flags_offset = _align(offset + len(column) * column.itemsize)
+        block_size = _align(flags_offset + size)
+        layout.append((key, kind, offset, flags_offset, tz))
+        arrays.append((offset, column, flags_offset, bytes(flags)))
+
+    shm_name = None
+    if block_size:
+        shm = _shared_memory(create=True, size=block_size)
+        try:
+            buf = shm.buf
+            for offset, column, flags_offset, flags in arrays:
+                with memoryview(column) as view, view.cast('B') as data:
+                    buf[offset:offset + len(data)] = data
+                buf[flags_offset:flags_offset + len(flags)] = flags
+            del buf
+            _untrack(shm)
+        finally:
+            shm.close()
+        shm_name = shm.name
+    return SharedResult(
+        shm_name, size, layout, objects, nulls, other_rows, errors, invalid_data, result_class)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def receive_result(result) -> Tuple[list, dict, dict]:
+    """Rebuild the tuple of result from the handle and remove the block, or return
+    the tuple as it is.
+    """
+    if not isinstance(result, SharedResult):
+        return result
+    with result:
+        return result.to_tuple()
@@ -1,4 +1,7 @@
-from typing import Mapping, Iterable, Dict
+from functools import partial
+from operator import attrgetter, itemgetter
+from types import FunctionType, MemberDescriptorType
+from typing import Any, Mapping, Iterable, Dict, Callable, Sequence, Tuple
 
 from .exceptions import ValidationError
 
@@ -136,6 +139,202 @@ def assign_item_getter(obj):
     raise TypeError(f'"{obj}" is not Mapping.')
 
 
+def get_each(obj, names: Iterable, get: Callable):
+    """Get values one by one, collect errors instead of raising.
+    The value is `missing` if it does not exist or error occurs.
+    """
+    values, errors = [], None
+    for name in names:
+        try:
+            values.append(get(obj, name, missing))
+        except Exception as e:  # pylint: disable=broad-except
+            values.append(missing)
+            if errors is None:
+                errors = {}
+            errors[name] = e
+    return values, errors
+
+
+def mapping_get(obj: Mapping, name, default=None):
+    return obj.get(name, default)
+
+
+class ValuesGetter:
+    """Get values of fields from an object in one call, such as
+    ``operator.attrgetter(*names)``. The access strategy is made according to
+    the type of object for the first time, and cached for the type.
+
+    Calling the getter returns a tuple ``(values, errors)``. A value is `missing`
+    if it does not exist in the object. If errors occur when getting values,
+    `errors` is a dict whose keys are names, otherwise `errors` is `None`.
+
+    :param names: The keys or attribute names to get values.
+    :param assign_getter: A function assigns the getter like `getattr`
+        according to the object, such as `assign_attr_or_item_getter`.
+        The access strategies are cached only for the builtin functions.
+    """
+
+    def __init__(self, names: Iterable, assign_getter: Callable = assign_attr_or_item_getter):
+        self.names = tuple(names)
+        self.assign_getter = assign_getter
+        self._strategies: Dict[type, Callable] = {}
+
+    def __call__(self, obj):
+        try:
+            strategy = self._strategies[type(obj)]
+        except KeyError:
+            strategy = self._strategies[type(obj)] = self._make_strategy(type(obj))
+        return strategy(obj)
+
+    def _get_by_assigned_getter(self, obj):
+        return get_each(obj, self.names, self.assign_getter(obj))
+
+    def _bulk(self, fast_get: Callable, slow_get: Callable, source: Callable = None):
+        """Get values by `fast_get` which raises error if any value is missing,
+        and fall back to get values one by one with `slow_get`. The values got by
+        `fast_get` are got again, so that getting them must have no side effects."""
+        names = self.names
+
+        def get_values(obj):
+            try:
+                return fast_get(obj if source is None else source(obj)), None
+            except Exception:  # pylint: disable=broad-except
+                return get_each(obj, names, slow_get)
+        return get_values
+
+    def _make_getter(self, getter_class: type, names: tuple):
+        if not names:
+            return lambda obj: ()
+        getter = getter_class(*names)
+        if len(names) == 1:
+            return lambda obj: (getter(obj),)
+        return getter
+
+    def _make_strategy(self, cls: type) -> Callable:
+        if self.assign_getter not in (assign_attr_or_item_getter, assign_item_getter):
+            return self._get_by_assigned_getter
+
+        if issubclass(cls, Mapping):
+            return self._make_mapping_strategy(cls)
+
+        if self.assign_getter is assign_item_getter:
+            def raise_error(obj):
+                raise TypeError(f'"{obj}" is not Mapping.')
+            return raise_error
+        return self._make_object_strategy(cls)
+
+    def _make_mapping_strategy(self, cls: type) -> Callable:
+        names = self.names
+        if issubclass(cls, dict):
+            # `dict.get` ignores `__missing__` and overridden methods of subclasses
+            if cls.__getitem__ is dict.__getitem__ and not hasattr(cls, '__missing__'):
+                return self._bulk(self._make_getter(itemgetter, names), dict.get)
+            return partial(get_each, names=names, get=dict.get)
+        # `__getitem__` of other mappings may have side effects
+        return partial(get_each, names=names, get=mapping_get)
+
+    def _make_object_strategy(self, cls: type) -> Callable:
+        names = self.names
+        # attributes of namedtuple are items of tuple
+        fields = getattr(cls, '_fields', None)
+        if issubclass(cls, tuple) and isinstance(fields, tuple) \
+                and all(name in fields for name in names):
+            indexes = tuple(fields.index(name) for name in names)
+            return self._bulk(self._make_getter(itemgetter, indexes), getattr)
+
+        if self._is_vars_safe(cls):
+            return self._bulk(self._make_getter(itemgetter, names), getattr, vars)
+        if self._is_plain_attrs(cls):
+            return self._bulk(self._make_getter(attrgetter, names), getattr)
+        # get each value once, such as properties with side effects
+        return partial(get_each, names=names, get=getattr)
+
+    def _is_vars_safe(self, cls: type) -> bool:
+        """Whether getting values from ``vars(obj)`` is the same as `getattr`.
+        The attributes must not be defined on class, except fields of dataclass
+        with default values, and attribute access is not customized.
+        """
+        if cls.__getattribute__ is not object.__getattribute__ or hasattr(cls, '__getattr__'):
+            return False
+        # instances have no `__dict__` if `__slots__` is defined
+        if not getattr(cls, '__dictoffset__', 0):
+            return False
+        dataclass_fields = getattr(cls, '__dataclass_fields__', {})
+        for name in self.names:
+            if not isinstance(name, str):
+                return False
+            for klass in cls.__mro__:
+                if name in vars(klass):
+                    value = vars(klass)[name]
+                    if name not in dataclass_fields or hasattr(type(value), '__get__'):
+                        return False
+        return True
+
+    def _is_plain_attrs(self, cls: type) -> bool:
+        """Whether getting the attributes has no side effects. The attributes
+        must not be descriptors defined on class, except slots and methods,
+        and attribute access is not customized.
+        """
+        if cls.__getattribute__ is not object.__getattribute__ or hasattr(cls, '__getattr__'):
+            return False
+        for name in self.names:
+            if not isinstance(name, str):
+                return False
+            for klass in cls.__mro__:
+                if name in vars(klass):
+                    value = vars(klass)[name]
+                    if hasattr(type(value), '__get__') and not isinstance(
+                            value, (MemberDescriptorType, FunctionType)):
+                        return False
+                    break
+        return True
+
+
+class RowGetter(ValuesGetter):
+    """Get values of fields from a row by positions of columns, such as rows of
+    `csv.reader` and DB-API cursors, without converting rows to dicts. The positions
+    are found by the names of columns once, and the values of fields without
+    columns or beyond the end of row are `missing`.
+
+    :param names: The keys of fields.
+    :param columns: The names of columns, the first one is used if names are duplicated.
+    """
+
+    def __init__(self, names: Iterable, columns: Iterable):
+        super().__init__(names)
+        self.columns = tuple(columns)
+        self.positions: Dict[Any, int] = {}
+        for i, column in enumerate(self.columns):
+            self.positions.setdefault(column, i)
+        # the fields without columns get the `missing` appended to the row
+        indexes = tuple(self.positions.get(name, -1) for name in self.names)
+        source = None
+        if -1 in indexes:
+            source = self._append_missing
+        self._get_values = self._bulk(
+            self._make_getter(itemgetter, indexes), self._get_item, source)
+
+    def __call__(self, row):
+        return self._get_values(row)
+
+    @staticmethod
+    def _append_missing(row):
+        return (*row, missing)
+
+    def _get_item(self, row, name, default):
+        position = self.positions.get(name)
+        if position is None or position >= len(row):
+            return default
+        return row[position]
+
+
+def column_names(columns: Iterable) -> Tuple:
+    """Get names of columns, which are the first items of `cursor.description`."""
+    return tuple(
+        column if isinstance(column, str) or not isinstance(column, Sequence) else column[0]
+        for column in columns)
+
+
 def no_processing(value):
     return value
 
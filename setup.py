@@ -1,6 +1,6 @@
 import re
 
-from setuptools import setup
+from setuptools import setup, find_packages
 
 
 def read(path):
@@ -24,9 +24,10 @@ setup(
     author="Fosssen",
     author_email="fossen@fossen.cn",
     license="MIT",
-    packages=['catalyst'],
+    packages=find_packages(exclude=['tests', 'tests.*']),
     include_package_data=False,
     zip_safe=False,
     install_requires=[],
+    extras_require={'numpy': ['numpy']},
     python_requires=">=3.5",
 )
@@ -0,0 +1,201 @@
+import asyncio
+from unittest import TestCase, mock
+
+from catalyst import aio
+from catalyst.core import Catalyst
+from catalyst.exceptions import ValidationError
+from catalyst.fields import CallableField, IntegerField, NestedField, StringField
+from catalyst.groups import FieldGroup
+from catalyst.utils import missing
+
+
+class Counter:
+    """Record the number of coroutines running at the same time."""
+
+    def __init__(self):
+        self.running = self.max_running = 0
+
+    async def fetch(self, value, delay=0.01):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.running -= 1
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+class Article:
+    def __init__(self, counter, id, views=1, likes=2, title=None):
+        self.counter = counter
+        self.id = id
+        self._title = f'title {id}' if title is None else title
+        self._views = views
+        self.likes = likes
+        self.followers = 10
+
+    @property
+    def author(self):
+        return {'name': 'fossen', 'followers': self.counter.fetch(self.followers)}
+
+    def views(self):
+        return self.counter.fetch(self._views)
+
+    @property
+    def title(self):
+        return self.counter.fetch(self._title)
+
+
+class TotalGroup(FieldGroup):
+    def dump(self, data, original_data=None):
+        data['total'] = data['views'] + data['likes']
+        return data
+
+
+class AuthorCatalyst(Catalyst):
+    name = StringField()
+    followers = IntegerField()
+
+
+class ArticleCatalyst(Catalyst):
+    id = IntegerField()
+    title = StringField()
+    views = CallableField()
+    likes = IntegerField()
+    total = TotalGroup(declared_fields=['views', 'likes'])
+    author = NestedField(AuthorCatalyst())
+
+
+class AsyncDumpTest(TestCase):
+    def test_dump_async(self):
+        counter = Counter()
+        catalyst = ArticleCatalyst()
+        result = asyncio.run(catalyst.dump_async(Article(counter, 1)))
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.valid_data, {
+            'id': 1, 'title': 'title 1', 'views': 1, 'likes': 2, 'total': 3,
+            'author': {'name': 'fossen', 'followers': 10}})
+        # keep the order of fields
+        self.assertEqual(
+            list(result.valid_data), ['id', 'title', 'views', 'likes', 'author', 'total'])
+        self.assertGreater(counter.max_running, 1)
+
+        result = asyncio.run(catalyst.dump_async(Article(counter, 1), only=['views']))
+        self.assertEqual(result.valid_data, {'views': 1})
+
+        # the errors of awaitables are collected
+        article = Article(counter, 1, views=ValueError(), title=KeyError())
+        result = asyncio.run(catalyst.dump_async(article))
+        self.assertEqual(set(result.errors), {'title', 'views'})
+        self.assertIsInstance(result.errors['title'], KeyError)
+        self.assertIsInstance(result.errors['views'], ValueError)
+        self.assertEqual(result.invalid_data['views'], article.views)
+        self.assertEqual(result.valid_data, {
+            'id': 1, 'likes': 2, 'author': {'name': 'fossen', 'followers': 10}})
+        self.assertEqual(list(result.valid_data), ['id', 'likes', 'author'])
+        with self.assertRaises(ValidationError):
+            asyncio.run(catalyst.dump_async(Article(counter, 1, likes='x'), raise_error=True))
+
+        article = Article(counter, 1)
+        article.followers = 'x'
+        result = asyncio.run(catalyst.dump_async(article))
+        self.assertEqual(set(result.errors['author']), {'followers'})
+
+        # the valid data of the invalid nested object keeps its position
+        class AuthorFirstCatalyst(Catalyst):
+            author = NestedField(AuthorCatalyst())
+            id = IntegerField()
+
+        result = asyncio.run(AuthorFirstCatalyst().dump_async(article))
+        self.assertEqual(result.valid_data, {'author': {'name': 'fossen'}, 'id': 1})
+        self.assertEqual(list(result.valid_data), ['author', 'id'])
+
+        # the fields after the first error are skipped
+        catalyst = ArticleCatalyst(all_errors=False, exclude=['author'])
+        article = Article(counter, 1, views=ValueError(), title=KeyError())
+        result = asyncio.run(catalyst.dump_async(article))
+        self.assertEqual(set(result.errors), {'title'})
+
+        with self.assertRaises(ValueError):
+            asyncio.run(catalyst.dump_async(Article(counter, 1), concurrency=0))
+
+    def test_dump_many_async(self):
+        counter = Counter()
+        catalyst = ArticleCatalyst()
+        articles = [Article(counter, i) for i in range(20)]
+        result = asyncio.run(catalyst.dump_many_async(articles, concurrency=5))
+        self.assertEqual([item['title'] for item in result.valid_data],
+                         [f'title {i}' for i in range(20)])
+        self.assertEqual(counter.max_running, 5)
+
+        async def dump_concurrently():
+            # share the limit among calls
+            semaphore = asyncio.Semaphore(3)
+            return await asyncio.gather(*(
+                catalyst.dump_many_async(
+                    [Article(counter, i) for i in range(5)], concurrency=semaphore)
+                for _ in range(4)))
+
+        counter.max_running = 0
+        results = asyncio.run(dump_concurrently())
+        self.assertTrue(all(result.is_valid for result in results))
+        self.assertEqual(counter.max_running, 3)
+
+        articles = [Article(counter, i, likes='x' if i in (3, 5) else 1) for i in range(8)]
+        result = asyncio.run(catalyst.dump_many_async(articles))
+        self.assertEqual(set(result.errors), {3, 5})
+        self.assertEqual(len(result.valid_data), 8)
+        catalyst = ArticleCatalyst(all_errors=False, exclude=['author'])
+        result = asyncio.run(catalyst.dump_many_async(articles))
+        self.assertEqual(set(result.errors), {3})
+        self.assertEqual(len(result.valid_data), 4)
+
+        # pre and post processes are called
+        class HookCatalyst(ArticleCatalyst):
+            def pre_dump_many(self, data):
+                return list(data)[:2]
+
+            def post_dump(self, data, original_data=None):
+                data['id'] = original_data.id + 100
+                return data
+
+        result = asyncio.run(HookCatalyst().dump_many_async(iter(articles)))
+        self.assertEqual([item['id'] for item in result.valid_data], [100, 101])
+
+        # the values got from dicts are awaited
+        data = [{'name': counter.fetch(str(i)), 'followers': counter.fetch(i)} for i in range(3)]
+        result = asyncio.run(AuthorCatalyst().dump_many_async(data))
+        self.assertEqual(result.valid_data, [{'name': str(i), 'followers': i} for i in range(3)])
+
+    def test_awaited_fields(self):
+        counter = Counter()
+
+        class Catalyst_(Catalyst):
+            required = CallableField()
+            optional = CallableField(dump_required=False)
+            author = NestedField(AuthorCatalyst(), as_none=(None, ''), dump_none={})
+
+        data = {'required': lambda: counter.fetch(missing),
+                'optional': lambda: counter.fetch(missing), 'author': ''}
+        catalyst = Catalyst_()
+        expected = catalyst.dump({'required': lambda: missing, 'optional': lambda: missing,
+                                  'author': ''})
+        result = asyncio.run(catalyst.dump_async(data))
+        # the awaited results are checked like the values returned by fields
+        self.assertEqual(set(result.errors), {'required'})
+        self.assertEqual(result.format_errors(), expected.format_errors())
+        self.assertEqual(result.valid_data, {'author': {}})
+        self.assertEqual(result.valid_data, expected.valid_data)
+
+        class NestedManyCatalyst(Catalyst):
+            articles = NestedField(ArticleCatalyst(), many=True)
+
+        # the nested objects are dumped in chunks
+        articles = [Article(counter, i) for i in range(20)]
+        with mock.patch.object(aio, 'CHUNK_SIZE', 4):
+            result = asyncio.run(NestedManyCatalyst().dump_async(
+                {'articles': articles}, concurrency=100))
+        self.assertEqual(len(result.valid_data['articles']), 20)
+        self.assertLessEqual(counter.max_running, 4 * 3)
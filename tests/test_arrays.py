@@ -0,0 +1,116 @@
+import datetime
+from unittest import TestCase, skipIf
+
+from catalyst.core import Catalyst
+from catalyst.fields import (
+    BooleanField, DateField, DatetimeField, FloatField, IntegerField, ListField, StringField,
+)
+from catalyst.exceptions import ValidationError
+from catalyst.fields.array import ArrayField
+from catalyst.formats import arrays
+
+np = arrays.np
+
+
+class Reading:
+    def __init__(self, id, value, ok, time, tags=()):
+        self.id = id
+        self.value = value
+        self.ok = ok
+        self.time = time
+        self.tags = list(tags)
+
+
+class ReadingCatalyst(Catalyst):
+    id = IntegerField()
+    value = FloatField(dump_required=False)
+    ok = BooleanField()
+    time = DatetimeField()
+    day = DateField(name='time', key='day')
+    tags = ListField(StringField())
+
+
+UTC8 = datetime.timezone(datetime.timedelta(hours=8))
+READINGS = [
+    Reading(1, 0.5, True, datetime.datetime(2000, 1, 1), ['a']),
+    Reading(2, None, False, datetime.datetime(2000, 1, 2, 8, tzinfo=UTC8), ['b', 'c']),
+    Reading(3, float('nan'), 1, datetime.datetime(2000, 1, 3)),
+]
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class ArraysTest(TestCase):
+    def assert_columns(self, columns):
+        self.assertEqual(set(columns), {'id', 'value', 'ok', 'time', 'day', 'tags'})
+        self.assertEqual(columns['id'].values.dtype, np.int64)
+        self.assertEqual(columns['id'].values.tolist(), [1, 2, 3])
+        self.assertEqual(columns['value'].values.dtype, np.float64)
+        self.assertEqual(columns['value'].valid.tolist(), [True, False, False])
+        self.assertEqual(columns['value'].values[0], 0.5)
+        self.assertEqual(columns['ok'].values.tolist(), [True, False, True])
+        self.assertEqual(columns['time'].values.dtype, np.dtype('datetime64[us]'))
+        self.assertEqual(columns['time'].values.astype('datetime64[h]').tolist(), [
+            datetime.datetime(2000, 1, 1), datetime.datetime(2000, 1, 2),
+            datetime.datetime(2000, 1, 3)])
+        self.assertEqual(columns['day'].values.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(columns['tags'].values.dtype, object)
+        self.assertEqual(columns['tags'].values.tolist(), [['a'], ['b', 'c'], []])
+        self.assertTrue(columns['tags'].valid.all())
+
+    def test_dump_columns(self):
+        for compiled in (False, True):
+            catalyst = ReadingCatalyst(compiled=compiled)
+            self.assert_columns(catalyst.dump_columns(iter(READINGS)))
+            columns = catalyst.dump_columns(READINGS, only=['id'])
+            self.assertEqual(list(columns), ['id'])
+
+        # missing and invalid values
+        catalyst = ReadingCatalyst()
+        columns = catalyst.dump_columns([{'id': 1, 'ok': 0, 'time': None, 'tags': None}])
+        self.assertEqual(columns['time'].valid.tolist(), [False])
+        self.assertTrue(np.isnat(columns['time'].values[0]))
+        self.assertNotIn('value', columns)
+        with self.assertRaises(ValidationError) as cm:
+            catalyst.dump_columns([READINGS[0], {'id': 'x'}])
+        self.assertEqual(set(cm.exception.detail.errors), {1})
+
+        # the values which can't be converted to dtype
+        columns = catalyst.dump_columns([{'id': 1 << 70}], only=['id'])
+        self.assertEqual(columns['id'].values.dtype, object)
+
+        # dump by `dump_many`
+        class A(ReadingCatalyst):
+            def post_dump(self, data):
+                data['id'] = data['id']
+                return data
+
+        # the formatted datetime is parsed back, which is naive without "%z" in `fmt`
+        readings = READINGS[:1] + READINGS[2:]
+        self.assertEqual(
+            A().dump_columns(readings)['time'].values.tolist(),
+            catalyst.dump_columns(readings)['time'].values.tolist())
+        columns = A().dump_columns(READINGS)
+        self.assertEqual(columns['time'].values.dtype, np.dtype('datetime64[us]'))
+        self.assertEqual(columns['value'].valid.tolist(), [True, False, False])
+
+    def test_array_field(self):
+        catalyst = Catalyst({
+            'vector': ArrayField('float32', shape=3, dump_list=False),
+            'values': ArrayField('int64')})
+        data = [{'vector': [i, 0, 1], 'values': list(range(i))} for i in range(3)]
+        columns = catalyst.dump_columns(data)
+        # the arrays with fixed shape are stacked
+        self.assertEqual(columns['vector'].values.shape, (3, 3))
+        self.assertEqual(columns['vector'].values.dtype, np.float32)
+        self.assertEqual(columns['values'].values.dtype, object)
+        self.assertEqual(columns['values'].values[2].tolist(), [0, 1])
+
+
+class ArraysWithoutNumPyTest(TestCase):
+    def test_import_error(self):
+        np, arrays.np = arrays.np, None
+        try:
+            with self.assertRaises(ImportError):
+                ReadingCatalyst().dump_columns(READINGS)
+        finally:
+            arrays.np = np
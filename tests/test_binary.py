@@ -0,0 +1,212 @@
+import datetime
+import decimal
+import io
+import os
+import tempfile
+from unittest import TestCase, skipIf
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from catalyst.core import Catalyst
+from catalyst.fields import (
+    BooleanField, DateField, DatetimeField, DecimalField, Field, FloatField, IntegerField,
+    ListField, NestedField, StringField, TimeField,
+)
+from catalyst.exceptions import ValidationError
+from catalyst.formats.binary import (
+    BinaryCodec, BinaryDecodeError, read_any, read_decimal, write_any, write_decimal,
+)
+
+
+class ItemCatalyst(Catalyst):
+    name = StringField()
+    qty = IntegerField(minimum=0)
+
+
+class OrderCatalyst(Catalyst):
+    id = IntegerField()
+    price = FloatField()
+    cost = DecimalField(places=2)
+    paid = BooleanField()
+    created = DatetimeField(fmt='%Y-%m-%d %H:%M:%S.%f%z')
+    day = DateField()
+    at = TimeField()
+    tags = ListField(StringField(), allow_none=True)
+    items = NestedField(ItemCatalyst(), many=True)
+    main = NestedField(ItemCatalyst(), allow_none=True)
+    note = Field()
+    comment = StringField(key='remark', dump_required=False)
+
+
+TZ = datetime.timezone(datetime.timedelta(hours=-5))
+ORDER = {
+    'id': -3,
+    'price': 1.5,
+    'cost': decimal.Decimal('12.345'),
+    'paid': True,
+    'created': datetime.datetime(2020, 1, 2, 3, 4, 5, 6789, tzinfo=TZ),
+    'day': datetime.date(1960, 5, 6),
+    'at': datetime.time(1, 2, 3),
+    'tags': ['a', None, 'c'],
+    'items': [{'name': 'x', 'qty': 1}, {'name': 'y', 'qty': 300}],
+    'main': None,
+    'note': {'a': [1, 2.5, None, 'b'], 'b': True},
+}
+
+
+class BinaryTest(TestCase):
+    def test_dump_and_load(self):
+        for compiled in (False, True):
+            catalyst = OrderCatalyst(compiled=compiled, dump_required=False)
+            expected = catalyst.load(catalyst.dump(ORDER).valid_data).valid_data
+            data = catalyst.dump_binary(ORDER)
+            self.assertLess(len(data), len(catalyst.dump_json(ORDER)))
+            self.assertEqual(catalyst.load_binary(data).valid_data, expected)
+
+            # missing values and None
+            obj = {'id': 1, 'remark': 'x', 'tags': None, 'items': []}
+            result = catalyst.load_binary(catalyst.dump_binary(obj))
+            self.assertEqual(
+                result.valid_data, catalyst.load(catalyst.dump(obj).valid_data).valid_data)
+
+            data = catalyst.dump_many_binary([ORDER, obj, ORDER])
+            result = catalyst.load_many_binary(data)
+            self.assertTrue(result.is_valid)
+            self.assertEqual(result.valid_data[2], expected)
+            self.assertEqual(
+                catalyst.load_many_binary(catalyst.dump_many_binary([])).valid_data, [])
+
+            # only and exclude
+            data = catalyst.dump_binary(ORDER, only=['id', 'price'])
+            self.assertEqual(
+                catalyst.load_binary(data, only=['id', 'price']).valid_data,
+                {'id': -3, 'price': 1.5})
+
+    def test_values(self):
+        catalyst = OrderCatalyst(dump_required=False)
+        for value in (0, 63, 64, -64, -65, 2 ** 70, -2 ** 70):
+            data = catalyst.dump_binary({'id': value})
+            self.assertEqual(catalyst.load_binary(data).valid_data['id'], value)
+        for value in ('-0.5', '1E+3', '1234567890123.45', '-0', '-0.00', '0E-3'):
+            data = catalyst.dump_binary({'cost': decimal.Decimal(value)})
+            # compare strings, since negative zero equals zero
+            self.assertEqual(
+                str(catalyst.load_binary(data).valid_data['cost']),
+                str(catalyst.load(catalyst.dump({'cost': decimal.Decimal(value)}).valid_data)
+                    .valid_data['cost']))
+            out = bytearray()
+            write_decimal(out, decimal.Decimal(value))
+            self.assertEqual(str(read_decimal(bytes(out), 0)[0]), str(decimal.Decimal(value)))
+        for value in (
+                datetime.datetime(1900, 1, 1),
+                datetime.datetime(2100, 12, 31, 23, 59, 59, 999999),
+                datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)):
+            data = catalyst.dump_binary({'created': value})
+            self.assertEqual(catalyst.load_binary(data).valid_data['created'], value)
+
+        for value in (None, True, 1, -1.5, 'a', b'b', [1, [None]], {'a': {'b': ['c']}}):
+            out = bytearray()
+            write_any(out, value)
+            decoded, pos = read_any(bytes(out), 0)
+            self.assertEqual(decoded, value)
+            self.assertEqual(pos, len(out))
+
+    def test_datetime_precision(self):
+        class Catalyst_(Catalyst):
+            created = DatetimeField()
+
+        # the datetimes are not formatted by `fmt`, on purpose
+        catalyst = Catalyst_()
+        data = {'created': ORDER['created']}
+        self.assertEqual(catalyst.load_binary(catalyst.dump_binary(data)).valid_data, data)
+        self.assertEqual(catalyst.load(catalyst.dump(data).valid_data).valid_data, {
+            'created': datetime.datetime(2020, 1, 2, 3, 4, 5)})
+
+    def test_hooks(self):
+        class HookCatalyst(ItemCatalyst):
+            def post_dump(self, data, original_data=None):
+                data['extra'] = {'x': 1}
+                return data
+
+        catalyst = HookCatalyst(dump_required=False)
+        codec = BinaryCodec(catalyst)
+        data = catalyst.dump_binary({'name': 'a', 'qty': 1})
+        self.assertEqual(codec.decode(data), {'name': 'a', 'qty': 1, 'extra': {'x': 1}})
+        self.assertEqual(catalyst.load_binary(data).valid_data, {'name': 'a', 'qty': 1})
+        data = catalyst.dump_many_binary([{'name': 'a'}, {'qty': 2}])
+        self.assertEqual(
+            catalyst.load_many_binary(data).valid_data, [{'name': 'a'}, {'qty': 2}])
+
+    def test_errors(self):
+        catalyst = ItemCatalyst(dump_required=False)
+        with self.assertRaises(ValidationError) as ctx:
+            catalyst.dump_many_binary([{'qty': 1}, {'qty': 'x'}])
+        self.assertEqual(set(ctx.exception.detail.errors), {1})
+        self.assertIn('qty', ctx.exception.detail.errors[1])
+        with self.assertRaises(ValidationError):
+            catalyst.dump_binary({'name': 1, 'qty': 'x'})
+
+        data = catalyst.dump_binary({'name': 'a', 'qty': 1})
+        other = OrderCatalyst(dump_required=False).dump_binary({})
+        for malformed in (data[:-1], data + b'\x00', b'', b'xxxxxxxx', other):
+            result = catalyst.load_binary(malformed, raise_error=False)
+            self.assertIsInstance(result.errors['load'], BinaryDecodeError)
+        stream = catalyst.dump_many_binary([{'qty': 1}, {'qty': 2}])
+        result = catalyst.load_many_binary(stream[:-1], raise_error=False)
+        self.assertIsInstance(result.errors['load_many'], BinaryDecodeError)
+        with self.assertRaises(ValidationError):
+            catalyst.load_many_binary(stream[:-1], raise_error=True)
+
+        # the fields are validated when loading
+        class RawItemCatalyst(Catalyst):
+            name = StringField()
+            qty = IntegerField()
+
+        stream = RawItemCatalyst(dump_required=False).dump_many_binary(
+            [{'qty': 1}, {'qty': -1}, {'qty': -2}])
+        catalyst = ItemCatalyst(all_errors=False)
+        result = catalyst.load_many_binary(stream, raise_error=False)
+        self.assertEqual(set(result.errors), {1})
+        expected = catalyst.load_many([{'qty': 1}, {'qty': -1}, {'qty': -2}], raise_error=False)
+        self.assertEqual(result.valid_data, expected.valid_data)
+        result = ItemCatalyst().load_many_binary(stream, raise_error=False)
+        self.assertEqual(set(result.errors), {1, 2})
+
+    def test_files(self):
+        catalyst = OrderCatalyst()
+        fp = io.BytesIO()
+        catalyst.dump_many_binary([ORDER] * 3, fp)
+        self.assertEqual(fp.getvalue(), catalyst.dump_many_binary([ORDER] * 3))
+        fp.seek(0)
+        self.assertEqual(len(catalyst.load_many_binary(fp).valid_data), 3)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ('orders.bin', 'orders.bin.gz'):
+                path = os.path.join(tmpdir, name)
+                catalyst.dump_many_binary([ORDER] * 3, path)
+                result = catalyst.load_many_binary(path)
+                self.assertEqual(result.valid_data, catalyst.load_many_binary(
+                    catalyst.dump_many_binary([ORDER] * 3)).valid_data)
+
+            path = os.path.join(tmpdir, 'truncated.bin')
+            with open(path, 'wb') as f:
+                f.write(catalyst.dump_many_binary([ORDER])[:-1])
+            result = catalyst.load_many_binary(path, raise_error=False)
+            self.assertIsInstance(result.errors['load_many'], BinaryDecodeError)
+
+    @skipIf(np is None, 'NumPy is not installed.')
+    def test_array_field(self):
+        from catalyst.fields.array import ArrayField
+
+        class ArrayCatalyst(Catalyst):
+            vector = ArrayField('float32', shape=(None, 2))
+            raw = ArrayField('int16', dump_list=False)
+
+        catalyst = ArrayCatalyst()
+        obj = {'vector': [[1, 2], [3, 4.5]], 'raw': np.arange(5, dtype='int16')}
+        result = catalyst.load_binary(catalyst.dump_binary(obj))
+        self.assertEqual(result.valid_data['vector'].tolist(), [[1, 2], [3, 4.5]])
+        self.assertEqual(result.valid_data['raw'].tolist(), [0, 1, 2, 3, 4])
@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from catalyst.cache import LRUCache, CacheInfo
+
+
+class LRUCacheTest(TestCase):
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        # "b" is the least recently used
+        cache.set('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.info(), CacheInfo(1, 1, 1, 2, 2))
+
+        calls = []
+        factory = lambda: calls.append(1) or len(calls)
+        self.assertEqual(cache.get_or_create('d', factory), 1)
+        self.assertEqual(cache.get_or_create('d', factory), 1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.info(), CacheInfo(2, 2, 2, 2, 2))
+
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 0, 2, 0))
+
+        unlimited = LRUCache(maxsize=None)
+        for i in range(1000):
+            unlimited.set(i, i)
+        self.assertEqual(len(unlimited), 1000)
+
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=-1)
@@ -1,10 +1,16 @@
+import copy
+import sqlite3
+import subprocess
+import sys
 from unittest import TestCase
 
 from catalyst.base import CatalystABC
 from catalyst.core import Catalyst
+from catalyst.cache import LRUCache
 from catalyst.fields import Field, StringField, IntegerField, \
     FloatField, BooleanField, CallableField, ListField, NestedField
-from catalyst.exceptions import ValidationError
+from catalyst.groups import CompareFields
+from catalyst.exceptions import ValidationError, FrozenError
 from catalyst.utils import missing
 
 
@@ -596,6 +602,263 @@ class CatalystTest(TestCase):
 
         c.process_aliases.clear()
 
+    def test_skip_default_process(self):
+        class A(Catalyst):
+            a = IntegerField()
+
+            def post_load(self, data):
+                data['post'] = True
+                return data
+
+        a = A()
+        self.assertTrue(a._is_default_method('pre_load'))
+        self.assertFalse(a._is_default_method('post_load'))
+        self.assertEqual(a.load({'a': '1'}).valid_data, {'a': 1, 'post': True})
+        self.assertEqual(a.load_many([{'a': '1'}]).valid_data, [{'a': 1, 'post': True}])
+
+        # override process by instance
+        a = A()
+        a.pre_load = lambda data: {'a': 2}
+        self.assertFalse(a._is_default_method('pre_load'))
+        a = A.__new__(A)
+        a.pre_load = lambda data: {'a': 2}
+        a.__init__()
+        self.assertEqual(a.load({'a': '1'}).valid_data, {'a': 2, 'post': True})
+
+    def test_plan_cache(self):
+        class A(Catalyst):
+            plan_cache = LRUCache(maxsize=2)
+            a = IntegerField()
+            b = IntegerField()
+
+        a = A(include=['a'])
+        self.assertEqual(A.plan_cache.info().misses, 1)
+        a2 = A(include=['a'])
+        self.assertEqual(A.plan_cache.info().hits, 1)
+        self.assertIs(a._load_fields, a2._load_fields)
+        self.assertEqual(a2.load({'a': '1', 'b': '2'}).valid_data, {'a': 1})
+
+        # different options make different plans
+        b = A(include=['a'], load_default=0)
+        self.assertIsNot(a._load_fields, b._load_fields)
+        self.assertEqual(A(exclude=['a']).load({'a': '1', 'b': '2'}).valid_data, {'b': 2})
+        self.assertEqual(A.plan_cache.info().evictions, 1)
+
+        # changing fields expires the plans
+        A.fields['a'].set_parse(lambda value: -int(value))
+        self.assertEqual(A(include=['a']).load({'a': '1'}).valid_data, {'a': -1})
+
+        # unhashable options are not cached
+        info = A.plan_cache.info()
+        A(load_default=[])
+        self.assertEqual(A.plan_cache.info(), info)
+
+        A.plan_cache = None
+        self.assertEqual(A().load({'a': '1', 'b': '2'}).valid_data, {'a': -1, 'b': 2})
+
+    def test_only_and_exclude(self):
+        calls = []
+
+        class AuthorCatalyst(Catalyst):
+            name = StringField()
+            age = IntegerField()
+            profile = CallableField()
+
+        class ArticleCatalyst(Catalyst):
+            title = StringField()
+            content = StringField()
+            author = NestedField(AuthorCatalyst())
+            authors = NestedField(AuthorCatalyst(), many=True)
+            minimum = IntegerField()
+            maximum = IntegerField()
+            compare = CompareFields('minimum', '<=', 'maximum')
+
+        author = {'name': 'a', 'age': 1, 'profile': lambda: calls.append(1) or 'p'}
+        article = {
+            'title': 't', 'content': 'c', 'author': author, 'authors': [author],
+            'minimum': 1, 'maximum': 2}
+        for compiled in (False, True):
+            catalyst = ArticleCatalyst(compiled=compiled)
+            result = catalyst.dump(article, only=['title', 'author.name', 'authors'])
+            self.assertEqual(result.valid_data, {
+                'title': 't', 'author': {'name': 'a'},
+                'authors': [{'name': 'a', 'age': 1, 'profile': 'p'}]})
+            self.assertEqual(len(calls), 1)
+            calls.clear()
+
+            result = catalyst.dump(article, exclude=['content', 'author.profile', 'authors'])
+            self.assertEqual(result.valid_data, {
+                'title': 't', 'author': {'name': 'a', 'age': 1}, 'minimum': 1, 'maximum': 2})
+            self.assertEqual(calls, [])
+
+            # the whole field takes priority over its fields
+            result = catalyst.dump(article, only=['author', 'author.name'], exclude=['author.age'])
+            self.assertEqual(result.valid_data, {'author': {'name': 'a', 'profile': 'p'}})
+            calls.clear()
+
+            result = catalyst.dump_many([article], only=['authors.age'])
+            self.assertEqual(result.valid_data, [{'authors': [{'age': 1}]}])
+
+            # field groups are skipped if their fields are not selected
+            data = {'title': 't', 'author': {'name': 'a', 'age': 'x'}, 'minimum': 2, 'maximum': 1}
+            result = catalyst.load(data, only=['minimum'])
+            self.assertEqual(result.valid_data, {'minimum': 2})
+            result = catalyst.load(data, exclude=['author.age', 'maximum'])
+            self.assertEqual(result.valid_data, {'title': 't', 'author': {'name': 'a'}, 'minimum': 2})
+            result = catalyst.load_many([data], only=['author.name', 'minimum', 'maximum', 'compare'])
+            self.assertEqual(set(result.errors[0]), {'compare'})
+
+            # a string is one path, not the names of characters
+            result = catalyst.dump(article, only='author.name', exclude='title')
+            self.assertEqual(result.valid_data, {'author': {'name': 'a'}})
+            self.assertIs(
+                catalyst._get_projection('title', None), catalyst._get_projection(['title'], None))
+
+            # projections are memoized
+            self.assertIs(
+                catalyst._get_projection(['author.name', 'title'], None),
+                catalyst._get_projection(('title', 'author.name'), None))
+            self.assertEqual(catalyst.dump(article).valid_data['content'], 'c')
+            self.assertEqual(len(calls), 2)
+            calls.clear()
+
+            with self.assertRaises(ValueError):
+                catalyst.dump(article, only=['nothing'])
+            with self.assertRaises(ValueError):
+                catalyst.dump(article, exclude=['title.x'])
+            with self.assertRaises(ValueError):
+                catalyst.dump(article, only=['author.nothing'])
+
+    def test_frozen(self):
+        class A(Catalyst):
+            a = IntegerField()
+            b = NestedField(Catalyst({'c': IntegerField()}))
+
+        a = A()
+        a.raise_error = True
+        self.assertEqual(a.load({'a': '1'}).valid_data, {'a': 1})
+        # catalyst and its fields are frozen after being used
+        with self.assertRaises(FrozenError):
+            a.raise_error = False
+        with self.assertRaises(TypeError):
+            a.fields['x'] = IntegerField()
+        field = a._load_fields['a']
+        with self.assertRaises(FrozenError):
+            field.set_parse(lambda value: -int(value))
+        with self.assertRaises(FrozenError):
+            field.add_validator(lambda value: None)
+        with self.assertRaises(FrozenError):
+            a._load_fields['b'].catalyst.all_errors = False
+
+        # changing fields of class doesn't affect the used catalyst
+        A.a.set_parse(lambda value: -int(value))
+        self.assertEqual(a.load({'a': '1'}).valid_data, {'a': 1})
+        self.assertEqual(A().load({'a': '1'}).valid_data, {'a': -1})
+
+        # the copied catalyst is not frozen until used
+        b = copy.copy(a)
+        b.raise_error = False
+        self.assertEqual(b.load({'a': '1', 'b': {'c': '2'}}).valid_data, {'a': 1, 'b': {'c': 2}})
+        with self.assertRaises(FrozenError):
+            b.raise_error = True
+
+    def test_iter_process(self):
+        class A(Catalyst):
+            a = IntegerField(minimum=0)
+
+            def post_load_many(self, data):
+                return data + [{'chunk': len(data)}]
+
+        def generate(n, invalid=()):
+            for i in range(n):
+                yield {'a': -1 if i in invalid else i}
+
+        catalyst = A()
+        results = list(catalyst.iter_load(generate(5, invalid=[3])))
+        self.assertEqual([i for i, _ in results], [0, 1, 2, 3, 4])
+        self.assertEqual(results[2][1].valid_data, {'a': 2})
+        self.assertEqual(set(results[3][1].errors), {'a'})
+        (index, result), = catalyst.iter_dump([{'a': 1}])
+        self.assertEqual((index, result.valid_data), (0, {'a': 1}))
+
+        results = list(catalyst.iter_load(generate(5, invalid=[3]), chunk_size=2))
+        self.assertEqual([i for i, _ in results], [0, 2, 4])
+        self.assertEqual(results[0][1].valid_data, [{'a': 0}, {'a': 1}, {'chunk': 2}])
+        self.assertEqual(set(results[1][1].errors), {3})
+        self.assertEqual(set(results[1][1].invalid_data), {3})
+        self.assertEqual(results[2][1].valid_data, [{'a': 4}, {'chunk': 1}])
+
+        # send errors to callback
+        errors = []
+        callback = lambda index, result: errors.append((index, result.errors))
+        results = list(catalyst.iter_load(generate(5, invalid=[1, 3]), error_callback=callback))
+        self.assertEqual([i for i, _ in results], [0, 2, 4])
+        self.assertEqual([i for i, _ in errors], [1, 3])
+        errors.clear()
+        results = list(catalyst.iter_load(
+            generate(5, invalid=[1, 3]), chunk_size=3, error_callback=callback))
+        self.assertEqual([i for i, _ in errors], [0, 3])
+        self.assertEqual(set(errors[1][1]), {3})
+        self.assertEqual(results[0][1].valid_data, [{'a': 0}, {'a': 2}])
+        self.assertEqual(results[1][1].errors, {})
+
+        # stop at the first error
+        results = list(A(all_errors=False).iter_load(generate(5, invalid=[1])))
+        self.assertEqual(len(results), 2)
+        with self.assertRaises(ValidationError) as cm:
+            list(catalyst.iter_load(generate(5, invalid=[3]), raise_error=True, chunk_size=2))
+        self.assertEqual(set(cm.exception.detail.errors), {3})
+
+        # process lazily
+        iterator = catalyst.iter_dump(generate(10 ** 9), only=['a'])
+        self.assertEqual(next(iterator)[1].valid_data, {'a': 0})
+        with self.assertRaises(ValueError):
+            catalyst.iter_load([], chunk_size=0)
+
+    def test_load_rows(self):
+        connection = sqlite3.connect(':memory:')
+        self.addCleanup(connection.close)
+        connection.execute('CREATE TABLE user (id INTEGER, name TEXT, age TEXT, note TEXT)')
+        connection.executemany('INSERT INTO user VALUES (?, ?, ?, ?)', [
+            (1, 'a', '10', None), (2, 'b', 'x', 'n'), (3, 'c', None, 'n')])
+
+        class User(Catalyst):
+            id = IntegerField()
+            name = StringField(key='username')
+            age = IntegerField(load_default=0)
+            active = BooleanField(load_default=True)
+
+        for compiled in (False, True):
+            catalyst = User(compiled=compiled, load_required=True)
+            cursor = connection.execute('SELECT note, name AS username, age, id FROM user')
+            result = catalyst.load_many(cursor, columns=cursor.description)
+            self.assertEqual(result.valid_data, [
+                {'id': 1, 'name': 'a', 'age': 10, 'active': True},
+                {'id': 2, 'name': 'b', 'active': True},
+                {'id': 3, 'name': 'c', 'age': None, 'active': True}])
+            self.assertEqual(set(result.errors), {1})
+            self.assertEqual(result.invalid_data, {1: {'age': 'x'}})
+
+            rows = connection.execute('SELECT id, name FROM user ORDER BY id').fetchall()
+            expected = [{'id': 1, 'name': 'a', 'age': 0, 'active': True}]
+            columns = ['id', 'username']
+            self.assertEqual(catalyst.load(rows[0], columns=columns).valid_data, expected[0])
+            self.assertEqual(
+                catalyst.load(rows[0], columns=columns, only=['id']).valid_data, {'id': 1})
+            results = list(catalyst.iter_load(rows, chunk_size=2, columns=columns))
+            self.assertEqual([len(result.valid_data) for _, result in results], [2, 1])
+            self.assertEqual(
+                catalyst.load_many(rows, columns=columns, executor='thread').valid_data,
+                catalyst.load_many(rows, columns=columns).valid_data)
+
+            # missing values and the required field without column
+            result = catalyst.load(('a',), columns=['username', 'id'])
+            self.assertEqual(set(result.errors), {'id'})
+            result = catalyst.load((1,), columns=['id'])
+            self.assertEqual(set(result.errors), {'username'})
+        self.assertIs(catalyst._get_row_processors(('id', 'username')),
+                      catalyst._get_row_processors(['id', 'username']))
+
     def test_except_exception(self):
         catalyst = Catalyst(
             schema={'a': IntegerField(minimum=0)},
@@ -614,3 +877,13 @@ class CatalystTest(TestCase):
 
         with self.assertRaises(TypeError):
             catalyst.load({'a': []})
+
+    def test_import(self):
+        # the modules of formats and executors are imported when they are used
+        code = (
+            'import sys, catalyst; print(sorted(name for name in ('
+            '"asyncio", "concurrent.futures", "csv", "json", "catalyst.aio", '
+            '"catalyst.parallel", "catalyst.shared", "catalyst.formats.json", '
+            '"catalyst.formats.csv") if name in sys.modules))')
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.strip(), b'[]')
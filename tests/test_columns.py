@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import IntegerField, FloatField, StringField, NestedField
+from catalyst.groups import CompareFields
+from catalyst.exceptions import ValidationError
+from catalyst.formats.columns import ColumnReader
+
+
+class ItemCatalyst(Catalyst):
+    name = StringField()
+
+
+class OrderCatalyst(Catalyst):
+    price = FloatField(minimum=0)
+    qty = IntegerField(load_required=True)
+    note = StringField(load_default='')
+    code = StringField(key='sku')
+    item = NestedField(ItemCatalyst())
+
+
+COLUMNS = {
+    'price': ['1.5', '2', '-1', '4'],
+    'qty': [1, 'x', 3],
+    'sku': ('a', 'b', 'c', 'd'),
+    'item': [{'name': 'a'}, None, {'name': 1}, {}],
+    'unknown': [1, 2, 3, 4],
+}
+
+
+def transpose(columns):
+    columns = {key: list(column) for key, column in columns.items()}
+    size = max(map(len, columns.values()), default=0)
+    rows = [{} for _ in range(size)]
+    for key, column in columns.items():
+        for row, value in zip(rows, column):
+            row[key] = value
+    return rows
+
+
+class ColumnsTest(TestCase):
+    def assert_same_as_rows(self, catalyst, columns, **kwargs):
+        expected = catalyst.load_many(transpose(columns), **kwargs)
+        result = catalyst.load_columns(columns, rows=True, **kwargs)
+        self.assertEqual(result.valid_data, expected.valid_data)
+        self.assertEqual(result.format_errors(), expected.format_errors())
+        self.assertEqual(result.invalid_data, expected.invalid_data)
+        return result
+
+    def test_load_columns(self):
+        for compiled in (False, True):
+            for all_errors in (True, False):
+                catalyst = OrderCatalyst(compiled=compiled, all_errors=all_errors)
+                self.assert_same_as_rows(catalyst, COLUMNS)
+                self.assert_same_as_rows(catalyst, COLUMNS, only=['price', 'note'])
+                valid = {key: column[:1] for key, column in COLUMNS.items()}
+                self.assert_same_as_rows(catalyst, valid)
+                self.assert_same_as_rows(catalyst, {'qty': range(2)})
+                self.assertEqual(
+                    catalyst.load_columns({'qty': iter([1, 2])}).valid_data['qty'], [1, 2])
+                self.assert_same_as_rows(catalyst, {})
+
+        catalyst = OrderCatalyst()
+        result = catalyst.load_columns(COLUMNS)
+        self.assertEqual(result.valid_data, {
+            'price': [1.5, 2.0, None, 4.0],
+            'qty': [1, None, 3, None],
+            'note': ['', '', '', ''],
+            'code': ['a', 'b', 'c', 'd'],
+            'item': [{'name': 'a'}, None, {'name': '1'}, {}],
+        })
+        self.assertEqual(set(result.errors), {1, 2, 3})
+        self.assertEqual(set(result.errors[3]), {'qty'})
+
+        result = OrderCatalyst(all_errors=False).load_columns(COLUMNS)
+        self.assertEqual(result.valid_data, {
+            'price': [1.5, 2.0], 'qty': [1, None], 'note': ['', None],
+            'code': ['a', None], 'item': [{'name': 'a'}, None]})
+        self.assertEqual(set(result.errors), {1})
+
+        with self.assertRaises(ValidationError):
+            catalyst.load_columns(COLUMNS, raise_error=True)
+        result = catalyst.load_columns([1, 2])
+        self.assertEqual(set(result.errors), {'load_many'})
+
+    def test_fall_back(self):
+        class A(OrderCatalyst):
+            compare = CompareFields('price', '<', 'qty')
+
+        class B(OrderCatalyst):
+            def post_load(self, data):
+                data['post'] = True
+                return data
+
+        columns = {'price': [1, 2], 'qty': [2, 1]}
+        for catalyst in (A(), B()):
+            self.assertIsNone(ColumnReader(catalyst).plan)
+            self.assert_same_as_rows(catalyst, columns)
+        self.assertEqual(set(A().load_columns(columns).errors), {1})
+        self.assertEqual(B().load_columns(columns).valid_data['post'], [True, True])
@@ -0,0 +1,231 @@
+from unittest import TestCase
+
+from catalyst.core import Catalyst, PartialFields
+from catalyst.compiler import ProcessPlan, compile_process_one
+from catalyst.fields import (
+    Field, StringField, IntegerField, FloatField, BooleanField,
+    CallableField, ListField, NestedField,
+)
+from catalyst.groups import CompareFields, SumFields
+from catalyst.exceptions import ValidationError
+from catalyst.utils import missing, ValuesGetter, assign_item_getter
+
+
+class Item:
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+    def label(self, prefix):
+        return prefix + self.name
+
+
+class ItemCatalyst(Catalyst):
+    name = StringField(min_length=1, max_length=8)
+    price = FloatField(minimum=0)
+    label = CallableField(func_args=('#',))
+
+
+class OrderCatalyst(Catalyst):
+    number = IntegerField(minimum=0, load_required=True)
+    paid = BooleanField(dump_default=False, load_default=lambda: False)
+    note = StringField(dump_default=missing, load_default=None)
+    items = NestedField(ItemCatalyst(), many=True)
+    first = NestedField(ItemCatalyst(exclude=['label']), dump_required=False)
+    tags = ListField(StringField(max_length=3), load_default=list)
+    minimum = IntegerField(load_default=0)
+    maximum = IntegerField(load_default=10)
+    total = SumFields(declared_fields=('minimum', 'maximum'), key='total', name='total')
+    compare = CompareFields('minimum', '<=', 'maximum')
+
+
+def assert_same_result(test: TestCase, a, b):
+    test.assertEqual(a.valid_data, b.valid_data)
+    test.assertEqual(a.invalid_data, b.invalid_data)
+    test.assertEqual(a.format_errors(), b.format_errors())
+    test.assertEqual(list(a.errors), list(b.errors))
+
+
+class CompilerTest(TestCase):
+    def test_compile_process_one(self):
+        field = IntegerField(name='a', key='a')
+        plan = ProcessPlan(
+            ValuesGetter(['a'], assign_item_getter),
+            [PartialFields(field, 'a', 'a', True, missing, field.load)],
+            [], True, Exception, {})
+        process_one = compile_process_one('load', plan, 'Test')
+        self.assertIn('def load_Test(data', process_one.__source__)
+        self.assertEqual(process_one({'a': '1'}), ({'a': 1}, {}, {}))
+
+        valid_data, errors, invalid_data = process_one({})
+        self.assertEqual(valid_data, {})
+        self.assertEqual(set(errors), {'a'})
+        self.assertEqual(invalid_data, {})
+
+        valid_data, errors, invalid_data = process_one({'a': 'x'})
+        self.assertIsInstance(errors['a'], ValueError)
+        self.assertEqual(invalid_data, {'a': 'x'})
+
+    def test_compiled_same_as_interpreted(self):
+        interpreted = OrderCatalyst()
+        compiled = OrderCatalyst(compiled=True)
+
+        items = [Item('a', 1), Item('b', '2.5')]
+        dump_cases = [
+            {'number': 1, 'items': items, 'first': items[0], 'tags': ['x'],
+             'minimum': 1, 'maximum': 2},
+            {'number': 1, 'paid': True, 'note': 'n', 'items': [], 'tags': [],
+             'minimum': 3, 'maximum': 2},
+            {'number': -1, 'items': [Item('', -1), Item('toolongname', 1)],
+             'tags': ['long'], 'minimum': 'x', 'maximum': 2},
+            {'number': 1},
+            None,
+        ]
+        for data in dump_cases:
+            assert_same_result(self, interpreted.dump(data), compiled.dump(data))
+
+        load_cases = [
+            {'number': '1', 'items': [{'name': 'a', 'price': '1'}],
+             'first': {'name': 'b', 'price': 2}},
+            {'number': '1', 'paid': 'yes', 'items': [], 'tags': ['a', 'b']},
+            {'number': 'x', 'items': [{'name': ''}, 1], 'tags': ['long']},
+            {'items': [], 'minimum': 5, 'maximum': 1},
+            {},
+            1,
+        ]
+        for data in load_cases:
+            assert_same_result(self, interpreted.load(data), compiled.load(data))
+
+        assert_same_result(
+            self, interpreted.load_many(load_cases), compiled.load_many(load_cases))
+
+    def test_all_errors(self):
+        interpreted = OrderCatalyst(all_errors=False)
+        compiled = OrderCatalyst(all_errors=False, compiled=True)
+        data = {'number': 'x', 'items': 1, 'minimum': 5, 'maximum': 1}
+        result = compiled.load(data)
+        self.assertEqual(set(result.errors), {'number'})
+        assert_same_result(self, interpreted.load(data), result)
+
+        data = {'number': 1, 'items': [], 'minimum': 5, 'maximum': 1}
+        result = compiled.load(data)
+        self.assertEqual(set(result.errors), {'compare'})
+        assert_same_result(self, interpreted.load(data), result)
+
+    def test_return_missing(self):
+        return_missing = lambda value: missing
+        fields = {
+            'a': Field(formatter=return_missing, parser=return_missing),
+            'b': Field(dump_default=None, load_default=None),
+        }
+        interpreted = Catalyst(fields)
+        compiled = Catalyst(fields, compiled=True)
+        for data in ({'a': 1}, {'a': 1, 'b': 2}, {}):
+            assert_same_result(self, interpreted.dump(data), compiled.dump(data))
+            assert_same_result(self, interpreted.load(data), compiled.load(data))
+        self.assertIn('required', str(compiled.dump({'a': 1}).errors['a']))
+        self.assertEqual(compiled.load({'a': 1}).valid_data, {'b': None})
+
+    def test_inline_nested(self):
+        class ProfileCatalyst(Catalyst):
+            bio = StringField(max_length=4)
+            age = IntegerField(minimum=0, load_required=True)
+
+        class AuthorCatalyst(Catalyst):
+            name = StringField()
+            profile = NestedField(ProfileCatalyst(all_errors=False))
+
+        class ArticleCatalyst(Catalyst):
+            title = StringField()
+            author = NestedField(AuthorCatalyst())
+            authors = NestedField(AuthorCatalyst(), many=True, load_default=list)
+
+        interpreted = ArticleCatalyst()
+        compiled = ArticleCatalyst(compiled=True)
+        author = {'name': 'a', 'profile': {'bio': 'b', 'age': '1'}}
+        cases = [
+            {'title': 't', 'author': author, 'authors': [author, author]},
+            {'title': 't', 'author': {'name': 'a', 'profile': {'bio': 'long bio', 'age': 'x'}}},
+            {'title': 't', 'author': {'name': 'a', 'profile': None}},
+            {'title': 't', 'author': None, 'authors': None},
+            {'title': 't', 'author': 1, 'authors': [1, {}, author]},
+            {'title': 't', 'author': {'profile': 1}, 'authors': 1},
+        ]
+        for data in cases:
+            assert_same_result(self, interpreted.load(data), compiled.load(data))
+        self.assertTrue(compiled.load(cases[0]).is_valid)
+
+        with self.assertRaises(ValidationError) as cm:
+            compiled.load(cases[1], raise_error=True)
+        errors = cm.exception.detail.errors
+        self.assertEqual(set(errors['author']['profile']), {'bio'})
+
+        assert_same_result(self, interpreted.dump(cases[0]), compiled.dump(cases[0]))
+
+    def test_not_inline_customized_nested(self):
+        class A(Catalyst):
+            a = IntegerField()
+
+        class B(A):
+            def post_load(self, data):
+                data['b'] = True
+                return data
+
+        class C(A):
+            def pre_load_many(self, data):
+                return data[:1]
+
+        field = NestedField(A())
+        field.set_parse(lambda value: {'c': True})
+
+        class Parent(Catalyst):
+            a = NestedField(A())
+            b = NestedField(B())
+            c = NestedField(C(), many=True)
+            d = field
+
+        process_one = compile_process_one('load', Parent()._get_inline_plan('load', False))
+        self.assertIn('data1', process_one.__source__)
+        self.assertNotIn('data2', process_one.__source__)
+
+        data = {'a': {'a': '1'}, 'b': {'a': '1'}, 'c': [{'a': '1'}, {'a': 2}], 'd': {}}
+        result = Parent(compiled=True).load(data)
+        self.assertDictEqual(result.valid_data, {
+            'a': {'a': 1}, 'b': {'a': 1, 'b': True}, 'c': [{'a': 1}], 'd': {'c': True}})
+
+    def test_inline_recursion(self):
+        def make_tree_catalyst(**kwargs):
+            class Node(Catalyst):
+                value = IntegerField()
+                children = NestedField(Catalyst(), many=True, load_default=list)
+
+            # make the nested catalyst refer to itself
+            node = Node(**kwargs)
+            field = node.fields['children']
+            field.catalyst, field._do_load = node, node.load_many
+            node.__init__(**kwargs)
+            return node
+
+        interpreted = make_tree_catalyst()
+        compiled = make_tree_catalyst(compiled=True)
+        tree = {'value': 1, 'children': [{'value': 2, 'children': [{'value': 'x'}]}]}
+        result = compiled.load(tree)
+        assert_same_result(self, interpreted.load(tree), result)
+        self.assertIn('value', result.errors['children'][0]['children'][0])
+
+    def test_getter_errors(self):
+        class Obj:
+            a = 1
+
+            @property
+            def b(self):
+                raise ValueError('b')
+
+        fields = {'a': IntegerField(), 'b': IntegerField(), 'c': IntegerField(dump_default=0)}
+        interpreted = Catalyst(fields)
+        compiled = Catalyst(fields, compiled=True)
+        result = compiled.dump(Obj())
+        self.assertEqual(result.valid_data, {'a': 1, 'c': 0})
+        self.assertEqual(set(result.errors), {'b'})
+        self.assertIsInstance(result.errors['b'], ValueError)
+        assert_same_result(self, interpreted.dump(Obj()), result)
@@ -0,0 +1,120 @@
+import gzip
+import io
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import (
+    IntegerField, StringField, DateField, DecimalField, SeparatedField,
+)
+from catalyst.exceptions import ValidationError
+
+
+class PaymentCatalyst(Catalyst):
+    id = IntegerField()
+    payee = StringField(key='payee name')
+    day = DateField()
+    amount = DecimalField(places=2)
+    tags = SeparatedField(StringField(), separator='|', dump_required=False)
+
+
+PAYMENTS = [
+    {'id': 1, 'payee': 'a, "b"', 'day': date(2020, 1, 2), 'amount': Decimal('1.5'),
+     'tags': ['x', 'y']},
+    {'id': 2, 'payee': 'c\nd', 'day': date(2020, 1, 3), 'amount': Decimal('-2')},
+]
+
+TEXT = (
+    'id,payee name,day,amount,tags\r\n'
+    '1,"a, ""b""",2020-01-02,1.50,x|y\r\n'
+    '2,"c\nd",2020-01-03,-2.00,\r\n'
+)
+
+
+class CSVTest(TestCase):
+    def test_dump_csv(self):
+        catalyst = PaymentCatalyst()
+        fp = io.StringIO()
+        catalyst.dump_csv(iter(PAYMENTS), fp)
+        self.assertEqual(fp.getvalue(), TEXT)
+
+        fp = io.StringIO()
+        catalyst.dump_csv(PAYMENTS, fp, columns=['amount', 'id'], header=False, delimiter=';')
+        self.assertEqual(fp.getvalue(), '1.50;1\r\n-2.00;2\r\n')
+        fp = io.StringIO()
+        catalyst.dump_csv(PAYMENTS, fp, only=['id'])
+        self.assertEqual(fp.getvalue(), 'id\r\n1\r\n2\r\n')
+
+        with self.assertRaises(ValidationError) as cm:
+            catalyst.dump_csv(PAYMENTS + [{'id': 'x'}], io.StringIO())
+        self.assertEqual(set(cm.exception.detail.errors), {2})
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'payments.csv.gz')
+            catalyst.dump_csv(PAYMENTS, path)
+            with open(path, 'rb') as fp:
+                self.assertEqual(gzip.decompress(fp.read()).decode(), TEXT)
+            results = list(catalyst.load_csv(path))
+            self.assertEqual(len(results), 2)
+
+    def test_load_csv(self):
+        catalyst = PaymentCatalyst()
+        expected = catalyst.load_many(
+            catalyst.dump_many(PAYMENTS).valid_data).valid_data
+        for compiled in (False, True):
+            catalyst = PaymentCatalyst(compiled=compiled)
+            results = list(catalyst.load_csv(io.StringIO(TEXT)))
+            self.assertEqual([i for i, _ in results], [0, 1])
+            self.assertTrue(all(result.is_valid for _, result in results))
+            self.assertEqual([result.valid_data for _, result in results], [
+                dict(expected[0]), dict(expected[1])])
+
+            results = list(catalyst.load_csv(io.BytesIO(TEXT.encode()), chunk_size=5))
+            self.assertEqual(len(results), 1)
+            self.assertEqual(len(results[0][1].valid_data), 2)
+
+        # columns are mapped by names, unknown and missing columns
+        text = 'amount,x,id\n1,2,3\n4,5\n'
+        results = list(catalyst.load_csv(io.StringIO(text), chunk_size=10))
+        self.assertEqual(results[0][1].valid_data, [
+            {'amount': Decimal('1.00'), 'id': 3}, {'amount': Decimal('4.00')}])
+        results = list(catalyst.load_csv(
+            io.StringIO('3;1\n'), columns=['id', 'amount'], delimiter=';', only=['id']))
+        self.assertEqual(results[0][1].valid_data, {'id': 3})
+
+        # errors are keyed by indexes of rows
+        text = 'id\n1\nx\n3\ny\n'
+        results = list(catalyst.load_csv(io.StringIO(text), chunk_size=2))
+        self.assertEqual([set(result.errors) for _, result in results], [{1}, {3}])
+        with self.assertRaises(ValidationError):
+            list(catalyst.load_csv(io.StringIO(text), raise_error=True))
+        self.assertEqual(list(catalyst.load_csv(io.StringIO(''))), [])
+
+    def test_round_trip(self):
+        # None values are written as empty cells and loaded back
+        payments = [
+            {'id': None, 'payee': '', 'day': None, 'amount': None},
+            {'id': 1, 'payee': 'a', 'day': date(2020, 1, 2), 'amount': Decimal('1.50')},
+        ]
+        for compiled in (False, True):
+            catalyst = PaymentCatalyst(compiled=compiled, exclude=['tags'])
+            fp = io.StringIO()
+            catalyst.dump_csv(payments, fp)
+            self.assertEqual(fp.getvalue().splitlines()[1], ',,,')
+            fp.seek(0)
+            results = list(catalyst.load_csv(fp, chunk_size=10))
+            self.assertTrue(results[0][1].is_valid)
+            self.assertEqual(results[0][1].valid_data, payments)
+
+            # the empty cells are missing if the fields don't allow None
+            class StrictCatalyst(PaymentCatalyst):
+                id = IntegerField(allow_none=False, load_required=True)
+
+            catalyst = StrictCatalyst(compiled=compiled)
+            results = list(catalyst.load_csv(io.StringIO('id,payee name,tags\n,,\n')))
+            self.assertEqual(results[0][1].format_errors(), {
+                'id': 'Missing data for required field.'})
+            self.assertEqual(results[0][1].valid_data, {'payee': ''})
@@ -1,7 +1,8 @@
+import copy
 import math
 
 from decimal import Decimal, ROUND_CEILING
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from datetime import datetime, timedelta
 
 from catalyst import Catalyst
@@ -12,7 +13,8 @@ from catalyst.fields import (
     NestedField, DecimalField, ConstantField,
     SeparatedField,
 )
-from catalyst.utils import no_processing
+from catalyst.fields.array import ArrayField, np
+from catalyst.utils import no_processing, missing
 from catalyst.exceptions import ValidationError
 
 
@@ -77,6 +79,65 @@ class FieldTest(TestCase):
         with self.assertRaises(TypeError):
             field.set_format(lambda field, value: str(value))
 
+    def test_fused_processors(self):
+        # fused processors skip the stages doing nothing
+        field = StringField()
+        self.assertIn('dump', field.__dict__)
+        self.assertIn('load', field.__dict__)
+        self.assertEqual(field.dump(1), '1')
+        self.assertEqual(field.dump(None), None)
+        self.assertEqual(field.load(1), '1')
+        self.assertEqual(field.load(None), None)
+
+        # remake processors when stages are changed
+        field.set_format(lambda value: value * 2)
+        self.assertEqual(field.dump(1), 2)
+        field.set_parse(lambda value: value + 1)
+        self.assertEqual(field.load(1), 2)
+        field.add_validator(lambda value: value > 0 or 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            field.load(-1)
+        field.set_validators([])
+        self.assertEqual(field.load(-1), 0)
+        field.allow_none = False
+        with self.assertRaises(ValidationError):
+            field.load(None)
+        field.load_none = 0
+        self.assertEqual(field.load(None), 0)
+        field.dump_none = ''
+        self.assertEqual(field.dump(None), '')
+
+        # parse returns missing
+        field = Field(parser=lambda value: missing, validators=lambda value: 1 / 0)
+        self.assertIs(field.load(1), missing)
+
+        # fall back to methods if stages can't be fused
+        field = Field(as_none=[None, ''], allow_none=False)
+        self.assertNotIn('load', field.__dict__)
+        with self.assertRaises(ValidationError):
+            field.load('')
+
+        # methods overridden by instance or subclass are kept
+        field = Field()
+        field.override_method(no_processing, 'dump')
+        field.set_format(lambda value: str(value))
+        self.assertIs(field.dump, no_processing)
+        field = ConstantField(1)
+        self.assertNotIn('dump', field.__dict__)
+        self.assertEqual(field.dump(None), 1)
+
+        # item field of list field is not bound
+        field = ListField(StringField())
+        field.item_field.set_format(lambda value: value + '!')
+        self.assertEqual(field.dump(['a']), ['a!'])
+
+        # fused processors are bound to the copy of field
+        field = NestedField(Catalyst({'a': IntegerField()}))
+        new_field = copy.copy(field)
+        new_field.set_catalyst(Catalyst({'b': IntegerField()}))
+        self.assertEqual(field.dump({'a': 1, 'b': 2}), {'a': 1})
+        self.assertEqual(new_field.dump({'a': 1, 'b': 2}), {'b': 2})
+
     def test_field(self):
         field = BaseField()
         with self.assertRaises(NotImplementedError):
@@ -477,6 +538,70 @@ class FieldTest(TestCase):
         with self.assertRaises(ValidationError):
             field.load(['1', '2', '3', '4'])
 
+    @skipIf(np is None, 'NumPy is not installed.')
+    def test_array_field(self):
+        field = ArrayField(minimum=0, maximum=1)
+
+        # load
+        array = field.load([0, 0.5, 1])
+        self.assertEqual(array.dtype, np.float64)
+        self.assertEqual(array.tolist(), [0, 0.5, 1])
+        self.assertEqual(field.load(np.array([1], dtype='int8')).dtype, np.float64)
+        self.assertEqual(field.load(np.zeros(3).tobytes()).tolist(), [0, 0, 0])
+
+        # errors are keyed by indexes like `ListField`
+        with self.assertRaises(ValidationError) as cm:
+            field.load([0, 2, float('nan'), -1])
+        result = cm.exception.detail
+        self.assertEqual(result.format_errors(), {
+            1: 'Value must be between 0 and 1.',
+            2: 'Value must not be NaN.',
+            3: 'Value must be between 0 and 1.'})
+        self.assertEqual(result.invalid_data, {1: 2.0, 2: result.invalid_data[2], 3: -1.0})
+        self.assertEqual(result.valid_data.tolist(), [0])
+
+        with self.assertRaises(ValidationError) as cm:
+            field.load([1, 'a', 0])
+        result = cm.exception.detail
+        self.assertIsInstance(result.errors[1], ValueError)
+        self.assertEqual(result.invalid_data, {1: 'a'})
+
+        with self.assertRaises(ValidationError):
+            field.load(1)
+        with self.assertRaises(ValidationError):
+            field.load(None)
+
+        field = ArrayField(minimum=0, all_errors=False)
+        with self.assertRaises(ValidationError) as cm:
+            field.load([1, -1, -2])
+        self.assertEqual(set(cm.exception.detail.errors), {1})
+        self.assertEqual(ArrayField(allow_nan=True).load([math.nan]).size, 1)
+
+        # shape of two-dimensional array
+        field = ArrayField('int32', shape=(None, 2), maximum=9)
+        self.assertEqual(field.load([[1, 2], [3, 4]]).shape, (2, 2))
+        array = field.load(np.arange(4, dtype='int32').tobytes())
+        self.assertEqual(array.tolist(), [[0, 1], [2, 3]])
+        with self.assertRaises(ValidationError) as cm:
+            field.load([[1, 2, 3]])
+        self.assertEqual(str(cm.exception), 'Shape must be (None, 2), not (1, 3).')
+        with self.assertRaises(ValidationError) as cm:
+            field.load([[1, 2], [3, 10], [5, 6]])
+        result = cm.exception.detail
+        self.assertEqual(result.format_errors(), {1: {1: 'Value must <= 9.'}})
+        self.assertEqual(result.valid_data.tolist(), [[1, 2], [5, 6]])
+
+        # dump
+        self.assertEqual(field.dump(np.array([[1, 2]])), [[1, 2]])
+        self.assertEqual(field.dump([[1.0, 2.0]]), [[1, 2]])
+        array = ArrayField(dump_list=False).dump([1, 2])
+        self.assertIsInstance(array, np.ndarray)
+        self.assertIsNone(field.dump(None))
+
+        # pickle the field for worker processes
+        field = copy.deepcopy(ArrayField('int16', shape=3))
+        self.assertEqual(field.load([1, 2, 3]).dtype, np.int16)
+
     def test_separated_field(self):
         field = SeparatedField(separator=None)
         self.assertEqual(field.load('1 2 3'), ['1', '2', '3'])
@@ -0,0 +1,211 @@
+import io
+import json
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import (
+    Field, StringField, IntegerField, FloatField, BooleanField, ListField, NestedField,
+)
+from catalyst.groups import SumFields
+from catalyst.exceptions import ValidationError
+from catalyst.formats.json import JSONWriter, iter_array_file
+
+
+class Item:
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+
+class ItemCatalyst(Catalyst):
+    name = StringField(key='item name')
+    price = FloatField()
+
+
+class OrderCatalyst(Catalyst):
+    number = IntegerField()
+    paid = BooleanField(dump_default=False)
+    note = StringField(dump_default=None)
+    items = NestedField(ItemCatalyst(), many=True)
+    first = NestedField(ItemCatalyst(), dump_required=False)
+    tags = ListField(StringField())
+    extra = Field(dump_default={'a': [1, 2.5]})
+
+
+ORDERS = [
+    {'number': 1, 'paid': True, 'note': '中文 "quoted"\n', 'tags': ['x'],
+     'items': [Item('a', 1), Item('b', float('inf'))], 'first': Item('c', float('nan'))},
+    {'number': 2, 'items': [], 'tags': [], 'first': None},
+]
+
+
+class JSONTest(TestCase):
+    def test_dump_json(self):
+        for compiled in (False, True):
+            catalyst = OrderCatalyst(compiled=compiled)
+            for order in ORDERS:
+                self.assertEqual(
+                    catalyst.dump_json(order), json.dumps(catalyst.dump(order).valid_data))
+            expected = json.dumps(catalyst.dump_many(ORDERS).valid_data)
+            self.assertEqual(catalyst.dump_many_json(ORDERS), expected)
+            self.assertEqual(catalyst.dump_many_json(iter(ORDERS)), expected)
+            self.assertEqual(catalyst.dump_json(ORDERS[0], only=['number', 'items.price']),
+                             '{"number": 1, "items": [{"price": 1.0}, {"price": null}]}')
+
+            with self.assertRaises(ValidationError) as cm:
+                catalyst.dump_json({'number': 'x', 'items': []})
+            self.assertEqual(set(cm.exception.detail.errors), {'number', 'tags'})
+            with self.assertRaises(ValidationError):
+                catalyst.dump_many_json([ORDERS[0], {}])
+
+    def test_write_file(self):
+        catalyst = OrderCatalyst()
+        expected = json.dumps(catalyst.dump_many(ORDERS * 3).valid_data)
+        fp = io.StringIO()
+        self.assertIsNone(catalyst.dump_many_json(ORDERS * 3, fp))
+        self.assertEqual(fp.getvalue(), expected)
+        fp = io.BytesIO()
+        catalyst.dump_many_json(iter(ORDERS * 3), fp)
+        self.assertEqual(fp.getvalue(), expected.encode())
+
+        fp = io.StringIO()
+        with self.assertRaises(ValidationError) as cm:
+            catalyst.dump_many_json(ORDERS + [{}], fp)
+        self.assertEqual(set(cm.exception.detail.errors), {2})
+
+        writer = JSONWriter(catalyst, ensure_ascii=False, separators=(',', ':'))
+        fp = io.BytesIO()
+        writer.dump_many(ORDERS, fp)
+        self.assertEqual(fp.getvalue().decode(), json.dumps(
+            catalyst.dump_many(ORDERS).valid_data, ensure_ascii=False, separators=(',', ':')))
+
+    def test_fall_back(self):
+        class A(ItemCatalyst):
+            total = SumFields(declared_fields=['price'])
+
+        class B(ItemCatalyst):
+            def post_dump(self, data):
+                data['post'] = True
+                return data
+
+        class C(ItemCatalyst):
+            def pre_dump_many(self, data):
+                return data[:1]
+
+        items = [Item('a', 1), Item('b', 2)]
+        for catalyst in (A(), B(), C()):
+            writer = JSONWriter(catalyst)
+            self.assertEqual(writer.dumps(items[0]), json.dumps(catalyst.dump(items[0]).valid_data))
+            self.assertEqual(writer.dumps_many(items), json.dumps(catalyst.dump_many(items).valid_data))
+            fp = io.StringIO()
+            writer.dump_many(items, fp)
+            self.assertEqual(fp.getvalue(), json.dumps(catalyst.dump_many(items).valid_data))
+        self.assertIsNotNone(JSONWriter(A()).process_one)
+        self.assertIsNone(JSONWriter(C()).process_one)
+
+        # recursive catalyst
+        class Node(Catalyst):
+            value = IntegerField()
+            children = NestedField(Catalyst(), many=True, dump_required=False)
+
+        node = Node()
+        field = node.fields['children']
+        field.set_catalyst(node)
+        node.__init__()
+        tree = {'value': 1, 'children': [{'value': 2, 'children': [{'value': 3}]}]}
+        self.assertEqual(node.dump_json(tree), json.dumps(node.dump(tree).valid_data))
+
+    def test_dump_errors(self):
+        calls = []
+
+        class Counted(Item):
+            @property
+            def price(self):
+                calls.append(self.name)
+                return self._price
+
+            @price.setter
+            def price(self, value):
+                self._price = value
+
+        class Order(Catalyst):
+            first = NestedField(ItemCatalyst())
+            items = NestedField(ItemCatalyst(), many=True)
+            note = StringField(dump_default=None)
+            number = IntegerField()
+
+        order = {'number': 'x', 'first': Counted('a', 1),
+                 'items': [Counted('b', 2), Counted('c', 'y')]}
+        for compiled in (False, True):
+            for all_errors in (True, False):
+                catalyst = Order(compiled=compiled, all_errors=all_errors)
+                expected = catalyst.dump(order)
+                calls.clear()
+                with self.assertRaises(ValidationError) as cm:
+                    catalyst.dump_json(order)
+                # the errors are the same as `dump`
+                self.assertEqual(calls, ['a', 'b', 'c'])
+                detail = cm.exception.detail
+                self.assertEqual(detail.valid_data, expected.valid_data)
+                self.assertEqual(list(detail.valid_data), list(expected.valid_data))
+                self.assertEqual(detail.format_errors(), expected.format_errors())
+                self.assertEqual(detail.invalid_data, expected.invalid_data)
+
+                orders = [{'first': Counted('d', 1), 'items': [], 'number': 1}, order, order]
+                expected = catalyst.dump_many(orders)
+                calls.clear()
+                with self.assertRaises(ValidationError) as cm:
+                    catalyst.dump_many_json(orders)
+                self.assertEqual(len(calls), 7 if all_errors else 4)
+                self.assertEqual(cm.exception.detail.valid_data, expected.valid_data)
+                self.assertEqual(
+                    cm.exception.detail.format_errors(), expected.format_errors())
+
+        # the errors which are not caught are raised as they are
+        class Failed(Counted):
+            @property
+            def price(self):
+                raise RuntimeError
+
+            @price.setter
+            def price(self, value):
+                pass
+
+        with self.assertRaises(RuntimeError):
+            ItemCatalyst(except_exception=ValueError).dump_json(Failed('a', 1))
+
+    def test_iter_array_file(self):
+        items = [1, -2.5e-3, 'x"中', [], {}, {'a': [True, None]}, 10 ** 20]
+        s = json.dumps(items, ensure_ascii=False, indent=1)
+        for read_size in (1, 2, 5, 1000):
+            for fp in (io.StringIO(s), io.BytesIO(s.encode())):
+                self.assertEqual(list(iter_array_file(fp, read_size)), items)
+        for s in ('', '{}', '[', '[1,]', '[1 2]', '[1] 2', '[1, tru]', '["a', '[1.]'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_array_file(io.StringIO(s), 2))
+        with self.assertRaises(json.JSONDecodeError) as cm:
+            list(iter_array_file(io.StringIO('[' + '1, ' * 100 + 'x]'), 4))
+        self.assertEqual(cm.exception.pos, 301)
+
+    def test_iter_load_json_array(self):
+        catalyst = OrderCatalyst()
+        orders = [{'number': i, 'tags': ['a']} for i in range(10)]
+        orders[3]['number'] = 'x'
+        s = json.dumps(orders)
+        expected = list(catalyst.iter_load(orders, chunk_size=4))
+        results = list(catalyst.iter_load_json_array(io.StringIO(s), chunk_size=4, read_size=7))
+        self.assertEqual([i for i, _ in results], [0, 4, 8])
+        for (_, result), (_, expected_result) in zip(results, expected):
+            self.assertEqual(result.valid_data, expected_result.valid_data)
+            self.assertEqual(result.format_errors(), expected_result.format_errors())
+        self.assertEqual(set(results[0][1].errors), {3})
+
+        results = list(catalyst.iter_load_json_array(io.BytesIO(s.encode()), only=['number']))
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results[0][1].valid_data, {'number': 0})
+        with self.assertRaises(ValidationError):
+            list(catalyst.iter_load_json_array(io.StringIO(s), raise_error=True))
+        with self.assertRaises(json.JSONDecodeError):
+            list(catalyst.iter_load_json_array(io.StringIO(s[:-1])))
+        with self.assertRaises(ValueError):
+            catalyst.iter_load_json_array(io.StringIO(s), read_size=0)
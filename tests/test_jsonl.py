@@ -0,0 +1,143 @@
+import bz2
+import gzip
+import io
+import json
+import lzma
+import os
+import tempfile
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import IntegerField, StringField
+from catalyst.exceptions import ValidationError
+from catalyst.formats.files import open_input
+from catalyst.parallel import shutdown_pools
+
+
+class UserCatalyst(Catalyst):
+    id = IntegerField()
+    name = StringField()
+
+
+USERS = [{'id': i, 'name': f'user{i}'} for i in range(5)]
+LINES = '\n'.join(json.dumps(user) for user in USERS) + '\n'
+
+
+class JSONLinesTest(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pools()
+
+    def test_dump_and_load(self):
+        catalyst = UserCatalyst()
+        for name in ('users.jsonl', 'users.jsonl.gz', 'users.jsonl.bz2', 'users.jsonl.xz'):
+            path = os.path.join(self.dir.name, name)
+            catalyst.dump_jsonl(iter(USERS), path)
+            with open_input(path) as fp:
+                self.assertEqual(fp.read().decode(), LINES)
+            results = list(catalyst.load_jsonl(path))
+            self.assertEqual([number for number, _ in results], [1, 2, 3, 4, 5])
+            self.assertEqual([result.valid_data for _, result in results], USERS)
+
+        fp = io.StringIO()
+        catalyst.dump_jsonl(USERS, fp, only=['id'])
+        self.assertEqual(fp.getvalue().splitlines()[0], '{"id": 0}')
+        with self.assertRaises(ValidationError) as cm:
+            catalyst.dump_jsonl([USERS[0], {}], io.StringIO())
+        self.assertEqual(set(cm.exception.detail.errors), {1})
+
+        # file objects and compressed streams
+        for fp in (io.StringIO(LINES), io.BytesIO(LINES.encode()),
+                   io.BytesIO(gzip.compress(LINES.encode())),
+                   io.BufferedReader(io.BytesIO(bz2.compress(LINES.encode()))),
+                   io.BytesIO(lzma.compress(LINES.encode()))):
+            results = list(catalyst.load_jsonl(fp, batch_size=2))
+            self.assertEqual([number for number, _ in results], [1, 3, 5])
+            self.assertEqual([result.valid_data for _, result in results],
+                             [USERS[:2], USERS[2:4], USERS[4:]])
+            self.assertFalse(fp.closed)
+
+    def test_errors(self):
+        catalyst = UserCatalyst()
+        text = '{"id": 1}\n\n{"id": "x"}\n{"id": \n{"id": 4}\n'
+
+        results = list(catalyst.load_jsonl(io.StringIO(text)))
+        self.assertEqual([number for number, _ in results], [1, 3, 4, 5])
+        self.assertEqual(set(results[1][1].errors), {'id'})
+        self.assertIsInstance(results[2][1].errors['load'], json.JSONDecodeError)
+
+        results = list(catalyst.load_jsonl(io.StringIO(text), batch_size=10))
+        self.assertEqual(len(results), 1)
+        number, result = results[0]
+        self.assertEqual(number, 1)
+        self.assertEqual(set(result.errors), {3, 4})
+        self.assertEqual(result.invalid_data, {3: {'id': 'x'}, 4: '{"id": \n'})
+        self.assertEqual(len(result.valid_data), 3)
+
+        with self.assertRaises(ValidationError):
+            list(catalyst.load_jsonl(io.StringIO(text), raise_error=True))
+
+        errors = []
+        results = list(catalyst.load_jsonl(
+            io.StringIO(text), batch_size=2,
+            error_callback=lambda number, result: errors.append((number, set(result.errors)))))
+        self.assertEqual(errors, [(1, {3}), (4, {4})])
+        self.assertEqual([result.valid_data for _, result in results],
+                         [[{'id': 1}], [{'id': 4}]])
+
+        # stop at the first error
+        catalyst = UserCatalyst(all_errors=False)
+        results = list(catalyst.load_jsonl(io.StringIO(text), batch_size=10))
+        self.assertEqual(set(results[0][1].errors), {3})
+        results = list(catalyst.load_jsonl(io.StringIO('{}\n[\n{}\n'), batch_size=10))
+        self.assertEqual(set(results[0][1].errors), {2})
+        self.assertEqual(len(results[0][1].valid_data), 1)
+
+        with self.assertRaises(ValueError):
+            catalyst.load_jsonl(io.StringIO(text), batch_size=0)
+
+    def test_validate_file(self):
+        lines = [json.dumps(user) for user in USERS * 20]
+        lines[7] = '{"id": "x"}'
+        lines[30] = '{"id": '
+        lines[31] = ''
+        path = os.path.join(self.dir.name, 'users.jsonl')
+        with open(path, 'w') as fp:
+            fp.write('\n'.join(lines))
+        output_dir = os.path.join(self.dir.name, 'output')
+
+        catalyst = UserCatalyst()
+        for range_size in (None, 1, 100):
+            report = catalyst.validate_jsonl(
+                path, workers=2, output_dir=output_dir, range_size=range_size)
+            self.assertEqual((report.lines, report.valid), (100, 97))
+            self.assertEqual(set(report.errors), {8, 31})
+            self.assertEqual(report.errors[8], {'id': "invalid literal for int() with base 10: 'x'"})
+            self.assertIn('load', report.errors[31])
+
+            output = b''
+            for output_path in report.outputs:
+                with open(output_path, 'rb') as fp:
+                    output += fp.read()
+            self.assertEqual(output.decode().splitlines(), [
+                line for i, line in enumerate(lines) if i not in (7, 30, 31)])
+
+        report = catalyst.validate_jsonl(path, workers=1, range_size=100, only=['name'])
+        self.assertEqual(set(report.errors), {31})
+        self.assertEqual(report.outputs, [])
+
+        report = UserCatalyst(all_errors=False).validate_jsonl(path, range_size=100)
+        self.assertEqual(set(report.errors), {8})
+
+        with open(path, 'wb') as fp:
+            fp.write(gzip.compress(b'{}'))
+        with self.assertRaises(ValueError):
+            catalyst.validate_jsonl(path)
+        open(path, 'w').close()
+        self.assertEqual(catalyst.validate_jsonl(path), (0, 0, {}, []))
@@ -0,0 +1,134 @@
+import gc
+import pickle
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import StringField, IntegerField, NestedField, ListField
+from catalyst.groups import CompareFields
+from catalyst.exceptions import ValidationError
+from catalyst.parallel import get_pool, shutdown_pools, tune_chunksize
+
+
+class ItemCatalyst(Catalyst):
+    name = StringField(max_length=3)
+    count = IntegerField(minimum=0)
+
+
+class OrderCatalyst(Catalyst):
+    number = IntegerField(load_required=True)
+    items = NestedField(ItemCatalyst(), many=True)
+    tags = ListField(StringField())
+    minimum = IntegerField(load_default=0)
+    maximum = IntegerField(load_default=10)
+    compare = CompareFields('minimum', '<=', 'maximum')
+
+    def post_load_many(self, data):
+        return data + ['post']
+
+
+def make_orders(n, invalid=()):
+    orders = []
+    for i in range(n):
+        order = {'number': str(i), 'items': [{'name': 'a', 'count': i}], 'tags': ['t']}
+        if i in invalid:
+            order['items'][0]['name'] = 'long'
+            order['minimum'] = 20
+        orders.append(order)
+    return orders
+
+
+class ParallelTest(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pools()
+
+    def assert_same_result(self, a, b):
+        self.assertEqual(a.valid_data, b.valid_data)
+        self.assertEqual(a.invalid_data, b.invalid_data)
+        self.assertEqual(a.format_errors(), b.format_errors())
+
+    def test_pickle(self):
+        for compiled in (False, True):
+            catalyst = OrderCatalyst(compiled=compiled)
+            catalyst.dump({'number': 1}, only=['number'])
+            copied = pickle.loads(pickle.dumps(catalyst))
+            for data in make_orders(3, invalid=[1]):
+                self.assert_same_result(catalyst.load(data), copied.load(data))
+
+        error = pickle.loads(pickle.dumps(ValidationError('msg', {'a': 1})))
+        self.assertEqual((error.msg, error.detail), ('msg', {'a': 1}))
+
+    def test_process_many(self):
+        catalyst = OrderCatalyst()
+        for all_errors in (True, False):
+            catalyst = OrderCatalyst(all_errors=all_errors)
+            for n, invalid in [(0, ()), (5, ()), (100, (3, 40, 99)), (100, (50, 51))]:
+                data = make_orders(n, invalid)
+                expected = catalyst.load_many(data)
+                for chunksize in (None, 7):
+                    result = catalyst.load_many(
+                        iter(data), executor='process', workers=2, chunksize=chunksize)
+                    self.assert_same_result(expected, result)
+                result = catalyst.dump_many(data, executor='process', workers=2)
+                self.assert_same_result(catalyst.dump_many(data), result)
+
+        # pool is reused
+        self.assertIs(get_pool(catalyst, 2), get_pool(catalyst, 2))
+
+        data = make_orders(10)
+        result = catalyst.load_many(
+            data, only=['number', 'items.count'], executor='process', workers=2, chunksize=3)
+        self.assertEqual(result.valid_data[2], {'number': 2, 'items': [{'count': 2}]})
+        self.assertEqual(result.valid_data[-1], 'post')
+
+        # rows with columns
+        rows = [(str(i), i % 5) for i in range(20)]
+        expected = catalyst.load_many(rows, columns=['number', 'minimum'])
+        self.assertEqual(expected.valid_data[1], {'number': 1, 'minimum': 1, 'maximum': 10})
+        result = catalyst.load_many(
+            rows, columns=['number', 'minimum'], executor='process', workers=2, chunksize=3)
+        self.assert_same_result(expected, result)
+
+        result = catalyst.load_many(1, executor='process', workers=2)
+        self.assertEqual(set(result.errors), {'load_many'})
+        with self.assertRaises(ValidationError):
+            catalyst.load_many(make_orders(3, [1]), raise_error=True, executor='process')
+        with self.assertRaises(ValueError):
+            catalyst.load_many(data, executor='unknown')
+
+    def test_shutdown_with_catalyst(self):
+        catalyst = OrderCatalyst()
+        data = make_orders(20)
+        result = catalyst.load_many(data, executor='process', workers=2, chunksize=5)
+        self.assertEqual(len(result.valid_data), 21)
+        processes = list(get_pool(catalyst, 2)._processes.values())
+        self.assertEqual(len(processes), 2)
+
+        # the pool doesn't keep the catalyst alive, and is shut down with it
+        del catalyst
+        gc.collect()
+        for process in processes:
+            process.join(timeout=10)
+            self.assertFalse(process.is_alive())
+
+    def test_thread_executor(self):
+        catalyst = OrderCatalyst(compiled=True)
+        data = make_orders(200, invalid=(10, 150))
+        for chunksize in (None, 9):
+            result = catalyst.load_many(
+                data, executor='thread', workers=3, chunksize=chunksize)
+            self.assert_same_result(catalyst.load_many(data), result)
+        self.assertIs(get_pool(catalyst, 3, 'thread'), get_pool(OrderCatalyst(), 3, 'thread'))
+
+        catalyst = OrderCatalyst(all_errors=False)
+        result = catalyst.dump_many(data, executor='thread', workers=3, chunksize=9)
+        self.assert_same_result(catalyst.dump_many(data), result)
+        result = catalyst.load_many(data, executor='thread', workers=3, chunksize=9)
+        self.assertEqual(set(result.errors), {10})
+        self.assert_same_result(catalyst.load_many(data), result)
+
+    def test_tune_chunksize(self):
+        self.assertEqual(tune_chunksize(0.001, 10000, 2), 50)
+        self.assertEqual(tune_chunksize(0.001, 100, 2), 13)
+        self.assertEqual(tune_chunksize(0, 100, 1), 25)
+        self.assertEqual(tune_chunksize(1, 100, 1), 1)
@@ -0,0 +1,96 @@
+import sqlite3
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import IntegerField, StringField, FloatField
+from catalyst.exceptions import ValidationError
+from catalyst.formats.rows import RowWriter, executemany
+
+
+class Product:
+    def __init__(self, id, name, price=None):
+        self.id = id
+        self.name = name
+        self.price = price
+
+
+class ProductCatalyst(Catalyst):
+    id = IntegerField()
+    name = StringField(key='title')
+    price = FloatField(dump_required=False)
+
+
+PRODUCTS = [Product(1, 'a', 1.5), Product(2, 'b'), Product(3, 'c', 3)]
+
+
+class RowsTest(TestCase):
+    def test_dump_rows(self):
+        for compiled in (False, True):
+            catalyst = ProductCatalyst(compiled=compiled)
+            self.assertEqual(list(catalyst.dump_rows(PRODUCTS)), [
+                (1, 'a', 1.5), (2, 'b', None), (3, 'c', 3.0)])
+            self.assertEqual(list(catalyst.dump_rows(iter(PRODUCTS), columns=['title', 'id'])), [
+                ('a', 1), ('b', 2), ('c', 3)])
+            self.assertEqual(list(catalyst.dump_rows(PRODUCTS, columns=['id'])), [
+                (1,), (2,), (3,)])
+            self.assertEqual(list(catalyst.dump_rows(PRODUCTS, only=['id'])), [
+                (1,), (2,), (3,)])
+
+            rows = catalyst.dump_rows(PRODUCTS + [Product('x', 'd')])
+            self.assertEqual(next(rows), (1, 'a', 1.5))
+            with self.assertRaises(ValidationError) as cm:
+                list(rows)
+            self.assertEqual(set(cm.exception.detail.errors), {3})
+            self.assertEqual(list(catalyst.dump_rows(PRODUCTS[:1], columns=['id', 'x'])), [
+                (1, None)])
+
+    def test_errors(self):
+        invalid = Product('x', 'a', 'y')
+        for compiled in (False, True):
+            for all_errors in (True, False):
+                catalyst = ProductCatalyst(compiled=compiled, all_errors=all_errors)
+                expected = catalyst.dump(invalid)
+                with self.assertRaises(ValidationError) as cm:
+                    list(catalyst.dump_rows([PRODUCTS[0], invalid]))
+                detail = cm.exception.detail
+                self.assertEqual(detail.valid_data, [expected.valid_data])
+                self.assertEqual(set(detail.errors), {1})
+                self.assertEqual(
+                    {k: str(v) for k, v in detail.errors[1].items()},
+                    {k: str(v) for k, v in expected.errors.items()})
+                self.assertEqual(detail.invalid_data, {1: expected.invalid_data})
+
+    def test_fall_back(self):
+        class Customized(ProductCatalyst):
+            def post_dump(self, data):
+                data['title'] = data['title'].upper()
+                return data
+
+        catalyst = Customized()
+        self.assertIsNone(catalyst._get_codec(RowWriter, None, None).plan)
+        self.assertEqual(list(catalyst.dump_rows(PRODUCTS[:2])), [
+            (1, 'A', 1.5), (2, 'B', None)])
+
+    def test_executemany(self):
+        connection = sqlite3.connect(':memory:')
+        self.addCleanup(connection.close)
+        connection.execute('CREATE TABLE product (id INTEGER, title TEXT, price REAL)')
+        catalyst = ProductCatalyst()
+
+        products = [Product(i, str(i), i / 2) for i in range(25)]
+        count = executemany(
+            connection, 'INSERT INTO product (title, id, price) VALUES (?, ?, ?)',
+            catalyst.dump_rows(products, columns=['title', 'id', 'price']), batch_size=10)
+        self.assertEqual(count, 25)
+        cursor = connection.execute('SELECT id, title, price FROM product ORDER BY id')
+        self.assertEqual(catalyst.load_many(cursor, columns=cursor.description).valid_data,
+                         [vars(product) for product in products])
+
+        # the rows before the invalid object are inserted
+        with self.assertRaises(ValidationError):
+            executemany(
+                connection, 'INSERT INTO product VALUES (?, ?, ?)',
+                catalyst.dump_rows(PRODUCTS[:1] * 3 + [Product('x', 'y')]), batch_size=2)
+        self.assertEqual(connection.execute('SELECT COUNT(*) FROM product').fetchone(), (27,))
+        with self.assertRaises(ValueError):
+            executemany(connection, '', [], batch_size=0)
@@ -0,0 +1,199 @@
+import multiprocessing
+import os
+import pickle
+import socket
+import tempfile
+import threading
+from unittest import TestCase, skipIf
+
+from catalyst.core import Catalyst
+from catalyst.fields import IntegerField, StringField
+from catalyst.exceptions import ValidationError
+from catalyst.serve import ValidationClient, ValidationServer, import_catalyst, split_result
+
+
+class UserCatalyst(Catalyst):
+    id = IntegerField(minimum=0)
+    name = StringField(max_length=3)
+
+
+class HookCatalyst(UserCatalyst):
+    all_errors = False
+
+    def post_load_many(self, data, original_data=None):
+        return data + ['post']
+
+
+class StrictCatalyst(Catalyst):
+    # the error raised by loading a list as an integer is not collected
+    except_exception = ValueError
+    id = IntegerField()
+
+
+class LockCatalyst(Catalyst):
+    # the result can't be pickled
+    lock = IntegerField(formatter=lambda value: threading.Lock() if value < 0 else value)
+
+
+class NotCatalyst:
+    instances = 0
+
+    def __init__(self):
+        NotCatalyst.instances += 1
+
+
+user_catalyst = UserCatalyst()
+
+USER = 'tests.test_serve:UserCatalyst'
+HOOK = 'tests.test_serve.HookCatalyst'
+STRICT = 'tests.test_serve:StrictCatalyst'
+LOCK = 'tests.test_serve:LockCatalyst'
+
+
+@skipIf(not hasattr(socket, 'AF_UNIX'), 'Unix domain socket is not supported.')
+class ServeTest(TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.address = os.path.join(tmpdir.name, 'catalyst.sock')
+
+    def test_import_catalyst(self):
+        self.assertIsInstance(import_catalyst(USER), UserCatalyst)
+        self.assertIs(import_catalyst('tests.test_serve:user_catalyst'), user_catalyst)
+        with self.assertRaises(TypeError):
+            import_catalyst('tests.test_serve:USER')
+        # other classes are not instantiated
+        with self.assertRaises(TypeError):
+            import_catalyst('tests.test_serve:NotCatalyst')
+        self.assertEqual(NotCatalyst.instances, 0)
+        with self.assertRaises(ValueError):
+            import_catalyst('catalyst')
+
+    def test_split_result(self):
+        result = ([{'a': 1}, {}, {'a': 3}, {}], {1: 'e1', 3: 'e3'}, {1: 'x', 3: 'y'})
+        self.assertEqual(split_result(result, 1, 1, False, True), ({}, 'e1', 'x'))
+        self.assertEqual(
+            split_result(result, 1, 3, True, True),
+            ([{}, {'a': 3}, {}], {0: 'e1', 2: 'e3'}, {0: 'x', 2: 'y'}))
+        self.assertEqual(
+            split_result(result, 0, 4, True, False), ([{'a': 1}, {}], {1: 'e1'}, {1: 'x'}))
+
+    def test_requests(self):
+        with ValidationServer(self.address, [USER]) as server, \
+                ValidationClient(self.address) as client:
+            self.assertEqual(os.stat(self.address).st_mode & 0o777, 0o600)
+            catalyst = UserCatalyst()
+            data = [{'id': '1', 'name': 'a'}, {'id': '-1', 'name': 'long'}, {'id': 2}]
+            for method in ('load', 'dump'):
+                expected = getattr(catalyst, method)(data[0])
+                result = getattr(client, method)(USER, data[0])
+                self.assertEqual(result.valid_data, expected.valid_data)
+            result = client.load(USER, data[1])
+            self.assertEqual(result.format_errors(), catalyst.load(data[1]).format_errors())
+            with self.assertRaises(ValidationError):
+                client.load(USER, data[1], raise_error=True)
+
+            result = client.load_many(USER, iter(data))
+            expected = catalyst.load_many(data)
+            self.assertEqual(result.valid_data, expected.valid_data)
+            self.assertEqual(result.format_errors(), expected.format_errors())
+
+            # catalysts are imported on first request, and processes are customized
+            result = client.load_many(HOOK, data)
+            expected = HookCatalyst().load_many(data)
+            self.assertEqual(result.valid_data, expected.valid_data)
+            self.assertEqual(result.format_errors(), expected.format_errors())
+
+            with self.assertRaises(ModuleNotFoundError):
+                client.load('unknown.module:Catalyst', {})
+            with self.assertRaises(ValueError):
+                client.request(USER, 'validate', {})
+            self.assertEqual(server.stats['requests'], 8)
+
+            # the error of pickling is sent back, and the batcher keeps running
+            with self.assertRaises(TypeError):
+                client.dump(LOCK, {'lock': -1})
+            self.assertEqual(client.dump(LOCK, {'lock': 1}).valid_data, {'lock': 1})
+
+            # the client is reconnected after pickling
+            copied = pickle.loads(pickle.dumps(client))
+            self.assertEqual(copied.load(USER, data[0]).valid_data, {'id': 1, 'name': 'a'})
+            copied.close()
+
+    @skipIf(not hasattr(os, 'fork'), 'Fork is not supported.')
+    def test_fork(self):
+        with ValidationServer(self.address, [USER]), ValidationClient(self.address) as client:
+            self.assertEqual(client.load(USER, {'id': '0'}).valid_data, {'id': 0})
+            conn = client._conn
+
+            def request(queue):
+                # the connection of the parent is not used by the child
+                queue.put([client.load(USER, {'id': str(i)}).valid_data for i in range(20)])
+
+            context = multiprocessing.get_context('fork')
+            queue = context.Queue()
+            process = context.Process(target=request, args=(queue,))
+            process.start()
+            results = [client.load(USER, {'id': str(100 + i)}).valid_data for i in range(20)]
+            self.assertEqual(queue.get(timeout=10), [{'id': i} for i in range(20)])
+            process.join()
+            self.assertEqual(results, [{'id': 100 + i} for i in range(20)])
+            self.assertIs(client._conn, conn)
+
+    def test_batching(self):
+        server = ValidationServer(self.address, [USER], batch_window=0.2, max_batch_size=100)
+        with server:
+            results = {}
+
+            def request(i):
+                with ValidationClient(self.address) as client:
+                    if i % 2:
+                        results[i] = client.load(USER, {'id': str(i)})
+                    else:
+                        results[i] = client.load_many(USER, [{'id': str(i)}, {'id': '-1'}])
+
+            threads = [threading.Thread(target=request, args=(i,)) for i in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertLess(server.stats['batches'], 10)
+
+        for i, result in results.items():
+            if i % 2:
+                self.assertEqual(result.valid_data, {'id': i})
+            else:
+                self.assertEqual(result.valid_data, [{'id': i}, {}])
+                self.assertEqual(set(result.errors), {1})
+
+        # the error which is not collected only fails its own request
+        server = ValidationServer(self.address, [STRICT], batch_window=0.5)
+        with server:
+            barrier = threading.Barrier(2)
+            results = {}
+
+            def request(name, data):
+                with ValidationClient(self.address) as client:
+                    barrier.wait()
+                    try:
+                        results[name] = client.load(STRICT, data)
+                    except TypeError as e:
+                        results[name] = e
+
+            threads = [
+                threading.Thread(target=request, args=('good', {'id': '1'})),
+                threading.Thread(target=request, args=('bad', {'id': [1]}))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(server.stats['batches'], 1)
+        self.assertEqual(results['good'].valid_data, {'id': 1})
+        self.assertIsInstance(results['bad'], TypeError)
+
+        # authentication
+        with ValidationServer(self.address, authkey=b'secret'):
+            with ValidationClient(self.address, authkey=b'secret') as client:
+                self.assertEqual(client.load(USER, {'id': 1}).valid_data, {'id': 1})
+            with self.assertRaises(Exception):
+                ValidationClient(self.address, authkey=b'wrong').load(USER, {'id': 1})
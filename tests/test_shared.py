@@ -0,0 +1,151 @@
+import datetime
+import pickle
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import (
+    BooleanField, DateField, DatetimeField, DecimalField, FloatField, IntegerField,
+    StringField,
+)
+from catalyst.parallel import shutdown_pools
+from catalyst.shared import share_result
+
+
+class ReadingCatalyst(Catalyst):
+    id = IntegerField(minimum=0)
+    value = FloatField(allow_none=True)
+    ok = BooleanField()
+    day = DateField()
+    time = DatetimeField(fmt='%Y-%m-%d %H:%M:%S%z')
+    name = StringField(dump_required=False)
+    price = DecimalField(dump_required=False)
+
+
+def make_readings(n, invalid=()):
+    readings = []
+    for i in range(n):
+        reading = {
+            'id': -1 if i in invalid else i,
+            'value': None if i % 3 == 0 else i / 4,
+            'ok': i % 2 == 0,
+            'day': '2020-01-%02d' % (i % 28 + 1),
+            'time': '2020-01-01 00:00:%02d+0800' % (i % 60),
+        }
+        if i % 2:
+            reading['name'] = str(i)
+        readings.append(reading)
+    return readings
+
+
+class FixedZone(datetime.tzinfo):
+    def utcoffset(self, dt):
+        return datetime.timedelta(hours=8)
+
+    def tzname(self, dt):
+        return 'Fixed'
+
+    def dst(self, dt):
+        return None
+
+    def __reduce__(self):
+        return FixedZone, ()
+
+
+class SharedTest(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pools()
+
+    def test_share_result(self):
+        catalyst = ReadingCatalyst()
+        result = catalyst.load_many(make_readings(10, invalid=[4]) + [None])
+        shared = pickle.loads(pickle.dumps(share_result(catalyst, 'load', result)))
+        self.assertEqual(
+            [kind for _, kind, *_ in shared.layout],
+            ['int', 'float', 'bool', 'date', 'datetime', None, None])
+
+        with shared:
+            rebuilt = shared.to_result()
+            self.assertEqual(rebuilt.valid_data, result.valid_data)
+            self.assertEqual([list(row) for row in rebuilt.valid_data],
+                             [list(row) for row in result.valid_data])
+            self.assertEqual(rebuilt.format_errors(), result.format_errors())
+            self.assertEqual(rebuilt.invalid_data, result.invalid_data)
+
+            columns = shared.columns()
+            self.assertEqual(columns['id'].values[:4].tolist(), [0, 1, 2, 3])
+            self.assertEqual(columns['value'].valid[:4].tolist(), [False, True, True, False])
+            self.assertEqual(columns['ok'].values.format, '?')
+            self.assertEqual(columns['day'].values[0], 0 + 18262)
+            # microseconds since the epoch in UTC
+            self.assertEqual(columns['time'].values[1], (1577836800 - 8 * 3600 + 1) * 1000000)
+            self.assertEqual(columns['name'].values[:2], [None, '1'])
+            for column in columns.values():
+                for view in column:
+                    if isinstance(view, memoryview):
+                        view.release()
+            del columns
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(shared.name or 'removed')
+
+        # the values which don't fit the columns are pickled
+        objects = ReadingCatalyst().load_many(make_readings(3)).valid_data
+        catalyst = ReadingCatalyst(dump_required=False)
+        result = catalyst.dump_many(objects)
+        self.assertTrue(result.is_valid)
+        with share_result(catalyst, 'dump', result) as shared:
+            self.assertEqual(
+                [kind for _, kind, *_ in shared.layout][:5],
+                ['int', 'float', 'bool', None, None])
+            self.assertEqual(shared.to_result().valid_data, result.valid_data)
+
+        with share_result(catalyst, 'dump', ([], {}, {})) as shared:
+            self.assertIsNone(shared.name)
+            self.assertEqual(shared.to_tuple(), ([], {}, {}))
+
+    def test_time_zones(self):
+        catalyst = ReadingCatalyst()
+        named = datetime.timezone(datetime.timedelta(hours=8), 'CST')
+        for tz in (datetime.timezone.utc, named, FixedZone()):
+            rows = [{'time': datetime.datetime(2020, 1, 1, i, tzinfo=tz)} for i in range(3)]
+            with share_result(catalyst, 'load', (rows, {}, {})) as shared:
+                # other time zones than `datetime.timezone` are pickled
+                kind = 'datetime' if isinstance(tz, datetime.timezone) else None
+                self.assertEqual(shared.layout[4][1], kind)
+                rebuilt = shared.to_tuple()[0]
+            self.assertEqual(rebuilt, rows)
+            self.assertEqual([row['time'].tzinfo for row in rebuilt], [tz] * 3)
+            self.assertEqual([row['time'].tzname() for row in rebuilt], [tz.tzname(None)] * 3)
+
+        # the names of time zones are different
+        unnamed = datetime.timezone(datetime.timedelta(hours=8))
+        rows = [{'time': datetime.datetime(2020, 1, 1, tzinfo=tz)} for tz in (named, unnamed)]
+        with share_result(catalyst, 'load', (rows, {}, {})) as shared:
+            self.assertIsNone(shared.layout[4][1])
+            self.assertEqual(
+                [row['time'].tzname() for row in shared.to_tuple()[0]], ['CST', 'UTC+08:00'])
+
+    def test_import(self):
+        # shared memory is imported on use, which requires Python 3.8
+        code = 'import sys, catalyst; print("multiprocessing.shared_memory" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.strip(), b'False')
+
+    def test_parallel(self):
+        data = make_readings(200, invalid=[150])
+        for all_errors in (True, False):
+            catalyst = ReadingCatalyst(all_errors=all_errors)
+            expected = catalyst.load_many(data)
+            result = catalyst.load_many(
+                data, executor='process', workers=2, chunksize=20, shared_memory=True)
+            self.assertEqual(result.valid_data, expected.valid_data)
+            self.assertEqual(result.format_errors(), expected.format_errors())
+
+        objects = ReadingCatalyst().load_many(make_readings(100)).valid_data
+        catalyst = ReadingCatalyst(dump_required=False)
+        result = catalyst.dump_many(
+            objects, executor='process', workers=2, chunksize=10, shared_memory=True)
+        self.assertEqual(result.valid_data, catalyst.dump_many(objects).valid_data)
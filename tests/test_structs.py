@@ -0,0 +1,143 @@
+import datetime
+import io
+import os
+import struct
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+from catalyst.core import Catalyst
+from catalyst.fields import (
+    BooleanField, DateField, DatetimeField, DecimalField, FloatField, IntegerField,
+    StringField, TimeField,
+)
+from catalyst.exceptions import ValidationError
+from catalyst.formats import structs
+
+
+class TelemetryCatalyst(Catalyst):
+    sensor = IntegerField(minimum=0)
+    time = DatetimeField()
+    value = DecimalField(places=2)
+    ok = BooleanField()
+
+
+FORMAT = '<HqiB'
+
+RECORDS = [
+    {'sensor': 1, 'time': datetime.datetime(2020, 1, 2, 3, 4, 5), 'value': Decimal('1.25'),
+     'ok': True},
+    {'sensor': 2, 'time': datetime.datetime(1969, 12, 31), 'value': Decimal('-3'),
+     'ok': False},
+]
+
+RAW = [(1, 1577934245, 125, 1), (2, -86400, -300, 0)]
+
+
+class StructTest(TestCase):
+    def test_dump_struct(self):
+        catalyst = TelemetryCatalyst()
+        data = catalyst.dump_struct(RECORDS, FORMAT)
+        self.assertIsInstance(data, bytearray)
+        self.assertEqual(list(struct.iter_unpack(FORMAT, data)), RAW)
+        self.assertEqual(catalyst.dump_struct(iter(RECORDS), FORMAT), data)
+        self.assertEqual(catalyst.dump_struct([], FORMAT), b'')
+
+        data = catalyst.dump_struct(RECORDS, '<Hq', columns=['sensor', 'time'])
+        self.assertEqual(list(struct.iter_unpack('<Hq', data)), [row[:2] for row in RAW])
+        self.assertEqual(catalyst.dump_struct(RECORDS, '<H', only=['sensor']), b'\x01\x00\x02\x00')
+
+        # more records than a block
+        records = RECORDS * (structs.BLOCK_SIZE + 1)
+        self.assertEqual(
+            catalyst.dump_struct(iter(records), FORMAT), catalyst.dump_struct(records, FORMAT))
+        fp = io.BytesIO()
+        self.assertIsNone(catalyst.dump_struct(records, FORMAT, fp))
+        self.assertEqual(fp.getvalue(), catalyst.dump_struct(records, FORMAT))
+
+        with self.assertRaises(ValidationError) as cm:
+            catalyst.dump_struct(RECORDS + [{'sensor': 'x'}], FORMAT)
+        self.assertEqual(set(cm.exception.detail.errors), {2})
+        # the values can't be packed
+        with self.assertRaises(ValidationError) as cm:
+            catalyst.dump_struct(RECORDS + [dict(RECORDS[0], sensor=70000)], FORMAT)
+        self.assertEqual(set(cm.exception.detail.errors), {2})
+        with self.assertRaises(ValueError):
+            catalyst.dump_struct(RECORDS, '<Hq')
+
+    def test_load_struct(self):
+        data = b''.join(struct.pack(FORMAT, *raw) for raw in RAW)
+        for compiled in (False, True):
+            catalyst = TelemetryCatalyst(compiled=compiled)
+            results = list(catalyst.load_struct(data, FORMAT))
+            self.assertEqual([i for i, _ in results], [0, 1])
+            self.assertEqual([result.valid_data for _, result in results], RECORDS)
+
+            ((i, result),) = catalyst.load_struct(data, FORMAT, chunk_size=10)
+            self.assertEqual(result.valid_data, RECORDS)
+            self.assertEqual(list(catalyst.load_struct(b'', FORMAT)), [])
+
+        # errors are keyed by indexes of records
+        catalyst = TelemetryCatalyst()
+        data = struct.pack('<' + 'hq' * 3, 1, 0, -1, 0, 2, 0)
+        results = list(catalyst.load_struct(
+            data, '<hq', chunk_size=2, columns=['sensor', 'time']))
+        self.assertEqual(set(results[0][1].errors), {1})
+        self.assertEqual(results[1][0], 2)
+        with self.assertRaises(ValidationError):
+            list(catalyst.load_struct(data, '<hq', columns=['sensor', 'time'], raise_error=True))
+
+        with self.assertRaises(ValueError):
+            list(catalyst.load_struct(data[:-1], '<hq', columns=['sensor', 'time']))
+
+    def test_files(self):
+        catalyst = TelemetryCatalyst()
+        records = RECORDS * 100
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'telemetry.bin')
+            catalyst.dump_struct(records, FORMAT, path)
+            ((_, result),) = catalyst.load_struct(path, FORMAT, chunk_size=1000)
+            self.assertEqual(result.valid_data, records)
+            with open(path, 'rb') as f:
+                ((_, result),) = catalyst.load_struct(f, FORMAT, chunk_size=1000)
+            self.assertEqual(result.valid_data, records)
+
+            # close the mapped file while loading
+            results = catalyst.load_struct(path, FORMAT)
+            self.assertEqual(next(results)[1].valid_data, RECORDS[0])
+            results.close()
+
+            path = os.path.join(tmpdir, 'empty.bin')
+            open(path, 'wb').close()
+            self.assertEqual(list(catalyst.load_struct(path, FORMAT)), [])
+
+        fp = io.BytesIO(catalyst.dump_struct(records, FORMAT))
+        ((_, result),) = catalyst.load_struct(fp, FORMAT, chunk_size=1000)
+        self.assertEqual(result.valid_data, records)
+
+    def test_converters(self):
+        class ReadingCatalyst(Catalyst):
+            name = StringField()
+            day = DateField()
+            at = TimeField(fmt='%H:%M:%S.%f')
+            time = DatetimeField(fmt='%Y-%m-%d %H:%M:%S.%f%z')
+            price = DecimalField()
+            level = FloatField()
+
+        catalyst = ReadingCatalyst()
+        obj = {
+            'name': 'ä',
+            'day': datetime.date(2021, 3, 4),
+            'at': datetime.time(1, 2, 3, 500000),
+            'time': datetime.datetime(
+                2021, 3, 4, 5, 6, 7, 250000,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=8))),
+            'price': Decimal('1.5'),
+            'level': 0.5,
+        }
+        fmt = '<8sidddf'
+        data = catalyst.dump_struct([obj], fmt)
+        self.assertEqual(struct.unpack(fmt, data)[:2], ('ä'.encode() + bytes(6), 18690))
+        ((_, result),) = catalyst.load_struct(data, fmt)
+        self.assertEqual(result.valid_data, dict(
+            obj, time=datetime.datetime(2021, 3, 3, 21, 6, 7, 250000)))
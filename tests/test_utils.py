@@ -1,10 +1,14 @@
+from collections import defaultdict, namedtuple, OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from unittest import TestCase
 from unittest.mock import patch
 
 from catalyst.exceptions import ValidationError
 from catalyst.utils import (
     snake_to_camel, ErrorMessageMixin, BaseResult,
-    missing
+    missing, ValuesGetter, RowGetter, assign_item_getter,
 )
 
 
@@ -71,3 +75,113 @@ class UtilsTest(TestCase):
 
     def test_others(self):
         self.assertEqual(str(missing), '<catalyst.missing>')
+
+    def test_values_getter(self):
+        class Obj:
+            b = 'class attr'
+
+            def __init__(self, **kwargs):
+                self.__dict__.update(kwargs)
+
+            @property
+            def c(self):
+                raise ValueError('c')
+
+        class Slots:
+            __slots__ = ('a', 'b')
+
+        @dataclass
+        class Data:
+            a: int
+            b: int = 2
+
+        Point = namedtuple('Point', ['a', 'b'])
+
+        getter = ValuesGetter(['a', 'b'])
+        slots = Slots()
+        slots.a = 1
+        cases = [
+            ({'a': 1, 'b': 2}, [1, 2]),
+            ({'a': 1}, [1, missing]),
+            (OrderedDict(a=1), [1, missing]),
+            (defaultdict(int, a=1), [1, missing]),
+            (MappingProxyType({'b': 2}), [missing, 2]),
+            (Obj(a=1), [1, 'class attr']),
+            (Obj(a=1, b=2), [1, 2]),
+            (slots, [1, missing]),
+            (Data(1), [1, 2]),
+            (Point(1, 2), [1, 2]),
+        ]
+        for obj, expected in cases:
+            # the second call uses cached strategy
+            for _ in range(2):
+                values, errors = getter(obj)
+                self.assertListEqual(list(values), expected)
+                self.assertIsNone(errors)
+        # defaultdict is not changed
+        self.assertEqual(cases[3][0], {'a': 1})
+
+        # collect errors
+        values, errors = ValuesGetter(['a', 'c'])(Obj(a=1))
+        self.assertListEqual(values, [1, missing])
+        self.assertEqual(set(errors), {'c'})
+        self.assertIsInstance(errors['c'], ValueError)
+
+        # each value is got once, though the others are missing
+        calls = []
+
+        class Counted(Obj):
+            @property
+            def a(self):
+                calls.append('a')
+                return 1
+
+        class CountedMapping(Mapping):
+            def __getitem__(self, key):
+                calls.append(key)
+                return {'a': 1}[key]
+
+            def __iter__(self):
+                return iter(['a'])
+
+            def __len__(self):
+                return 1
+
+        for obj in (Counted(), CountedMapping()):
+            calls.clear()
+            self.assertEqual(ValuesGetter(['a', 'x'])(obj), ([1, missing], None))
+            self.assertEqual(calls, ['a', 'x'] if isinstance(obj, Mapping) else ['a'])
+
+        # one or no names
+        self.assertEqual(ValuesGetter(['a'])({'a': 1}), ((1,), None))
+        self.assertEqual(ValuesGetter([])({'a': 1}), ((), None))
+
+        # only mapping is allowed
+        getter = ValuesGetter(['a'], assign_item_getter)
+        self.assertEqual(getter({'a': 1}), ((1,), None))
+        with self.assertRaises(TypeError):
+            getter(Obj(a=1))
+
+        # custom getter
+        getter = ValuesGetter(['a', 'b'], lambda obj: lambda o, name, default: name * 2)
+        self.assertEqual(getter(None), (['aa', 'bb'], None))
+
+    def test_row_getter(self):
+        getter = RowGetter(['a', 'b', 'c'], ['b', 'x', 'a', 'b'])
+        self.assertEqual(getter.positions, {'b': 0, 'x': 1, 'a': 2})
+        cases = [
+            ((1, 2, 3, 4), [3, 1, missing]),
+            ([1, 2, 3, 4, 5], [3, 1, missing]),
+            ([1, 2], [missing, 1, missing]),
+            ((), [missing, missing, missing]),
+        ]
+        for row, expected in cases:
+            values, errors = getter(row)
+            self.assertListEqual(list(values), expected)
+            self.assertIsNone(errors)
+        self.assertEqual(RowGetter(['a'], ['a'])(['v']), (('v',), None))
+        self.assertEqual(RowGetter(['a', 'b'], ['b', 'a'])((1, 2)), ((2, 1), None))
+
+        values, errors = getter(None)
+        self.assertListEqual(values, [missing, missing, missing])
+        self.assertEqual(set(errors), {'a', 'b'})